@@ -1,26 +1,50 @@
+import functools
 import logging
 import os
 import time
+from collections import OrderedDict
 
 from run_opt_engine import (
+    _apply_second_order_retry,
     _build_scf_retry_overrides,
     _format_scf_retry_overrides,
     _is_scf_converged,
     _merge_scf_config,
+    _retry_density_guess,
     _scf_retry_enabled,
     apply_density_fit_setting,
     apply_scf_checkpoint,
     apply_scf_settings,
     apply_solvent_model,
+    hessian_store_key,
     is_density_fit_gradient_einsum_error,
+    load_stored_hessian,
     normalize_xc_functional,
+    project_chkfile_density,
     select_ks_type,
 )
 from run_opt_dispersion import load_d3_calculator, parse_dispersion_settings
+from run_opt_metadata import compute_method_fingerprint
 from run_opt_resources import ensure_parent_dir, resolve_run_path
+from run_opt_result_cache import (
+    load_cached_result,
+    result_cache_enabled,
+    result_cache_key,
+    store_cached_result,
+)
 from run_opt_utils import extract_step_count, normalize_constraints
 
 
+SCF_SESSION_MODES = ("rebuild", "scanner")
+DEFAULT_RESULT_CACHE_SIZE = 8
+RESULT_CACHE_DECIMALS = 8
+# (name, minimum fmax/target ratio, conv_tol, direct_scf_tol, grids level)
+ADAPTIVE_PRECISION_TIERS = (
+    ("coarse", 20.0, 1e-6, 1e-10, 1),
+    ("medium", 4.0, 1e-7, 1e-11, 2),
+)
+
+
 def _build_atom_spec_from_ase(atoms):
     lines = []
     for symbol, (x, y, z) in zip(
@@ -32,6 +56,145 @@ def _build_atom_spec_from_ase(atoms):
     return "\n".join(lines)
 
 
+def _resolve_scf_warm_start_settings(optimizer_config):
+    config = optimizer_config or {}
+    enabled = config.get("scf_warm_start")
+    if enabled is None:
+        enabled = True
+    order = config.get("scf_extrapolation_order")
+    if order is None:
+        order = 0
+    if not isinstance(order, int) or isinstance(order, bool) or order < 0:
+        raise ValueError(
+            "ASE optimizer config 'scf_extrapolation_order' must be a non-negative integer."
+        )
+    return bool(enabled), order
+
+
+def _resolve_result_cache_size(optimizer_config):
+    size = (optimizer_config or {}).get("result_cache_size")
+    if size is None:
+        return DEFAULT_RESULT_CACHE_SIZE
+    if not isinstance(size, int) or isinstance(size, bool) or size < 0:
+        raise ValueError(
+            "ASE optimizer config 'result_cache_size' must be a non-negative integer."
+        )
+    return size
+
+
+def _geometry_cache_key(fingerprint, symbols, positions, decimals=RESULT_CACHE_DECIMALS):
+    import numpy as np
+
+    # Adding 0.0 folds -0.0 into 0.0 so mirrored zeros share a key.
+    rounded = np.round(np.asarray(positions, dtype=float), decimals) + 0.0
+    return (fingerprint, tuple(symbols), rounded.tobytes())
+
+
+def _select_precision_tier(force_max, target_fmax):
+    if force_max is None:
+        return ADAPTIVE_PRECISION_TIERS[0]
+    ratio = force_max / target_fmax
+    for tier in ADAPTIVE_PRECISION_TIERS:
+        if ratio >= tier[1]:
+            return tier
+    return None
+
+
+def _constrained_force_max(atoms, forces):
+    import numpy as np
+
+    # Match the optimizer's view of fmax, which excludes constrained components.
+    constrained = np.array(forces, copy=True)
+    for constraint in atoms.constraints:
+        constraint.adjust_forces(atoms, constrained)
+    return float(np.sqrt((constrained**2).sum(axis=1)).max())
+
+
+def _snapshot_precision(mf):
+    grids = getattr(mf, "grids", None)
+    return {
+        "conv_tol": mf.conv_tol,
+        "direct_scf_tol": mf.direct_scf_tol,
+        "grids_level": grids.level if grids is not None else None,
+    }
+
+
+def _apply_precision_tier(mf, tier, full_precision):
+    if tier is None:
+        applied = dict(full_precision)
+    else:
+        _, _, conv_tol, direct_scf_tol, grids_level = tier
+        # A tier only ever loosens the configured settings.
+        applied = {
+            "conv_tol": max(conv_tol, full_precision["conv_tol"]),
+            "direct_scf_tol": max(direct_scf_tol, full_precision["direct_scf_tol"]),
+            "grids_level": (
+                min(grids_level, full_precision["grids_level"])
+                if full_precision["grids_level"] is not None
+                else None
+            ),
+        }
+    mf.conv_tol = applied["conv_tol"]
+    mf.direct_scf_tol = applied["direct_scf_tol"]
+    grids = getattr(mf, "grids", None)
+    if grids is not None and grids.level != applied["grids_level"]:
+        grids.level = applied["grids_level"]
+        grids.reset()
+    return applied
+
+
+def _resolve_scf_session_mode(optimizer_config):
+    session = (optimizer_config or {}).get("scf_session")
+    if session is None:
+        return "rebuild"
+    normalized = str(session).strip().lower()
+    if normalized not in SCF_SESSION_MODES:
+        raise ValueError(
+            "Unsupported ASE optimizer scf_session '{value}'. Use rebuild or scanner.".format(
+                value=session
+            )
+        )
+    return normalized
+
+
+def _project_density_guess(overlap, mo_coeff, mo_occ):
+    import numpy as np
+
+    mo_coeff = np.asarray(mo_coeff)
+    mo_occ = np.asarray(mo_occ)
+    if mo_coeff.ndim == 3:
+        return np.stack(
+            [
+                _project_density_guess(overlap, mo_coeff[index], mo_occ[index])
+                for index in range(mo_coeff.shape[0])
+            ]
+        )
+    occupied = mo_occ > 0
+    coeff_occ = mo_coeff[:, occupied]
+    if coeff_occ.shape[1] == 0:
+        return np.zeros((mo_coeff.shape[0], mo_coeff.shape[0]))
+    # Re-orthonormalize the occupied orbitals in the metric of the new geometry.
+    metric = coeff_occ.T @ overlap @ coeff_occ
+    eigvals, eigvecs = np.linalg.eigh(metric)
+    inv_sqrt = (eigvecs / np.sqrt(eigvals)) @ eigvecs.T
+    coeff_occ = coeff_occ @ inv_sqrt
+    return (coeff_occ * mo_occ[occupied]) @ coeff_occ.T
+
+
+def _extrapolate_density_guess(history, order):
+    from math import comb
+
+    if order <= 0 or len(history) < order + 1:
+        return history[-1]
+    recent = history[-(order + 1):]
+    guess = None
+    for offset, dm in enumerate(reversed(recent)):
+        coefficient = (-1) ** offset * comb(order + 1, offset + 1)
+        term = coefficient * dm
+        guess = term if guess is None else guess + term
+    return guess
+
+
 def _build_pyscf_calculator(
     *,
     atoms,
@@ -51,6 +214,7 @@ def _build_pyscf_calculator(
     optimizer_config,
     optimization_mode,
     profiling_enabled=False,
+    guess_chkfile=None,
 ):
     import numpy as np
 
@@ -66,6 +230,27 @@ def _build_pyscf_calculator(
         optimizer_mode=optimization_mode,
         multiplicity=multiplicity,
     )
+    warm_start_enabled, extrapolation_order = _resolve_scf_warm_start_settings(
+        optimizer_config
+    )
+    scanner_enabled = _resolve_scf_session_mode(optimizer_config) == "scanner"
+    result_cache_size = _resolve_result_cache_size(optimizer_config)
+    persistent_cache = result_cache_enabled(scf_config)
+    adaptive_precision = bool(optimizer_config.get("adaptive_precision"))
+    target_fmax = optimizer_config.get("fmax", 0.05)
+    method_fingerprint = compute_method_fingerprint(
+        {
+            "basis": basis,
+            "xc": xc,
+            "ks_type": ks_type,
+            "charge": charge,
+            "spin": spin,
+            "scf": scf_config or {},
+            "solvent_model": solvent_model,
+            "solvent_name": solvent_name,
+            "solvent_eps": solvent_eps,
+        }
+    )
 
     def _scf_uses_density_fit(config):
         if not config:
@@ -105,7 +290,31 @@ def _build_pyscf_calculator(
                 "scf_cycles": 0,
                 "gradient_seconds": 0.0,
                 "gradient_calls": 0,
+                "scf_warm_starts": 0,
+                "scanner_calls": 0,
+                "scanner_fallbacks": 0,
+                "cache_hits": 0,
+                "cache_misses": 0,
             }
+            if persistent_cache:
+                self._profile["result_cache_hits"] = 0
+                self._profile["result_cache_misses"] = 0
+            if adaptive_precision:
+                self._profile["precision_rechecks"] = 0
+                self._profile["precision_steps"] = []
+            self._precision_tier = None
+            self._full_precision = None
+            self._applied_precision = None
+            self._last_force_max = None
+            self._logged_tier = None
+            self._result_cache = OrderedDict()
+            self._density_history = []
+            self._last_orbitals = None
+            self._cached_density = None
+            self._last_mf = None
+            self._last_point = None
+            self._guess_chkfile = guess_chkfile
+            self._reset_scanner()
 
         def _record_scf(self, mf, elapsed_seconds):
             if not self._profiling_enabled:
@@ -127,6 +336,230 @@ def _build_pyscf_calculator(
                 return None
             return dict(self._profile)
 
+        def _lookup_cached_result(self, key):
+            if result_cache_size <= 0:
+                return None
+            entry = self._result_cache.get(key)
+            if entry is None:
+                if self._profiling_enabled:
+                    self._profile["cache_misses"] += 1
+                return None
+            self._result_cache.move_to_end(key)
+            if self._profiling_enabled:
+                self._profile["cache_hits"] += 1
+            return entry
+
+        def _store_cached_result(self, key, energy, forces):
+            if result_cache_size <= 0:
+                return
+            self._result_cache[key] = {
+                "energy": energy,
+                "forces": np.array(forces, copy=True),
+                "orbitals": self._last_orbitals,
+                "point": self._last_point,
+            }
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > result_cache_size:
+                self._result_cache.popitem(last=False)
+
+        def _load_persistent_result(self, key, memory_key):
+            cached = load_cached_result(key)
+            if cached is None or cached["gradient"] is None:
+                if self._profiling_enabled:
+                    self._profile["result_cache_misses"] += 1
+                if cached is not None and warm_start_enabled:
+                    self._cached_density = cached["density"]
+                return False
+            if self._profiling_enabled:
+                self._profile["result_cache_hits"] += 1
+            forces = -np.asarray(cached["gradient"]) * (units.Hartree / units.Bohr)
+            self.results["energy"] = cached["energy"] * units.Hartree
+            self.results["forces"] = forces
+            self._last_point = {
+                "energy": cached["energy"],
+                "converged": True,
+                "cycles": cached["metadata"].get("cycles"),
+            }
+            if warm_start_enabled:
+                self._last_orbitals = None
+                self._density_history = []
+                self._cached_density = cached["density"]
+            self._store_cached_result(memory_key, self.results["energy"], forces)
+            return True
+
+        def _store_persistent_result(self, key, energy_hartree, grad):
+            mf = self._last_mf
+            if not _is_scf_converged(mf) or (
+                self._disable_density_fit and _scf_uses_density_fit(scf_config)
+            ):
+                return
+            store_cached_result(
+                key,
+                energy=energy_hartree,
+                converged=True,
+                gradient=grad,
+                density=mf.make_rdm1(),
+                metadata={"cycles": extract_step_count(mf)},
+            )
+
+        def get_final_point(self, atoms):
+            # Only a full-precision SCF at exactly these positions can stand in
+            # for a separate single-point calculation.
+            if self._last_point is None or self.check_state(atoms):
+                return None
+            if self._disable_density_fit and _scf_uses_density_fit(scf_config):
+                return None
+            return {**self._last_point, "dispersion": None}
+
+        def _store_density(self, mf):
+            if not warm_start_enabled:
+                return
+            mo_coeff = getattr(mf, "mo_coeff", None)
+            mo_occ = getattr(mf, "mo_occ", None)
+            if mo_coeff is None or mo_occ is None:
+                return
+            self._last_orbitals = (np.array(mo_coeff, copy=True), np.array(mo_occ, copy=True))
+            self._cached_density = None
+            self._density_history.append(np.asarray(mf.make_rdm1()))
+            del self._density_history[: -(extrapolation_order + 1)]
+
+        def _chkfile_density_guess(self, mol):
+            chkfile_path = self._guess_chkfile
+            self._guess_chkfile = None
+            return project_chkfile_density(mol, chkfile_path, ks_type)
+
+        def _density_guess(self, mol):
+            if self._last_orbitals is None and self._guess_chkfile:
+                return self._chkfile_density_guess(mol)
+            if not warm_start_enabled:
+                return None
+            if self._last_orbitals is None:
+                # After a result-cache hit the cached density is the freshest guess.
+                dm_cached = self._cached_density
+                if dm_cached is not None and dm_cached.shape[-1] == mol.nao_nr():
+                    return dm_cached
+                return None
+            mo_coeff, mo_occ = self._last_orbitals
+            if mo_coeff.shape[-2] != mol.nao_nr():
+                return None
+            overlap = mol.intor_symmetric("int1e_ovlp")
+            dm_guess = _project_density_guess(overlap, mo_coeff, mo_occ)
+            if extrapolation_order > 0:
+                dm_guess = dm_guess + (
+                    _extrapolate_density_guess(self._density_history, extrapolation_order)
+                    - self._density_history[-1]
+                )
+            return dm_guess
+
+        def _build_mf(self, mol, scf_settings, *, allow_density_fit):
+            if ks_type == "RKS":
+                mf = dft.RKS(mol)
+            else:
+                mf = dft.UKS(mol)
+            mf.xc = xc
+            density_fit_applied = False
+            if allow_density_fit:
+                mf, df_config = apply_density_fit_setting(mf, scf_settings)
+                density_fit_applied = bool(df_config.get("density_fit"))
+            if solvent_model:
+                mf = apply_solvent_model(mf, solvent_model, solvent_name, solvent_eps)
+            mf, _ = apply_scf_settings(mf, scf_settings, apply_density_fit=False)
+            if verbose:
+                mf.verbose = 4
+            if adaptive_precision:
+                self._full_precision = _snapshot_precision(mf)
+                self._applied_precision = _apply_precision_tier(
+                    mf, self._precision_tier, self._full_precision
+                )
+            return mf, density_fit_applied
+
+        def _reset_scanner(self):
+            self._grad_scanner = None
+            self._scanner_density_fit = False
+            self._scanner_mol = None
+
+        def _run_scanner_and_grad(self, mol, *, allow_density_fit):
+            base_config = scf_config or {}
+            dm0 = None
+            if self._grad_scanner is None:
+                mf, density_fit_applied = self._build_mf(
+                    mol, base_config, allow_density_fit=allow_density_fit
+                )
+                dm0, _ = apply_scf_checkpoint(mf, base_config, run_dir=run_dir)
+                self._grad_scanner = mf.nuc_grad_method().as_scanner()
+                self._scanner_density_fit = density_fit_applied
+            elif adaptive_precision:
+                self._applied_precision = _apply_precision_tier(
+                    self._grad_scanner.base, self._precision_tier, self._full_precision
+                )
+            dm_guess = self._density_guess(mol)
+            if dm_guess is not None:
+                dm0 = dm_guess
+                if self._profiling_enabled:
+                    self._profile["scf_warm_starts"] += 1
+            scf_start = time.perf_counter() if self._profiling_enabled else None
+            if dm0 is not None:
+                # The gradient scanner does not forward dm0 to its SCF scanner.
+                self._grad_scanner.reset(mol)
+                energy_hartree = self._grad_scanner.base(mol, dm0=dm0)
+                grad = self._grad_scanner.kernel()
+            else:
+                energy_hartree, grad = self._grad_scanner(mol)
+            mf = self._grad_scanner.base
+            if scf_start is not None:
+                self._record_scf(mf, time.perf_counter() - scf_start)
+                self._profile["scanner_calls"] += 1
+            self._scanner_mol = mol
+            self._last_mf = mf
+            if _is_scf_converged(mf):
+                self._store_density(mf)
+            return energy_hartree, grad, self._scanner_density_fit
+
+        def _run_session_or_rebuild(self, mol, *, allow_density_fit):
+            if scanner_enabled:
+                result = self._run_scanner_and_grad(
+                    mol, allow_density_fit=allow_density_fit
+                )
+                if _is_scf_converged(self._grad_scanner.base):
+                    return result
+                if not (_scf_retry_enabled() and _build_scf_retry_overrides(scf_config or {})):
+                    logging.warning(
+                        "SCF scanner did not converge; proceeding with last result."
+                    )
+                    return result
+                logging.warning(
+                    "SCF scanner did not converge; rebuilding SCF objects for retries."
+                )
+                if self._profiling_enabled:
+                    self._profile["scanner_fallbacks"] += 1
+                self._reset_scanner()
+            return self._run_scf_and_grad(mol, allow_density_fit=allow_density_fit)
+
+        def _build_mol(self, atoms):
+            if self._scanner_mol is not None:
+                return self._scanner_mol.set_geom_(
+                    atoms.get_positions(), unit="Angstrom", inplace=False
+                )
+            atom_spec = _build_atom_spec_from_ase(atoms)
+            try:
+                mol = gto.M(
+                    atom=atom_spec,
+                    basis=basis,
+                    charge=charge,
+                    spin=spin,
+                    unit="Angstrom",
+                )
+            except FileNotFoundError as exc:
+                if "pople-basis" in str(exc):
+                    raise FileNotFoundError(
+                        f"{exc}\nMissing PySCF basis data. Run: "
+                        f"python scripts/restore_pyscf_basis.py --basis {basis}"
+                    ) from exc
+                raise
+            if memory_mb:
+                mol.max_memory = memory_mb
+            return mol
+
         def _run_scf_and_grad(self, mol, *, allow_density_fit):
             base_config = scf_config or {}
             retry_overrides = (
@@ -137,26 +570,15 @@ def _build_pyscf_calculator(
                 for overrides in retry_overrides
             ]
 
-            def _build_mf(scf_settings):
-                if ks_type == "RKS":
-                    mf = dft.RKS(mol)
-                else:
-                    mf = dft.UKS(mol)
-                mf.xc = xc
-                density_fit_applied = False
-                if allow_density_fit:
-                    mf, df_config = apply_density_fit_setting(mf, scf_settings)
-                    density_fit_applied = bool(df_config.get("density_fit"))
-                if solvent_model:
-                    mf = apply_solvent_model(mf, solvent_model, solvent_name, solvent_eps)
-                mf, _ = apply_scf_settings(mf, scf_settings, apply_density_fit=False)
-                if verbose:
-                    mf.verbose = 4
-                return mf, density_fit_applied
-
-            def _run_kernel(mf, scf_settings):
+            dm_guess = self._density_guess(mol)
+
+            def _run_kernel(mf, scf_settings, dm_guess):
                 scf_start = time.perf_counter() if self._profiling_enabled else None
                 dm0, _ = apply_scf_checkpoint(mf, scf_settings, run_dir=run_dir)
+                if dm_guess is not None:
+                    dm0 = dm_guess
+                    if self._profiling_enabled:
+                        self._profile["scf_warm_starts"] += 1
                 if dm0 is not None:
                     energy_value = mf.kernel(dm0=dm0)
                 else:
@@ -174,14 +596,22 @@ def _build_pyscf_calculator(
                         "SCF did not converge; retrying with SCF settings (%s).",
                         _format_scf_retry_overrides(overrides or {}),
                     )
-                mf, density_fit_applied = _build_mf(scf_settings)
-                energy_hartree = _run_kernel(mf, scf_settings)
+                mf, density_fit_applied = self._build_mf(
+                    mol, scf_settings, allow_density_fit=allow_density_fit
+                )
+                mf = _apply_second_order_retry(mf, scf_settings)
+                retry_guess = _retry_density_guess(last_mf) if last_mf is not None else None
+                if retry_guess is not None:
+                    dm_guess = retry_guess
+                energy_hartree = _run_kernel(mf, scf_settings, dm_guess)
                 last_energy = energy_hartree
                 last_mf = mf
+                self._last_mf = mf
                 last_density_fit = density_fit_applied
                 if _is_scf_converged(mf):
                     if attempt_index > 0:
                         logging.info("SCF converged after retry %s.", attempt_index)
+                    self._store_density(mf)
                     grad_start = time.perf_counter() if self._profiling_enabled else None
                     grad = mf.nuc_grad_method().kernel()
                     if grad_start is not None:
@@ -199,33 +629,35 @@ def _build_pyscf_calculator(
                 self._record_gradient(time.perf_counter() - grad_start)
             return last_energy, grad, last_density_fit
 
-
-        def calculate(self, atoms=None, properties=None, system_changes=all_changes):
-            super().calculate(atoms, properties, system_changes)
-            atom_spec = _build_atom_spec_from_ase(atoms)
-            try:
-                mol = gto.M(
-                    atom=atom_spec,
-                    basis=basis,
-                    charge=charge,
-                    spin=spin,
-                    unit="Angstrom",
+        def _record_precision(self, force_max, rechecked):
+            tier_name = self._precision_tier[0] if self._precision_tier else "full"
+            if tier_name != self._logged_tier:
+                logging.info(
+                    "SCF precision tier '%s' (fmax=%.4f eV/A, target %.4f).",
+                    tier_name,
+                    force_max,
+                    target_fmax,
                 )
-            except FileNotFoundError as exc:
-                if "pople-basis" in str(exc):
-                    raise FileNotFoundError(
-                        f"{exc}\nMissing PySCF basis data. Run: "
-                        f"python scripts/restore_pyscf_basis.py --basis {basis}"
-                    ) from exc
-                raise
-            if memory_mb:
-                mol.max_memory = memory_mb
+                self._logged_tier = tier_name
+            if not self._profiling_enabled:
+                return
+            self._profile["precision_steps"].append(
+                {
+                    "tier": tier_name,
+                    "fmax": force_max,
+                    **(self._applied_precision or {}),
+                }
+            )
+            if rechecked:
+                self._profile["precision_rechecks"] += 1
+
+        def _evaluate(self, mol):
             density_fit_applied = False
             expected_density_fit = (not self._disable_density_fit) and _scf_uses_density_fit(
                 scf_config
             )
             try:
-                energy_hartree, grad, density_fit_applied = self._run_scf_and_grad(
+                energy_hartree, grad, density_fit_applied = self._run_session_or_rebuild(
                     mol, allow_density_fit=not self._disable_density_fit
                 )
             except Exception as exc:
@@ -238,22 +670,97 @@ def _build_pyscf_calculator(
                         "Density-fitting gradients failed; retrying without density fitting."
                     )
                     self._disable_density_fit = True
-                    energy_hartree, grad, _ = self._run_scf_and_grad(
+                    self._reset_scanner()
+                    energy_hartree, grad, _ = self._run_session_or_rebuild(
                         mol, allow_density_fit=False
                     )
                 else:
                     raise
+            return energy_hartree, grad
+
+        def calculate(self, atoms=None, properties=None, system_changes=all_changes):
+            super().calculate(atoms, properties, system_changes)
+            cache_key = _geometry_cache_key(
+                method_fingerprint,
+                atoms.get_chemical_symbols(),
+                atoms.get_positions(),
+            )
+            cached = self._lookup_cached_result(cache_key)
+            if cached is not None:
+                if cached["orbitals"] is not None:
+                    self._last_orbitals = cached["orbitals"]
+                self._last_point = cached["point"]
+                self.results["energy"] = cached["energy"]
+                self.results["forces"] = np.array(cached["forces"], copy=True)
+                return
+            persistent_key = None
+            if persistent_cache:
+                persistent_key = result_cache_key(
+                    atoms.get_chemical_symbols(),
+                    atoms.get_positions(),
+                    basis=basis,
+                    xc=xc,
+                    scf_config=scf_config,
+                    solvent_model=solvent_model,
+                    solvent_name=solvent_name,
+                    solvent_eps=solvent_eps,
+                    charge=charge,
+                    spin=spin,
+                    ks_type=ks_type,
+                )
+                if self._load_persistent_result(persistent_key, cache_key):
+                    return
+            mol = self._build_mol(atoms)
+            if adaptive_precision:
+                self._precision_tier = _select_precision_tier(
+                    self._last_force_max, target_fmax
+                )
+            energy_hartree, grad = self._evaluate(mol)
             forces = -grad * (units.Hartree / units.Bohr)
+            rechecked = False
+            if adaptive_precision:
+                force_max = _constrained_force_max(atoms, forces)
+                if (
+                    self._precision_tier is not None
+                    and _select_precision_tier(force_max, target_fmax) is None
+                ):
+                    # Close to convergence: never hand the optimizer a loosened result.
+                    self._precision_tier = None
+                    energy_hartree, grad = self._evaluate(mol)
+                    forces = -grad * (units.Hartree / units.Bohr)
+                    force_max = _constrained_force_max(atoms, forces)
+                    rechecked = True
+                self._last_force_max = force_max
+                self._record_precision(force_max, rechecked)
             self.results["energy"] = energy_hartree * units.Hartree
             self.results["forces"] = forces
+            self._last_point = None
+            if self._precision_tier is None:
+                self._last_point = {
+                    "energy": float(energy_hartree),
+                    "converged": _is_scf_converged(self._last_mf),
+                    "cycles": extract_step_count(self._last_mf),
+                }
+                self._store_cached_result(cache_key, self.results["energy"], forces)
+                if persistent_key:
+                    self._store_persistent_result(persistent_key, energy_hartree, grad)
 
     class _SumCalculator(Calculator):
         implemented_properties = ["energy", "forces"]
 
-        def __init__(self, calculators, **kwargs):
+        def __init__(self, calculators, concurrent=False, dispersion_backend=None, **kwargs):
             super().__init__(**kwargs)
             self.calculators = calculators
+            self.concurrent = concurrent
+            self.dispersion_backend = dispersion_backend
+            self._dispersion_energy = 0.0
             self._profile_source = calculators[0] if calculators else None
+            self._part_profile = {
+                "dispersion_seconds": 0.0,
+                "dispersion_calls": 0,
+                "dispersion_concurrent": bool(concurrent),
+                "step_wall_seconds": 0.0,
+            }
 
         def get_profile(self):
             if self._profile_source is None:
@@ -261,20 +768,71 @@ def _build_pyscf_calculator(
             getter = getattr(self._profile_source, "get_profile", None)
             if getter is None:
                 return None
-            return getter()
+            profile = getter()
+            if profile is None:
+                return None
+            profile = dict(profile)
+            profile.update(self._part_profile)
+            return profile
+
+        def get_final_point(self, atoms):
+            getter = getattr(self._profile_source, "get_final_point", None)
+            if getter is None or self.check_state(atoms):
+                return None
+            point = getter(atoms)
+            if point is None:
+                return None
+            dispersion_hartree = self._dispersion_energy / units.Hartree
+            point["energy"] += dispersion_hartree
+            point["dispersion"] = {
+                "model": dispersion_model,
+                "energy_hartree": dispersion_hartree,
+                "energy_ev": self._dispersion_energy,
+                "backend": self.dispersion_backend,
+            }
+            return point
+
+        def _evaluate_part(self, calculator, atoms):
+            part_start = time.perf_counter() if profiling_enabled else None
+            energy = calculator.get_property("energy", atoms)
+            forces = calculator.get_property("forces", atoms)
+            elapsed = time.perf_counter() - part_start if part_start is not None else None
+            return energy, forces, elapsed
+
+        def _evaluate_parts(self, atoms):
+            if not self.concurrent or len(self.calculators) < 2:
+                return [self._evaluate_part(calculator, atoms) for calculator in self.calculators]
+            import concurrent.futures
+
+            # Dispersion runs in a worker thread on a private copy of the atoms while
+            # the SCF and gradient run here; both release the GIL in native code.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                futures = [
+                    executor.submit(self._evaluate_part, calculator, atoms.copy())
+                    for calculator in self.calculators[1:]
+                ]
+                base_part = self._evaluate_part(self.calculators[0], atoms)
+                return [base_part] + [future.result() for future in futures]
 
         def calculate(self, atoms=None, properties=None, system_changes=all_changes):
             super().calculate(atoms, properties, system_changes)
+            step_start = time.perf_counter() if profiling_enabled else None
             energy_total = 0.0
             forces_total = None
-            for calculator in self.calculators:
-                energy = calculator.get_property("energy", atoms)
-                forces = calculator.get_property("forces", atoms)
+            self._dispersion_energy = 0.0
+            for index, (energy, forces, elapsed) in enumerate(self._evaluate_parts(atoms)):
                 energy_total += energy
+                if index > 0:
+                    self._dispersion_energy += energy
                 if forces_total is None:
                     forces_total = np.array(forces, copy=True)
                 else:
                     forces_total += forces
+                if index > 0 and elapsed is not None:
+                    self._part_profile["dispersion_seconds"] += elapsed
+                    self._part_profile["dispersion_calls"] += 1
+            if step_start is not None:
+                self._part_profile["step_wall_seconds"] += time.perf_counter() - step_start
             self.results["energy"] = energy_total
             self.results["forces"] = forces_total
 
@@ -290,14 +848,115 @@ def _build_pyscf_calculator(
                     "Install `dftd3` (recommended)."
                 )
             dispersion_calc = d3_cls(atoms=atoms, **settings)
+            dispersion_backend = "dftd3"
         else:
             from dftd4.ase import DFTD4
 
             dispersion_calc = DFTD4(atoms=atoms, **settings)
-        return _SumCalculator([base_calc, dispersion_calc])
+            dispersion_backend = "ase-dftd4"
+        return _SumCalculator(
+            [base_calc, dispersion_calc],
+            concurrent=bool(optimizer_config.get("concurrent_dispersion")),
+            dispersion_backend=dispersion_backend,
+        )
     return base_calc
 
 
+def _hessian_to_ev(hessian, atom_count, label="Hessian"):
+    import numpy as np
+    from ase import units
+
+    hessian_array = np.asarray(hessian, dtype=float)
+    if hessian_array.ndim == 4:
+        natoms = hessian_array.shape[0]
+        if natoms != atom_count:
+            raise ValueError(f"{label} atom count does not match coordinates.")
+        hessian_array = hessian_array.transpose(0, 2, 1, 3).reshape(natoms * 3, natoms * 3)
+    elif hessian_array.ndim == 2:
+        expected = atom_count * 3
+        if hessian_array.shape != (expected, expected):
+            raise ValueError(f"{label} shape does not match coordinates.")
+    else:
+        raise ValueError(f"{label} must be a 2D or 4D array.")
+    return hessian_array * (units.Hartree / (units.Bohr ** 2))
+
+
+def _translation_rotation_basis(positions):
+    import numpy as np
+
+    positions = np.asarray(positions, dtype=float)
+    centered = positions - positions.mean(axis=0)
+    vectors = []
+    for axis in np.eye(3):
+        vectors.append(np.tile(axis, len(positions)))
+        vectors.append(np.cross(axis, centered).ravel())
+    left, singular, _ = np.linalg.svd(np.array(vectors).T, full_matrices=False)
+    return left[:, singular > 1e-6 * singular.max()]
+
+
+def _regularize_minimum_hessian(hessian_ev, positions, alpha=70.0, floor=1e-2):
+    import numpy as np
+
+    basis = _translation_rotation_basis(positions)
+    projector = basis @ basis.T
+    internal = np.eye(len(hessian_ev)) - projector
+    hessian = internal @ np.asarray(hessian_ev, dtype=float) @ internal
+    hessian = 0.5 * (hessian + hessian.T)
+    eigvals, eigvecs = np.linalg.eigh(hessian)
+    rigid_weight = np.einsum("ij,ij->j", eigvecs, projector @ eigvecs)
+    eigvals = np.maximum(np.abs(eigvals), floor)
+    # Rigid-body directions get ASE's default curvature instead of zero.
+    eigvals[rigid_weight > 0.5] = alpha
+    return (eigvecs * eigvals) @ eigvecs.T
+
+
+def _cartesian_model_hessian(atoms):
+    from ase_ric import (
+        build_redundant_internals,
+        internal_values_and_wilson_b,
+        lindh_model_hessian,
+    )
+
+    numbers = atoms.get_atomic_numbers()
+    positions = atoms.get_positions()
+    coordinates, _ = build_redundant_internals(numbers, positions)
+    _, b_matrix = internal_values_and_wilson_b(positions, coordinates)
+    return b_matrix.T @ lindh_model_hessian(numbers, positions, coordinates) @ b_matrix
+
+
+class _SellaHessianSeed:
+    # Sella calls hessian_function on every re-diagonalisation; the seed only describes
+    # the starting geometry, so after the first call Sella goes back to its own
+    # iterative diagonalisation and Hessian updates.
+    def __init__(self, hessian_ev):
+        self.hessian_ev = hessian_ev
+        self.pes = None
+        self.calls = 0
+
+    def __call__(self, _atoms):
+        self.calls += 1
+        if self.pes is not None and getattr(self.pes, "hessian_function", None) is self:
+            self.pes.hessian_function = None
+        return self.hessian_ev
+
+
+def _resolve_initial_hessian(optimizer_config, *, atoms, run_dir, initial_hessian=None):
+    import numpy as np
+
+    if initial_hessian is not None:
+        return _hessian_to_ev(initial_hessian, len(atoms), label="Initial Hessian")
+    source = (optimizer_config or {}).get("initial_hessian")
+    if source is None or str(source).strip().lower() in ("", "none"):
+        return None
+    if str(source).strip().lower() == "model":
+        return _cartesian_model_hessian(atoms)
+    hessian_path = resolve_run_path(run_dir, source) if run_dir else source
+    if not os.path.exists(hessian_path):
+        raise FileNotFoundError(f"Initial Hessian file not found: {hessian_path}")
+    logging.info("Loading initial Hessian from %s.", hessian_path)
+    return _hessian_to_ev(np.load(hessian_path), len(atoms), label="Initial Hessian")
+
+
 def _apply_constraints(atoms, constraints):
     from ase.constraints import FixAngle, FixBondLength, FixDihedral, FixInternals
 
@@ -358,11 +1017,15 @@ def _run_ase_optimizer(
     constraints,
     profiling_enabled=False,
     step_callback=None,
+    initial_hessian=None,
+    guess_chkfile=None,
 ):
     try:
         from ase.io import read as ase_read
         from ase.io import write as ase_write
         from ase.optimize import BFGS, FIRE, GPMin, LBFGS, MDMin
+
+        from ase_ric import RICBFGS
     except ImportError as exc:
         raise ImportError(
             "ASE optimizer requested but ASE or required calculators are not installed. "
@@ -388,6 +1051,7 @@ def _run_ase_optimizer(
         optimizer_config=optimizer_config,
         optimization_mode=optimization_mode,
         profiling_enabled=profiling_enabled,
+        guess_chkfile=guess_chkfile,
     )
     _apply_constraints(atoms, constraints)
 
@@ -404,6 +1068,12 @@ def _run_ase_optimizer(
     if logfile:
         logfile = resolve_run_path(run_dir, logfile)
         ensure_parent_dir(logfile)
+    hessian_ev = _resolve_initial_hessian(
+        optimizer_config,
+        atoms=atoms,
+        run_dir=run_dir,
+        initial_hessian=initial_hessian,
+    )
 
     if optimizer_name == "sella":
         import importlib.util
@@ -419,6 +1089,10 @@ def _run_ase_optimizer(
         if not isinstance(sella_config, dict):
             raise ValueError("ASE optimizer config 'sella' must be an object.")
         sella_kwargs = dict(sella_config)
+        hessian_seed = None
+        if hessian_ev is not None and "hessian_function" not in sella_kwargs:
+            hessian_seed = _SellaHessianSeed(hessian_ev)
+            sella_kwargs["hessian_function"] = hessian_seed
         order = sella_kwargs.pop("order", None)
         if order is None:
             order = 1 if optimization_mode == "transition_state" else 0
@@ -433,6 +1107,8 @@ def _run_ase_optimizer(
             logfile=logfile,
             **sella_kwargs,
         )
+        if hessian_seed is not None:
+            hessian_seed.pes = getattr(optimizer, "pes", None)
     else:
         if optimization_mode == "transition_state":
             raise ValueError(
@@ -445,8 +1121,12 @@ def _run_ase_optimizer(
             "fire": FIRE,
             "gpmin": GPMin,
             "mdmin": MDMin,
+            "ric-bfgs": functools.partial(
+                RICBFGS, constraints=constraints, hessian=hessian_ev
+            ),
         }
-        optimizer_cls = optimizer_map.get(optimizer_name)
+        optimizer_key = optimizer_name.replace("_", "-")
+        optimizer_cls = optimizer_map.get(optimizer_key)
         if optimizer_cls is None:
             raise ValueError(
                 "Unsupported ASE optimizer '{name}'. Supported: {supported}.".format(
@@ -455,6 +1135,16 @@ def _run_ase_optimizer(
                 )
             )
         optimizer = optimizer_cls(atoms, trajectory=trajectory, logfile=logfile)
+        if hessian_ev is not None:
+            if optimizer_key == "bfgs":
+                optimizer.H0 = _regularize_minimum_hessian(
+                    hessian_ev, atoms.get_positions()
+                )
+            elif optimizer_key != "ric-bfgs":
+                logging.warning(
+                    "Initial Hessian is not supported by the %s optimizer; ignoring it.",
+                    optimizer_name,
+                )
     if step_callback is not None:
         optimizer.attach(step_callback, interval=1)
     optimizer.run(fmax=fmax, steps=steps)
@@ -464,9 +1154,21 @@ def _run_ase_optimizer(
     profile_getter = getattr(atoms.calc, "get_profile", None)
     if profile_getter is not None:
         profile = profile_getter()
+    final_point = None
+    final_point_getter = getattr(atoms.calc, "get_final_point", None)
+    if final_point_getter is not None:
+        final_point = final_point_getter(atoms)
+    final_hessian = None
+    if optimizer_name == "bfgs" and getattr(optimizer, "H", None) is not None:
+        from ase import units
+
+        # Hartree/Bohr^2, the unit initial_hessian expects.
+        final_hessian = optimizer.H / (units.Hartree / units.Bohr**2)
     return {
         "n_steps": getattr(optimizer, "nsteps", None),
         "profiling": profile,
+        "final_point": final_point,
+        "final_hessian": final_hessian,
     }
 
 
@@ -540,20 +1242,34 @@ def _run_ase_irc(
     outputs = {}
     profile = []
     hessian_ev = None
+    if mode_hessian is None:
+        # Electronic Hessian written by an earlier frequency or mode calculation.
+        mode_hessian = load_stored_hessian(
+            run_dir,
+            hessian_store_key(
+                atoms.get_chemical_symbols(),
+                atoms.get_positions(),
+                basis=basis,
+                xc=xc,
+                scf_config=scf_config,
+                solvent_model=solvent_model,
+                solvent_name=solvent_name,
+                solvent_eps=solvent_eps,
+                charge=charge,
+                spin=spin,
+                ks_type=select_ks_type(
+                    spin=spin,
+                    scf_config=scf_config,
+                    optimizer_mode=optimization_mode,
+                    multiplicity=multiplicity,
+                    log_override=False,
+                ),
+            ),
+        )
+        if mode_hessian is not None:
+            logging.info("Using stored Hessian for the IRC initial Hessian.")
     if mode_hessian is not None:
-        hessian_array = np.asarray(mode_hessian)
-        if hessian_array.ndim == 4:
-            natoms = hessian_array.shape[0]
-            if natoms != len(atoms):
-                raise ValueError("IRC Hessian atom count does not match coordinates.")
-            hessian_array = hessian_array.reshape(natoms * 3, natoms * 3)
-        elif hessian_array.ndim == 2:
-            expected = len(atoms) * 3
-            if hessian_array.shape != (expected, expected):
-                raise ValueError("IRC Hessian shape does not match coordinates.")
-        else:
-            raise ValueError("IRC Hessian must be a 2D or 4D array.")
-        hessian_ev = hessian_array * (units.Hartree / (units.Bohr ** 2))
+        hessian_ev = _hessian_to_ev(mode_hessian, len(atoms), label="IRC Hessian")
 
     def _hessian_function(_atoms):
         if hessian_ev is None:
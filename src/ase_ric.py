@@ -0,0 +1,413 @@
+import logging
+import math
+
+import numpy as np
+from ase import units
+from ase.data import covalent_radii
+from ase.optimize.optimize import Optimizer
+
+from run_opt_utils import normalize_constraints
+
+BOND_SCALE = 1.3
+LINEAR_ANGLE_DEGREES = 175.0
+LINDH_FORCE_CONSTANTS = {"bond": 0.45, "angle": 0.15, "dihedral": 0.005}
+LINDH_ALPHA = (
+    (1.0000, 0.3949, 0.3949),
+    (0.3949, 0.2800, 0.2800),
+    (0.3949, 0.2800, 0.2800),
+)
+LINDH_R_REF_BOHR = (
+    (1.35, 2.10, 2.53),
+    (2.10, 2.87, 3.40),
+    (2.53, 3.40, 3.40),
+)
+MIN_MODEL_FORCE_CONSTANT = 1e-4
+BACK_TRANSFORM_MAX_ITER = 25
+BACK_TRANSFORM_TOL = 1e-6
+INVERSE_THRESHOLD = 1e-8
+
+
+def _wrap_angle(value):
+    return (value + math.pi) % (2.0 * math.pi) - math.pi
+
+
+def _lindh_period(atomic_number):
+    if atomic_number <= 2:
+        return 0
+    if atomic_number <= 10:
+        return 1
+    return 2
+
+
+def _find_bonds(numbers, positions, scale=BOND_SCALE):
+    count = len(numbers)
+    radii = covalent_radii[numbers]
+    distances = np.linalg.norm(positions[:, None, :] - positions[None, :, :], axis=-1)
+    bonds = []
+    for i in range(count):
+        for j in range(i + 1, count):
+            if distances[i, j] < scale * (radii[i] + radii[j]):
+                bonds.append((i, j))
+    # Join disconnected fragments through their closest atom pairs so the
+    # coordinate set spans every relative motion.
+    parent = list(range(count))
+
+    def _root(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    for i, j in bonds:
+        parent[_root(i)] = _root(j)
+    while len({_root(index) for index in range(count)}) > 1:
+        best = None
+        for i in range(count):
+            for j in range(i + 1, count):
+                if _root(i) == _root(j):
+                    continue
+                if best is None or distances[i, j] < distances[best]:
+                    best = (i, j)
+        bonds.append(best)
+        parent[_root(best[0])] = _root(best[1])
+    return bonds
+
+
+def _angle_degrees(positions, i, j, k):
+    u = positions[i] - positions[j]
+    v = positions[k] - positions[j]
+    cosine = np.dot(u, v) / (np.linalg.norm(u) * np.linalg.norm(v))
+    return math.degrees(math.acos(float(np.clip(cosine, -1.0, 1.0))))
+
+
+def build_redundant_internals(numbers, positions, constraints=None):
+    numbers = np.asarray(numbers)
+    positions = np.asarray(positions, dtype=float)
+    bond_constraints, angle_constraints, dihedral_constraints = normalize_constraints(
+        constraints,
+        atom_count=len(numbers),
+    )
+    coordinates = [("bond", i, j) for i, j in _find_bonds(numbers, positions)]
+    neighbors = {index: set() for index in range(len(numbers))}
+    for _, i, j in coordinates:
+        neighbors[i].add(j)
+        neighbors[j].add(i)
+    for center in range(len(numbers)):
+        ordered = sorted(neighbors[center])
+        for position, i in enumerate(ordered):
+            for k in ordered[position + 1:]:
+                if _angle_degrees(positions, i, center, k) < LINEAR_ANGLE_DEGREES:
+                    coordinates.append(("angle", i, center, k))
+    for _, j, k in [item for item in coordinates if item[0] == "bond"]:
+        for i in sorted(neighbors[j] - {k}):
+            for atom_l in sorted(neighbors[k] - {j, i}):
+                if _angle_degrees(positions, i, j, k) >= LINEAR_ANGLE_DEGREES:
+                    continue
+                if _angle_degrees(positions, j, k, atom_l) >= LINEAR_ANGLE_DEGREES:
+                    continue
+                coordinates.append(("dihedral", i, j, k, atom_l))
+
+    constrained = {}
+    for i, j, length in bond_constraints:
+        constrained[_canonical_coordinate(("bond", i, j))] = float(length)
+    for i, j, k, angle in angle_constraints:
+        constrained[_canonical_coordinate(("angle", i, j, k))] = math.radians(angle)
+    for i, j, k, atom_l, dihedral in dihedral_constraints:
+        # Reversing the atom order leaves bond, angle and dihedral values unchanged.
+        constrained[_canonical_coordinate(("dihedral", i, j, k, atom_l))] = math.radians(
+            dihedral
+        )
+    canonical_coordinates = []
+    seen = set()
+    for coordinate in coordinates + list(constrained):
+        canonical = _canonical_coordinate(coordinate)
+        if canonical in seen:
+            continue
+        seen.add(canonical)
+        canonical_coordinates.append(canonical)
+    return canonical_coordinates, constrained
+
+
+def _canonical_coordinate(coordinate):
+    kind, *atoms = coordinate
+    if kind == "bond":
+        return (kind, *sorted(atoms))
+    if atoms[-1] < atoms[0]:
+        atoms = atoms[::-1]
+    return (kind, *atoms)
+
+
+def _bond_value_and_derivative(positions, i, j):
+    delta = positions[i] - positions[j]
+    length = np.linalg.norm(delta)
+    unit = delta / length
+    return length, {i: unit, j: -unit}
+
+
+def _angle_value_and_derivative(positions, i, j, k):
+    u = positions[i] - positions[j]
+    v = positions[k] - positions[j]
+    u_norm = np.linalg.norm(u)
+    v_norm = np.linalg.norm(v)
+    u_unit = u / u_norm
+    v_unit = v / v_norm
+    cosine = float(np.clip(np.dot(u_unit, v_unit), -1.0, 1.0))
+    angle = math.acos(cosine)
+    sine = max(math.sin(angle), 1e-8)
+    d_i = -(v_unit - cosine * u_unit) / (u_norm * sine)
+    d_k = -(u_unit - cosine * v_unit) / (v_norm * sine)
+    return angle, {i: d_i, j: -(d_i + d_k), k: d_k}
+
+
+def _dihedral_value_and_derivative(positions, i, j, k, atom_l):
+    f = positions[i] - positions[j]
+    g = positions[j] - positions[k]
+    h = positions[atom_l] - positions[k]
+    a = np.cross(f, g)
+    b = np.cross(h, g)
+    g_norm = np.linalg.norm(g)
+    a_sq = max(np.dot(a, a), 1e-12)
+    b_sq = max(np.dot(b, b), 1e-12)
+    value = math.atan2(np.dot(np.cross(b, a), g) / g_norm, np.dot(a, b))
+    d_i = -g_norm / a_sq * a
+    d_l = g_norm / b_sq * b
+    fg = np.dot(f, g) / (a_sq * g_norm)
+    hg = np.dot(h, g) / (b_sq * g_norm)
+    d_j = g_norm / a_sq * a + fg * a - hg * b
+    d_k = hg * b - fg * a - g_norm / b_sq * b
+    return value, {i: d_i, j: d_j, k: d_k, atom_l: d_l}
+
+
+def internal_values_and_wilson_b(positions, coordinates):
+    positions = np.asarray(positions, dtype=float)
+    values = np.zeros(len(coordinates))
+    b_matrix = np.zeros((len(coordinates), positions.size))
+    builders = {
+        "bond": _bond_value_and_derivative,
+        "angle": _angle_value_and_derivative,
+        "dihedral": _dihedral_value_and_derivative,
+    }
+    for row, (kind, *atoms) in enumerate(coordinates):
+        value, derivatives = builders[kind](positions, *atoms)
+        values[row] = value
+        for atom, derivative in derivatives.items():
+            b_matrix[row, 3 * atom:3 * atom + 3] += derivative
+    return values, b_matrix
+
+
+def internal_differences(coordinates, q_new, q_old):
+    delta = np.asarray(q_new, dtype=float) - np.asarray(q_old, dtype=float)
+    for index, coordinate in enumerate(coordinates):
+        if coordinate[0] == "dihedral":
+            delta[index] = _wrap_angle(delta[index])
+    return delta
+
+
+def lindh_model_hessian(numbers, positions, coordinates):
+    positions_bohr = np.asarray(positions, dtype=float) / units.Bohr
+    periods = [_lindh_period(int(number)) for number in numbers]
+
+    def _rho(i, j):
+        alpha = LINDH_ALPHA[periods[i]][periods[j]]
+        r_ref = LINDH_R_REF_BOHR[periods[i]][periods[j]]
+        distance_sq = float(np.sum((positions_bohr[i] - positions_bohr[j]) ** 2))
+        return math.exp(alpha * (r_ref ** 2 - distance_sq))
+
+    diagonal = []
+    for kind, *atoms in coordinates:
+        if kind == "bond":
+            force_constant = LINDH_FORCE_CONSTANTS["bond"] * _rho(*atoms)
+            scale = units.Hartree / units.Bohr ** 2
+        elif kind == "angle":
+            i, j, k = atoms
+            force_constant = LINDH_FORCE_CONSTANTS["angle"] * _rho(i, j) * _rho(j, k)
+            scale = units.Hartree
+        else:
+            i, j, k, atom_l = atoms
+            force_constant = (
+                LINDH_FORCE_CONSTANTS["dihedral"] * _rho(i, j) * _rho(j, k) * _rho(k, atom_l)
+            )
+            scale = units.Hartree
+        diagonal.append(max(force_constant, MIN_MODEL_FORCE_CONSTANT) * scale)
+    return np.diag(diagonal)
+
+
+def _generalized_inverse(matrix):
+    eigvals, eigvecs = np.linalg.eigh(matrix)
+    keep = eigvals > INVERSE_THRESHOLD * max(1.0, float(np.max(np.abs(eigvals))))
+    inverse_vals = np.zeros_like(eigvals)
+    inverse_vals[keep] = 1.0 / eigvals[keep]
+    return (eigvecs * inverse_vals) @ eigvecs.T
+
+
+def _rfo_step(hessian, gradient):
+    size = len(gradient)
+    augmented = np.zeros((size + 1, size + 1))
+    augmented[:size, :size] = hessian
+    augmented[:size, size] = gradient
+    augmented[size, :size] = gradient
+    eigvals, eigvecs = np.linalg.eigh(augmented)
+    lowest = eigvecs[:, 0]
+    if abs(lowest[-1]) < 1e-12:
+        return -gradient
+    return lowest[:size] / lowest[-1]
+
+
+class RICBFGS(Optimizer):
+    """BFGS in redundant internal coordinates seeded with a Lindh model Hessian.
+
+    ``hessian`` optionally replaces the model with a Cartesian Hessian in eV/A^2.
+    """
+
+    defaults = {**Optimizer.defaults, "alpha": 70.0}
+
+    def __init__(
+        self,
+        atoms,
+        restart=None,
+        logfile="-",
+        trajectory=None,
+        maxstep=None,
+        constraints=None,
+        hessian=None,
+        **kwargs,
+    ):
+        if restart is not None:
+            raise ValueError("RIC-BFGS does not support restart files.")
+        self.maxstep = self.defaults["maxstep"] if maxstep is None else maxstep
+        self.constraints = constraints
+        self.initial_hessian = hessian
+        super().__init__(
+            atoms=atoms,
+            restart=restart,
+            logfile=logfile,
+            trajectory=trajectory,
+            **kwargs,
+        )
+
+    def initialize(self):
+        numbers = self.atoms.get_atomic_numbers()
+        positions = self.atoms.get_positions()
+        self.coordinates, self.constrained = build_redundant_internals(
+            numbers,
+            positions,
+            constraints=self.constraints,
+        )
+        self.constrained_rows = [
+            index
+            for index, coordinate in enumerate(self.coordinates)
+            if coordinate in self.constrained
+        ]
+        self.hessian = lindh_model_hessian(numbers, positions, self.coordinates)
+        if self.initial_hessian is not None:
+            # Project a Cartesian Hessian (eV/A^2) onto the internal coordinates.
+            _, b_matrix = internal_values_and_wilson_b(positions, self.coordinates)
+            b_pinv = np.linalg.pinv(b_matrix.T)
+            self.hessian = b_pinv @ np.asarray(self.initial_hessian) @ b_pinv.T
+        self.q0 = None
+        self.g0 = None
+        logging.info(
+            "RIC-BFGS: %d internal coordinates (%d constrained).",
+            len(self.coordinates),
+            len(self.constrained_rows),
+        )
+
+    def _update_hessian(self, q, gradient_q):
+        if self.q0 is None:
+            return
+        s = internal_differences(self.coordinates, q, self.q0)
+        y = gradient_q - self.g0
+        sy = float(np.dot(s, y))
+        if sy <= 1e-10:
+            return
+        hs = self.hessian @ s
+        shs = float(np.dot(s, hs))
+        if shs <= 1e-12:
+            return
+        self.hessian += np.outer(y, y) / sy - np.outer(hs, hs) / shs
+
+    def _projector(self, g_matrix, g_inverse):
+        projector = g_matrix @ g_inverse
+        if not self.constrained_rows:
+            return projector
+        selector = np.zeros((len(self.coordinates), len(self.constrained_rows)))
+        for column, row in enumerate(self.constrained_rows):
+            selector[row, column] = 1.0
+        pc = projector @ selector
+        middle = np.linalg.pinv(selector.T @ pc)
+        return projector - pc @ middle @ pc.T
+
+    def _back_transform(self, positions, q, dq):
+        target = q + dq
+        current = positions.ravel().copy()
+        remaining = dq.copy()
+        first_guess = None
+        last_error = None
+        for _ in range(BACK_TRANSFORM_MAX_ITER):
+            _, b_matrix = internal_values_and_wilson_b(
+                current.reshape(-1, 3), self.coordinates
+            )
+            g_inverse = _generalized_inverse(b_matrix @ b_matrix.T)
+            dx = b_matrix.T @ g_inverse @ remaining
+            current = current + dx
+            if first_guess is None:
+                first_guess = current.copy()
+            values, _ = internal_values_and_wilson_b(current.reshape(-1, 3), self.coordinates)
+            remaining = internal_differences(self.coordinates, target, values)
+            error = float(np.sqrt(np.mean(dx ** 2)))
+            if last_error is not None and error > last_error:
+                return first_guess.reshape(-1, 3)
+            last_error = error
+            if error < BACK_TRANSFORM_TOL:
+                return current.reshape(-1, 3)
+        return first_guess.reshape(-1, 3)
+
+    def step(self, *args, **kwargs):
+        positions = self.atoms.get_positions()
+        forces = self.atoms.get_forces()
+        gradient_x = -forces.ravel()
+        q, b_matrix = internal_values_and_wilson_b(positions, self.coordinates)
+        g_matrix = b_matrix @ b_matrix.T
+        g_inverse = _generalized_inverse(g_matrix)
+        gradient_q = g_inverse @ b_matrix @ gradient_x
+        self._update_hessian(q, gradient_q)
+        self.q0 = q
+        self.g0 = gradient_q
+
+        projector = self._projector(g_matrix, g_inverse)
+        projected_gradient = projector @ gradient_q
+        projected_hessian = (
+            projector @ self.hessian @ projector
+            + 1000.0 * (np.eye(len(q)) - projector)
+        )
+        dq = projector @ _rfo_step(projected_hessian, projected_gradient)
+        step_norm = np.linalg.norm(dq)
+        if step_norm > self.maxstep:
+            dq *= self.maxstep / step_norm
+        for row in self.constrained_rows:
+            coordinate = self.coordinates[row]
+            delta = self.constrained[coordinate] - q[row]
+            if coordinate[0] == "dihedral":
+                delta = _wrap_angle(delta)
+            dq[row] += delta
+
+        new_positions = self._back_transform(positions, q, dq)
+        # Motion outside the span of the internals (e.g. a linear bend) falls
+        # back to a damped Cartesian steepest-descent step.
+        null_projector = np.eye(positions.size) - b_matrix.T @ g_inverse @ b_matrix
+        new_positions = new_positions + (
+            null_projector @ forces.ravel() / self.defaults["alpha"]
+        ).reshape(-1, 3)
+        displacement = new_positions - positions
+        max_displacement = float(np.max(np.linalg.norm(displacement, axis=1)))
+        if max_displacement > self.maxstep:
+            displacement *= self.maxstep / max_displacement
+        self.atoms.set_positions(positions + displacement)
+
+
+__all__ = [
+    "RICBFGS",
+    "build_redundant_internals",
+    "internal_values_and_wilson_b",
+    "lindh_model_hessian",
+]
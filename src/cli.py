@@ -18,7 +18,9 @@ def _normalize_cli_args(argv):
         "queue",
         "smoke-test",
         "scan-point",
+        "frequency-point",
         "list-runs",
+        "cache",
     }
     if command in {"-h", "--help"}:
         return argv
@@ -70,6 +72,11 @@ def build_parser():
         action="store_true",
         help="Record SCF/gradient/Hessian timing and cycle counts in metadata.",
     )
+    run_parser.add_argument(
+        "--recheck",
+        action="store_true",
+        help="Ignore cached capability-check results and run the check again.",
+    )
     run_dir_group = run_parser.add_mutually_exclusive_group()
     run_dir_group.add_argument(
         "--run-dir",
@@ -243,6 +250,22 @@ def build_parser():
         help=argparse.SUPPRESS,
     )
 
+    frequency_point_parser = subparsers.add_parser(
+        "frequency-point",
+        help=argparse.SUPPRESS,
+    )
+    frequency_point_parser.add_argument(
+        "--manifest",
+        required=True,
+        help=argparse.SUPPRESS,
+    )
+    frequency_point_parser.add_argument(
+        "--index",
+        type=int,
+        required=True,
+        help=argparse.SUPPRESS,
+    )
+
     status_parser = subparsers.add_parser(
         "status", help="Show run summaries or recent status listings."
     )
@@ -272,6 +295,32 @@ def build_parser():
         help="Optional runs directory override (defaults to DFTFLOW_BASE_DIR/runs).",
     )
 
+    cache_parser = subparsers.add_parser(
+        "cache", help="Inspect or prune the shared SCF result cache."
+    )
+    cache_subparsers = cache_parser.add_subparsers(dest="cache_command", required=True)
+    cache_subparsers.add_parser(
+        "stats", help="Show result cache location, entry count and size."
+    )
+    cache_prune_parser = cache_subparsers.add_parser(
+        "prune", help="Evict least recently used cache entries."
+    )
+    cache_prune_parser.add_argument(
+        "--max-mb",
+        type=float,
+        help="Evict until the cache fits in N megabytes (default: DFTFLOW_RESULT_CACHE_MAX_MB).",
+    )
+    cache_prune_parser.add_argument(
+        "--older-than-days",
+        type=float,
+        help="Also remove entries not used in the last N days.",
+    )
+    cache_prune_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Remove every cached result.",
+    )
+
     queue_parser = subparsers.add_parser(
         "queue", help="Manage the background run queue."
     )
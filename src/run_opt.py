@@ -1029,6 +1029,54 @@ def _run_scan_point_command(args):
     run_scan_point_from_manifest(args.manifest, args.index)
 
 
+def _run_frequency_point_command(args):
+    from run_opt_engine import run_numerical_hessian_point
+
+    run_numerical_hessian_point(args.manifest, args.index)
+
+
+def _run_cache_command(args):
+    import run_opt_result_cache
+
+    if args.cache_command == "stats":
+        stats = run_opt_result_cache.result_cache_stats()
+        print(f"Result cache: {stats['path']}")
+        print(f"Entries: {stats['entries']}")
+        print(
+            "Size: {size:.1f} MB (limit {limit:.0f} MB)".format(
+                size=stats["size_bytes"] / 1024**2,
+                limit=stats["max_bytes"] / 1024**2,
+            )
+        )
+        if stats["entries"]:
+            print(f"Least recently used: {stats['oldest_used']}")
+            print(f"Most recently used: {stats['newest_used']}")
+        return
+    if args.cache_command == "prune":
+        if args.all:
+            max_bytes = 0
+        elif args.max_mb is not None:
+            max_bytes = int(args.max_mb * 1024**2)
+        elif args.older_than_days is not None:
+            max_bytes = None
+        else:
+            max_bytes = run_opt_result_cache.result_cache_max_bytes() or None
+        summary = run_opt_result_cache.prune_result_cache(
+            max_bytes=max_bytes,
+            older_than_days=args.older_than_days,
+        )
+        print(
+            "Pruned result cache: {removed} removed, {freed:.1f} MB freed, "
+            "{remaining:.1f} MB remaining.".format(
+                removed=summary["removed"],
+                freed=summary["freed_bytes"] / 1024**2,
+                remaining=summary["remaining_bytes"] / 1024**2,
+            )
+        )
+        return
+    raise ValueError(f"Unknown cache command: {args.cache_command}")
+
+
 def _run_queue_command(args):
     run_queue.ensure_queue_file(DEFAULT_QUEUE_PATH)
     if args.queue_command == "status":
@@ -1143,7 +1191,9 @@ def _dispatch_non_run_command(args):
     handlers = {
         "doctor": _run_doctor_command,
         "scan-point": _run_scan_point_command,
+        "frequency-point": _run_frequency_point_command,
         "queue": _run_queue_command,
+        "cache": _run_cache_command,
         "status": _run_status_command,
         "list-runs": _run_list_runs_command,
         "validate-config": _run_validate_config_command,
@@ -62,20 +62,35 @@ RUN_CONFIG_EXAMPLES = {
     "solvent_model": "\"solvent_model\": \"pcm\"",
     "dispersion": "\"dispersion\": \"d3bj\"",
     "spin_mode": "\"spin_mode\": \"strict\"",
+    "capability_check": "\"capability_check\": \"probe\"",
     "calculation_mode": "\"calculation_mode\": \"optimization\"",
     "irc_enabled": "\"irc_enabled\": true",
     "irc": "\"irc\": {\"steps\": 10, \"step_size\": 0.05, \"force_threshold\": 0.01}",
+    "irc.mode_solver": "\"irc\": {\"mode_solver\": \"davidson\", \"mode_count\": 2}",
     "qcschema_output_file": "\"qcschema_output_file\": \"qcschema_result.json\"",
     "optimizer": (
         "\"optimizer\": {\"mode\": \"minimum\", \"output_xyz\": \"ase_optimized.xyz\", "
         "\"ase\": {\"d3_params\": {\"damping\": {\"s6\": 1.0}}, \"optimizer\": \"bfgs\"}}"
     ),
     "optimizer.ase": "\"ase\": {\"d3_params\": {\"damping\": {\"s6\": 1.0}}}",
+    "optimizer.ase.scf_warm_start": "\"ase\": {\"scf_warm_start\": true}",
+    "optimizer.ase.scf_extrapolation_order": "\"ase\": {\"scf_extrapolation_order\": 2}",
+    "optimizer.ase.scf_session": "\"ase\": {\"scf_session\": \"scanner\"}",
+    "optimizer.ase.result_cache_size": "\"ase\": {\"result_cache_size\": 8}",
+    "optimizer.ase.concurrent_dispersion": "\"ase\": {\"concurrent_dispersion\": true}",
+    "optimizer.ase.initial_hessian": "\"ase\": {\"initial_hessian\": \"model\"}",
+    "optimizer.ase.adaptive_precision": "\"ase\": {\"adaptive_precision\": true}",
+    "optimizer.ladder": (
+        "\"ladder\": [{\"basis\": \"sto-3g\", \"xc\": \"pbe\", \"fmax\": 0.2}, "
+        "{\"basis\": \"def2-svp\", \"fmax\": 0.1}]"
+    ),
     "scf": (
         "\"scf\": {\"max_cycle\": 200, \"conv_tol\": 1e-7, \"diis\": 8, "
         "\"chkfile\": \"scf.chk\", \"extra\": {\"grids\": {\"level\": 3}}}"
     ),
     "scf.retry_preset": "\"scf\": {\"retry_preset\": \"stable\"}",
+    "scf.retry_parallel": "\"scf\": {\"retry_parallel\": 3}",
+    "scf.result_cache": "\"scf\": {\"result_cache\": true}",
     "scf.diis_preset": "\"scf\": {\"diis_preset\": \"stable\"}",
     "scf.reference": "\"scf\": {\"reference\": \"uks\"}",
     "single_point": (
@@ -90,6 +105,10 @@ RUN_CONFIG_EXAMPLES = {
     "freq": "\"freq\": {\"dispersion\": \"numerical\", \"dispersion_model\": \"d3bj\"}",
     "frequency.dispersion_step": "\"frequency\": {\"dispersion_step\": 0.005}",
     "frequency.use_chkfile": "\"frequency\": {\"use_chkfile\": false}",
+    "frequency.hessian_method": (
+        "\"frequency\": {\"hessian_method\": \"numerical\", \"hessian_step\": 0.005, "
+        "\"hessian_workers\": 8}"
+    ),
     "io.write_interval_steps": "\"io\": {\"write_interval_steps\": 10}",
     "io.write_interval_seconds": "\"io\": {\"write_interval_seconds\": 30}",
     "io.scan_write_interval_points": "\"io\": {\"scan_write_interval_points\": 5}",
@@ -107,6 +126,11 @@ RUN_CONFIG_EXAMPLES = {
     "scan.max_workers": "\"scan\": {\"executor\": \"local\", \"max_workers\": 4}",
     "scan.threads_per_worker": "\"scan\": {\"threads_per_worker\": 2}",
     "scan.batch_size": "\"scan\": {\"batch_size\": 10}",
+    "scan.chain": "\"scan\": {\"mode\": \"optimization\", \"chain\": true}",
+    "scan.schedule": "\"scan2d\": {\"executor\": \"local\", \"schedule\": \"wavefront\"}",
+    "scan.order": "\"scan\": {\"executor\": \"local\", \"order\": \"cost\"}",
+    "scan.straggler_timeout": "\"scan\": {\"straggler_timeout\": 3600}",
+    "scan.adaptive": "\"scan\": {\"adaptive\": {\"tolerance\": 0.0001, \"max_points\": 30}}",
     "ts_quality": (
         "\"ts_quality\": {\"expected_imaginary_count\": 1, "
         "\"imaginary_frequency_min_abs\": 50.0, \"imaginary_frequency_max_abs\": 1500.0, "
@@ -143,6 +167,8 @@ class SCFConfig(ConfigModel):
     diis: bool | int | None = None
     diis_preset: str | None = None
     retry_preset: str | None = None
+    retry_parallel: bool | int | None = None
+    result_cache: bool | None = None
     chkfile: str | None = None
     reference: str | None = None
     extra: dict[str, Any] | None = None
@@ -166,6 +192,13 @@ class OptimizerASEConfig(ConfigModel):
     trajectory: str | None = None
     logfile: str | None = None
     sella: dict[str, Any] | None = None
+    scf_warm_start: bool | None = None
+    scf_extrapolation_order: int | None = None
+    scf_session: str | None = None
+    result_cache_size: int | None = None
+    concurrent_dispersion: bool | None = None
+    initial_hessian: str | None = None
+    adaptive_precision: bool | None = None
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any] | None) -> "OptimizerASEConfig | None":
@@ -179,6 +212,7 @@ class OptimizerConfig(ConfigModel):
     output_xyz: str | None = None
     mode: str | None = None
     ase: OptimizerASEConfig | None = None
+    ladder: list[dict[str, Any]] | None = None
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any] | None) -> "OptimizerConfig | None":
@@ -210,6 +244,9 @@ class FrequencyConfig(ConfigModel):
     dispersion_model: str | None = None
     dispersion_step: float | None = None
     use_chkfile: bool | None = None
+    hessian_method: str | None = None
+    hessian_step: float | None = None
+    hessian_workers: int | None = None
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any] | None) -> "FrequencyConfig | None":
@@ -223,6 +260,8 @@ class IrcConfig(ConfigModel):
     steps: int | None = None
     step_size: float | None = None
     force_threshold: float | None = None
+    mode_solver: str | None = None
+    mode_count: int | None = None
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any] | None) -> "IrcConfig | None":
@@ -286,6 +325,7 @@ class RunConfig(ConfigModel):
     solvent_model: str | None = None
     dispersion: str | None = None
     spin_mode: str | None = None
+    capability_check: str | None = None
     calculation_mode: str | None = None
     enforce_os_memory_limit: bool | None = None
     verbose: bool | None = None
@@ -528,6 +568,10 @@ def _is_diis(value):
     return isinstance(value, (bool, int))
 
 
+def _is_retry_parallel(value):
+    return isinstance(value, bool) or _is_positive_int(value)
+
+
 def _is_dict(value):
     return isinstance(value, dict)
 
@@ -536,6 +580,10 @@ def _is_positive_int(value):
     return _is_int(value) and value > 0
 
 
+def _is_non_negative_int(value):
+    return _is_int(value) and value >= 0
+
+
 def _is_positive_number(value):
     return _is_number(value) and value > 0
 
@@ -544,6 +592,18 @@ def _is_snapshot_mode(value):
     return _is_str(value) and value.lower() in ("none", "last", "all")
 
 
+def _is_hessian_method(value):
+    return _is_str(value) and value.lower() in ("analytic", "numerical")
+
+
+def _is_mode_solver(value):
+    return _is_str(value) and value.lower() in ("hessian", "davidson", "dimer")
+
+
+def _is_mode_count(value):
+    return _is_positive_int(value) and value <= 3
+
+
 def _normalize_calc_mode(value):
     if not value:
         return None
@@ -634,6 +694,7 @@ TOP_LEVEL_VALIDATION_RULES = {
     "solvent_map": (_is_str, "Config '{name}' must be a string path."),
     "dispersion": (_is_str, "Config '{name}' must be a string."),
     "spin_mode": (_is_str, "Config '{name}' must be a string."),
+    "capability_check": (_is_str, "Config '{name}' must be a string."),
 }
 
 
@@ -739,6 +800,24 @@ def _validate_scan_config(scan, name, require_dimensions=False):
                     name=name
                 )
             )
+    chain = scan.get("chain")
+    if chain is not None and not isinstance(chain, bool):
+        raise ValueError(f"Config '{name}.chain' must be a boolean.")
+    schedule = scan.get("schedule")
+    if schedule is not None and schedule not in ("batch", "wavefront"):
+        raise ValueError(f"Config '{name}.schedule' must be one of: batch, wavefront.")
+    order = scan.get("order")
+    if order is not None and order not in ("grid", "cost"):
+        raise ValueError(f"Config '{name}.order' must be one of: grid, cost.")
+    straggler_timeout = scan.get("straggler_timeout")
+    if straggler_timeout is not None and not _is_positive_number(straggler_timeout):
+        raise ValueError(f"Config '{name}.straggler_timeout' must be a positive number.")
+    adaptive = scan.get("adaptive")
+    if adaptive is not None:
+        _validate_scan_adaptive(adaptive, f"{name}.adaptive")
+        dimension_count = len(scan["dimensions"]) if isinstance(scan.get("dimensions"), list) else 1
+        if adaptive and (name == "scan2d" or dimension_count != 1):
+            raise ValueError(f"Config '{name}.adaptive' requires a single scan dimension.")
     manifest_file = scan.get("manifest_file")
     if manifest_file is not None and not isinstance(manifest_file, str):
         raise ValueError(f"Config '{name}.manifest_file' must be a string.")
@@ -787,6 +866,28 @@ def _validate_scan_config(scan, name, require_dimensions=False):
     _validate_scan_dimension(scan, name, require_bounds=True)
 
 
+def _validate_scan_adaptive(adaptive, name):
+    if isinstance(adaptive, bool):
+        return
+    if not isinstance(adaptive, dict):
+        raise ValueError(f"Config '{name}' must be a boolean or an object.")
+    unknown = set(adaptive) - {"tolerance", "max_points", "min_step"}
+    if unknown:
+        raise ValueError(
+            "Config '{name}' has unsupported keys: {keys}. "
+            "Allowed keys: tolerance, max_points, min_step.".format(
+                name=name, keys=", ".join(sorted(unknown))
+            )
+        )
+    for key in ("tolerance", "min_step"):
+        value = adaptive.get(key)
+        if value is not None and not _is_positive_number(value):
+            raise ValueError(f"Config '{name}.{key}' must be a positive number.")
+    max_points = adaptive.get("max_points")
+    if max_points is not None and not _is_positive_int(max_points):
+        raise ValueError(f"Config '{name}.max_points' must be a positive integer.")
+
+
 def _validate_scf_extra(extra, name):
     if extra is None:
         return
@@ -826,10 +927,41 @@ def _validate_optimizer_config(config):
         "mode": (_is_str, "Config '{name}' must be a string."),
     }
     _validate_fields(config["optimizer"], optimizer_rules, prefix="optimizer.")
+    _validate_optimizer_ladder(config["optimizer"].get("ladder"))
     if "ase" in config["optimizer"] and config["optimizer"]["ase"] is not None:
         if not isinstance(config["optimizer"]["ase"], dict):
             raise ValueError("Config 'optimizer.ase' must be an object.")
         ase_config = config["optimizer"]["ase"]
+        ase_rules = {
+            "scf_warm_start": (_is_bool, "Config '{name}' must be a boolean."),
+            "scf_extrapolation_order": (
+                _is_non_negative_int,
+                "Config '{name}' must be a non-negative integer.",
+            ),
+            "scf_session": (_is_str, "Config '{name}' must be a string."),
+            "result_cache_size": (
+                _is_non_negative_int,
+                "Config '{name}' must be a non-negative integer.",
+            ),
+            "concurrent_dispersion": (_is_bool, "Config '{name}' must be a boolean."),
+            "initial_hessian": (
+                _is_str,
+                "Config '{name}' must be 'model', 'none', or a Hessian .npy path.",
+            ),
+            "adaptive_precision": (_is_bool, "Config '{name}' must be a boolean."),
+        }
+        _validate_fields(ase_config, ase_rules, prefix="optimizer.ase.")
+        scf_session = ase_config.get("scf_session")
+        if scf_session is not None and scf_session.strip().lower() not in (
+            "rebuild",
+            "scanner",
+        ):
+            raise ValueError(
+                "Config 'optimizer.ase.scf_session' must be one of: rebuild, scanner. "
+                "Example: {example}.".format(
+                    example=_schema_example_for_path("optimizer.ase.scf_session")
+                )
+            )
         for backend_key in ("d3_backend", "dftd3_backend"):
             backend_value = ase_config.get(backend_key)
             if backend_value is None:
@@ -902,6 +1034,42 @@ def _validate_optimizer_config(config):
                     )
 
 
+def _validate_optimizer_ladder(ladder):
+    if ladder is None:
+        return
+    if not isinstance(ladder, list):
+        raise ValueError(
+            "Config 'optimizer.ladder' must be a list of rung objects. "
+            "Example: {example}.".format(
+                example=_schema_example_for_path("optimizer.ladder")
+            )
+        )
+    rung_rules = {
+        "basis": (_is_str, "Config '{name}' must be a string."),
+        "xc": (_is_str, "Config '{name}' must be a string."),
+        "fmax": (_is_positive_number, "Config '{name}' must be a positive number."),
+        "steps": (_is_positive_int, "Config '{name}' must be a positive integer."),
+    }
+    allowed_keys = set(rung_rules) | {"scf"}
+    for index, rung in enumerate(ladder):
+        prefix = f"optimizer.ladder[{index}]"
+        if not isinstance(rung, dict):
+            raise ValueError(f"Config '{prefix}' must be an object.")
+        unknown = sorted(set(rung) - allowed_keys)
+        if unknown:
+            raise ValueError(
+                "Config '{prefix}' has unsupported keys: {keys}. "
+                "Allowed keys: {allowed}.".format(
+                    prefix=prefix,
+                    keys=", ".join(unknown),
+                    allowed=", ".join(sorted(allowed_keys)),
+                )
+            )
+        _validate_fields(rung, rung_rules, prefix=f"{prefix}.")
+        if rung.get("scf") is not None:
+            _validate_scf_block(rung["scf"], f"{prefix}.scf")
+
+
 def _validate_scf_block(scf_block, prefix):
     if not isinstance(scf_block, dict):
         raise ValueError(f"Config '{prefix}' must be an object.")
@@ -913,6 +1081,11 @@ def _validate_scf_block(scf_block, prefix):
         "diis": (_is_diis, "Config '{name}' must be a boolean or integer."),
         "diis_preset": (_is_str, "Config '{name}' must be a string."),
         "retry_preset": (_is_str, "Config '{name}' must be a string."),
+        "retry_parallel": (
+            _is_retry_parallel,
+            "Config '{name}' must be a boolean or a positive integer.",
+        ),
+        "result_cache": (_is_bool, "Config '{name}' must be a boolean."),
         "chkfile": (_is_str, "Config '{name}' must be a string path."),
         "reference": (_is_str, "Config '{name}' must be a string."),
         "extra": (_is_dict, "Config '{name}' must be an object."),
@@ -985,6 +1158,18 @@ def _validate_frequency_blocks(config):
                     "Config '{name}' must be a positive number.",
                 ),
                 "use_chkfile": (_is_bool, "Config '{name}' must be a boolean."),
+                "hessian_method": (
+                    _is_hessian_method,
+                    "Config '{name}' must be one of: analytic, numerical.",
+                ),
+                "hessian_step": (
+                    _is_positive_number,
+                    "Config '{name}' must be a positive number.",
+                ),
+                "hessian_workers": (
+                    _is_positive_int,
+                    "Config '{name}' must be a positive integer.",
+                ),
             }
             _validate_fields(config[frequency_key], frequency_rules, prefix=f"{frequency_key}.")
 
@@ -1093,6 +1278,14 @@ def _validate_irc_config(config):
         "steps": (_is_positive_int, "Config '{name}' must be a positive integer."),
         "step_size": (_is_positive_number, "Config '{name}' must be a positive number."),
         "force_threshold": (_is_positive_number, "Config '{name}' must be a positive number."),
+        "mode_solver": (
+            _is_mode_solver,
+            "Config '{name}' must be one of: hessian, davidson, dimer.",
+        ),
+        "mode_count": (
+            _is_mode_count,
+            "Config '{name}' must be an integer between 1 and 3.",
+        ),
     }
     _validate_fields(config["irc"], irc_rules, prefix="irc.")
 
@@ -1217,6 +1410,21 @@ def _validate_spin_mode(config):
         )
 
 
+def _validate_capability_check(config):
+    mode = config.get("capability_check")
+    if mode is None:
+        return
+    allowed_modes = ("full", "probe")
+    if mode not in allowed_modes:
+        raise ValueError(
+            "Config 'capability_check' must be one of: {values}. "
+            "Example: {example}.".format(
+                values=", ".join(allowed_modes),
+                example=_schema_example_for_path("capability_check"),
+            )
+        )
+
+
 def _validate_dispersion(config):
     dispersion = config.get("dispersion")
     if dispersion is not None and dispersion not in ("d3bj", "d3zero", "d4"):
@@ -1273,6 +1481,7 @@ def validate_run_config(config):
     _validate_required_core_fields(config)
     _validate_calculation_mode(config)
     _validate_spin_mode(config)
+    _validate_capability_check(config)
     _validate_dispersion(config)
     _validate_solvent_model(config)
     _validate_config_sections(config)
@@ -1,8 +1,15 @@
+import importlib
+import json
 import logging
 import math
 import os
 import re
+import shutil
+import socket
+import tempfile
 import time
+import types
+from datetime import datetime
 from functools import lru_cache
 
 from run_opt_config import (
@@ -12,7 +19,14 @@ from run_opt_config import (
     SMD_UNSUPPORTED_SOLVENT_KEYS,
 )
 from run_opt_dispersion import load_d3_calculator, parse_dispersion_settings
-from run_opt_resources import ensure_parent_dir, resolve_run_path
+from run_opt_metadata import compute_method_fingerprint
+from run_opt_resources import apply_thread_settings, ensure_parent_dir, resolve_run_path
+from run_opt_result_cache import (
+    load_cached_result,
+    result_cache_enabled,
+    result_cache_key,
+    store_cached_result,
+)
 from run_opt_utils import (
     extract_step_count,
     normalize_constraints,
@@ -402,6 +416,40 @@ def apply_scf_checkpoint(mf, scf_config, run_dir=None):
     return None, chkfile_path
 
 
+def project_chkfile_density(mol, chkfile_path, ks_type):
+    if not chkfile_path or not os.path.exists(chkfile_path):
+        return None
+    from pyscf.scf import hf as scf_hf
+    from pyscf.scf import uhf as scf_uhf
+
+    init_guess_by_chkfile = (
+        scf_hf.init_guess_by_chkfile if ks_type == "RKS" else scf_uhf.init_guess_by_chkfile
+    )
+    try:
+        # project=True maps the stored orbitals onto mol's basis (project_mo_nr2nr).
+        return init_guess_by_chkfile(mol, chkfile_path, project=True)
+    except (OSError, KeyError, ValueError) as exc:
+        logging.warning("Could not project density guess from %s: %s", chkfile_path, exc)
+        return None
+
+
+def _resolve_projected_density_guess(mol, scf_config, run_dir, guess_chkfile, ks_type, label):
+    if not guess_chkfile:
+        return None
+    own_chkfile = (scf_config or {}).get("chkfile")
+    if own_chkfile:
+        own_chkfile = resolve_run_path(run_dir, own_chkfile) if run_dir else own_chkfile
+        # A chkfile already written in the target basis beats a projected guess.
+        if os.path.exists(own_chkfile) and os.path.abspath(own_chkfile) != os.path.abspath(
+            guess_chkfile
+        ):
+            return None
+    dm0 = project_chkfile_density(mol, guess_chkfile, ks_type)
+    if dm0 is not None:
+        logging.info("%s: projecting density guess from %s.", label, guess_chkfile)
+    return dm0
+
+
 def _scf_retry_enabled():
     value = os.environ.get("DFTFLOW_SCF_RETRY", "1").strip().lower()
     return value not in ("0", "false", "no", "off")
@@ -447,10 +495,12 @@ SCF_RETRY_PRESET_VALUES = {
     "default": (
         {"level_shift": 0.5, "damping": 0.2, "max_cycle": 50},
         {"level_shift": 1.0, "damping": 0.3, "max_cycle": 200},
+        {"second_order": True, "max_cycle": 50},
     ),
     "stable": (
         {"level_shift": 0.5, "damping": 0.2, "max_cycle": 50},
         {"level_shift": 1.0, "damping": 0.3, "max_cycle": 200},
+        {"second_order": True, "max_cycle": 50},
         {"level_shift": 2.0, "damping": 0.4, "max_cycle": 400},
     ),
     "off": (),
@@ -505,9 +555,13 @@ def _build_scf_retry_overrides(scf_config):
     retries = []
     for target in retry_targets:
         overrides = {}
-        if base_level is None or base_level < target["level_shift"]:
+        if target.get("second_order"):
+            overrides["second_order"] = True
+        if "level_shift" in target and (
+            base_level is None or base_level < target["level_shift"]
+        ):
             overrides["level_shift"] = target["level_shift"]
-        if base_damping is None or base_damping < target["damping"]:
+        if "damping" in target and (base_damping is None or base_damping < target["damping"]):
             overrides["damping"] = target["damping"]
         if base_max is None or base_max < target["max_cycle"]:
             overrides["max_cycle"] = target["max_cycle"]
@@ -518,12 +572,32 @@ def _build_scf_retry_overrides(scf_config):
 
 def _format_scf_retry_overrides(overrides):
     parts = []
-    for key in ("level_shift", "damping", "max_cycle"):
+    for key in ("level_shift", "damping", "max_cycle", "second_order"):
         if key in overrides:
             parts.append(f"{key}={overrides[key]}")
     return ", ".join(parts) if parts else "no changes"
 
 
+def _apply_second_order_retry(mf, scf_config):
+    if not (scf_config or {}).get("second_order"):
+        return mf
+    try:
+        return mf.newton()
+    except (AttributeError, NotImplementedError) as exc:
+        logging.warning("Second-order SCF unavailable (%s); keeping first-order solver.", exc)
+        return mf
+
+
+def _retry_density_guess(mf):
+    # Continue the next retry from the last iterate instead of a cold start.
+    if getattr(mf, "mo_coeff", None) is None or getattr(mf, "mo_occ", None) is None:
+        return None
+    try:
+        return mf.make_rdm1()
+    except (AttributeError, ValueError):
+        return None
+
+
 def _is_scf_converged(mf):
     converged = getattr(mf, "converged", None)
     if converged is None:
@@ -537,19 +611,173 @@ def _unpack_mf_builder_result(result):
     return result, {}
 
 
-def _run_scf_with_retries(build_mf, scf_config, run_dir, label):
+class _SCFBuilderSpec:
+    # Speculative retries run in spawned/forkserver workers (forking after PySCF's
+    # OpenMP kernels can hang libgomp), so the builder travels as function + kwargs.
+    def __init__(self, function, **kwargs):
+        self.function = function
+        self.kwargs = kwargs
+
+    def __call__(self, scf_settings):
+        return self.function(scf_settings=scf_settings, **self.kwargs)
+
+    def __getstate__(self):
+        kwargs = {
+            key: ("module", value.__name__) if isinstance(value, types.ModuleType) else value
+            for key, value in self.kwargs.items()
+        }
+        return {"function": self.function, "kwargs": kwargs}
+
+    def __setstate__(self, state):
+        self.function = state["function"]
+        self.kwargs = {
+            key: importlib.import_module(value[1])
+            if isinstance(value, tuple) and len(value) == 2 and value[0] == "module"
+            else value
+            for key, value in state["kwargs"].items()
+        }
+
+
+def _speculative_scf_context():
+    import multiprocessing
+
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _resolve_scf_retry_parallel(scf_config, retry_count):
+    value = (scf_config or {}).get("retry_parallel")
+    if value is None or value is False:
+        return 0
+    if value is True:
+        workers = retry_count
+    else:
+        workers = min(int(value), retry_count)
+    if workers < 2:
+        return 0
+    return workers
+
+
+def _run_speculative_scf_strategy(task):
+    build_mf, index, config, dm_guess, thread_count = task
+    apply_thread_settings(thread_count)
+    mf, _ = _unpack_mf_builder_result(build_mf(config))
+    mf = _apply_second_order_retry(mf, config)
+    # Workers never touch the shared chkfile; the parent writes it for the winner.
+    mf.chkfile = None
+    start = time.perf_counter()
+    if dm_guess is not None:
+        energy = mf.kernel(dm0=dm_guess)
+    else:
+        energy = mf.kernel()
+    converged = _is_scf_converged(mf)
+    return {
+        "index": index,
+        "energy": energy,
+        "converged": converged,
+        "cycles": extract_step_count(mf),
+        "seconds": time.perf_counter() - start,
+        "dm": _retry_density_guess(mf) if converged else None,
+    }
+
+
+def _run_scf_retries_speculatively(
+    build_mf, base_config, retries, dm_guess, run_dir, label, workers
+):
+    try:
+        from pyscf import lib as pyscf_lib
+
+        thread_budget = pyscf_lib.num_threads()
+    except ImportError:
+        thread_budget = os.cpu_count() or 1
+    threads_per_strategy = max(1, thread_budget // workers)
+    tasks = [
+        (
+            build_mf,
+            index,
+            _merge_scf_config(base_config, overrides),
+            dm_guess,
+            threads_per_strategy,
+        )
+        for index, overrides in enumerate(retries)
+    ]
+    logging.warning(
+        "%s did not converge; trying %s SCF retry strategies in parallel "
+        "(%s workers x %s threads).",
+        label,
+        len(retries),
+        workers,
+        threads_per_strategy,
+    )
+    winner = None
+    attempts = []
+    pool = _speculative_scf_context().Pool(processes=workers)
+    try:
+        for outcome in pool.imap_unordered(_run_speculative_scf_strategy, tasks):
+            attempts.append(
+                {key: outcome[key] for key in ("index", "converged", "cycles", "seconds")}
+            )
+            if outcome["converged"]:
+                winner = outcome
+                break
+    finally:
+        # Stop the strategies that are still running once one has converged.
+        pool.terminate()
+        pool.join()
+    retry_info = {
+        "mode": "parallel",
+        "workers": workers,
+        "threads_per_strategy": threads_per_strategy,
+        "attempts": attempts,
+        "winner": None,
+    }
+    if winner is None:
+        return None, retry_info
+    overrides = retries[winner["index"]]
+    retry_info["winner"] = {
+        "index": winner["index"],
+        "overrides": dict(overrides),
+        "cycles": winner["cycles"],
+    }
+    logging.info(
+        "%s converged with parallel SCF retry strategy (%s).",
+        label,
+        _format_scf_retry_overrides(overrides),
+    )
+    # Re-converge the winning density in-process to get a usable mean-field object.
+    winning_config = _merge_scf_config(base_config, overrides)
+    mf, info = _unpack_mf_builder_result(build_mf(winning_config))
+    mf = _apply_second_order_retry(mf, winning_config)
+    apply_scf_checkpoint(mf, winning_config, run_dir=run_dir)
+    energy = mf.kernel(dm0=winner["dm"])
+    if not _is_scf_converged(mf):
+        logging.warning(
+            "%s did not re-converge in-process from the winning density; "
+            "falling back to serial retries.",
+            label,
+        )
+        retry_info["winner"]["reconverged"] = False
+        retry_info["fallback"] = "serial"
+        return None, retry_info
+    return (energy, mf, info), retry_info
+
+
+def _run_scf_with_retries(build_mf, scf_config, run_dir, label, dm0=None):
     base_config = dict(scf_config or {})
 
-    def _run_once(config):
+    def _run_once(config, dm_guess=None):
         mf, info = _unpack_mf_builder_result(build_mf(config))
+        mf = _apply_second_order_retry(mf, config)
         dm0, _ = apply_scf_checkpoint(mf, config, run_dir=run_dir)
+        if dm_guess is not None:
+            dm0 = dm_guess
         if dm0 is not None:
             energy_value = mf.kernel(dm0=dm0)
         else:
             energy_value = mf.kernel()
         return energy_value, mf, info
 
-    energy, mf, info = _run_once(base_config)
+    energy, mf, info = _run_once(base_config, dm0)
     if _is_scf_converged(mf):
         return energy, mf, info
     if not _scf_retry_enabled():
@@ -557,6 +785,35 @@ def _run_scf_with_retries(build_mf, scf_config, run_dir, label):
     retries = _build_scf_retry_overrides(base_config)
     if not retries:
         return energy, mf, info
+    workers = _resolve_scf_retry_parallel(base_config, len(retries))
+    if workers and not isinstance(build_mf, _SCFBuilderSpec):
+        logging.warning(
+            "%s SCF builder cannot be sent to worker processes; running retries serially.",
+            label,
+        )
+        workers = 0
+    retry_info = None
+    if workers:
+        result, retry_info = _run_scf_retries_speculatively(
+            build_mf,
+            base_config,
+            retries,
+            _retry_density_guess(mf),
+            run_dir,
+            label,
+            workers,
+        )
+        if result is not None:
+            energy, mf, info = result
+            return energy, mf, {**info, "scf_retry": retry_info}
+        if retry_info.get("fallback") != "serial":
+            logging.warning(
+                "%s did not converge with any of %s parallel retry strategies; "
+                "proceeding with last result.",
+                label,
+                len(retries),
+            )
+            return energy, mf, {**info, "scf_retry": retry_info}
     for attempt, overrides in enumerate(retries, start=1):
         retry_config = _merge_scf_config(base_config, overrides)
         logging.warning(
@@ -564,7 +821,9 @@ def _run_scf_with_retries(build_mf, scf_config, run_dir, label):
             label,
             _format_scf_retry_overrides(overrides),
         )
-        energy, mf, info = _run_once(retry_config)
+        energy, mf, info = _run_once(retry_config, _retry_density_guess(mf))
+        if retry_info is not None:
+            info = {**info, "scf_retry": retry_info}
         if _is_scf_converged(mf):
             logging.info("%s converged after SCF retry %s.", label, attempt)
             return energy, mf, info
@@ -753,6 +1012,47 @@ def _supported_smd_solvents():
     return tuple(supported)
 
 
+def _build_single_point_mf(
+    *,
+    mol_sp,
+    xc,
+    scf_settings,
+    solvent_model,
+    solvent_name,
+    solvent_eps,
+    verbose,
+    optimizer_mode,
+    multiplicity,
+    log_override,
+):
+    from pyscf import dft
+
+    ks_type = select_ks_type(
+        mol=mol_sp,
+        scf_config=scf_settings,
+        optimizer_mode=optimizer_mode,
+        multiplicity=multiplicity,
+        log_override=log_override,
+    )
+    if ks_type == "RKS":
+        mf_sp = dft.RKS(mol_sp)
+    else:
+        mf_sp = dft.UKS(mol_sp)
+    mf_sp.xc = xc
+    mf_sp, _ = apply_density_fit_setting(mf_sp, scf_settings)
+    if solvent_model is not None:
+        mf_sp = apply_solvent_model(
+            mf_sp,
+            solvent_model,
+            solvent_name,
+            solvent_eps,
+        )
+    if verbose:
+        mf_sp.verbose = 4
+    mf_sp, _ = apply_scf_settings(mf_sp, scf_settings, apply_density_fit=False)
+    return mf_sp
+
+
 def compute_single_point_energy(
     mol,
     basis,
@@ -770,10 +1070,10 @@ def compute_single_point_energy(
     multiplicity=None,
     profiling_enabled=False,
     log_override=True,
+    guess_chkfile=None,
 ):
     from ase import units
     from ase import Atoms
-    from pyscf import dft
 
     xc = normalize_xc_functional(xc)
     mol_sp = mol.copy()
@@ -782,36 +1082,77 @@ def compute_single_point_energy(
         mol_sp.build()
     if memory_mb:
         mol_sp.max_memory = memory_mb
-    def _build_mf_sp(scf_settings):
-        ks_type = select_ks_type(
-            mol=mol_sp,
-            scf_config=scf_settings,
-            optimizer_mode=optimizer_mode,
-            multiplicity=multiplicity,
-            log_override=log_override,
-        )
-        if ks_type == "RKS":
-            mf_sp = dft.RKS(mol_sp)
-        else:
-            mf_sp = dft.UKS(mol_sp)
-        mf_sp.xc = xc
-        mf_sp, _ = apply_density_fit_setting(mf_sp, scf_settings)
-        if solvent_model is not None:
-            mf_sp = apply_solvent_model(
-                mf_sp,
-                solvent_model,
-                solvent_name,
-                solvent_eps,
-            )
-        if verbose:
-            mf_sp.verbose = 4
-        mf_sp, _ = apply_scf_settings(mf_sp, scf_settings, apply_density_fit=False)
-        return mf_sp
+    _build_mf_sp = _SCFBuilderSpec(
+        _build_single_point_mf,
+        mol_sp=mol_sp,
+        xc=xc,
+        solvent_model=solvent_model,
+        solvent_name=solvent_name,
+        solvent_eps=solvent_eps,
+        verbose=verbose,
+        optimizer_mode=optimizer_mode,
+        multiplicity=multiplicity,
+        log_override=log_override,
+    )
 
+    cache_key = None
+    cached = None
+    if result_cache_enabled(scf_config):
+        cache_key = result_cache_key(
+            [mol_sp.atom_symbol(i) for i in range(mol_sp.natm)],
+            mol_sp.atom_coords(unit="Angstrom"),
+            basis=basis or mol_sp.basis,
+            xc=xc,
+            scf_config=scf_config,
+            solvent_model=solvent_model,
+            solvent_name=solvent_name,
+            solvent_eps=solvent_eps,
+            charge=mol_sp.charge,
+            spin=mol_sp.spin,
+            ks_type=select_ks_type(
+                mol=mol_sp,
+                scf_config=scf_config,
+                optimizer_mode=optimizer_mode,
+                multiplicity=multiplicity,
+                log_override=False,
+            ),
+        )
+        cached = load_cached_result(cache_key)
     scf_start = time.perf_counter() if profiling_enabled else None
-    energy, mf_sp, _ = _run_scf_with_retries(
-        _build_mf_sp, scf_config, run_dir, "Single-point SCF"
-    )
+    scf_info = {}
+    if cached is not None:
+        logging.info("Single-point SCF result found in the result cache.")
+        energy = cached["energy"]
+        scf_converged = cached["converged"]
+        scf_cycles = cached["metadata"].get("cycles")
+    else:
+        dm0 = _resolve_projected_density_guess(
+            mol_sp,
+            scf_config,
+            run_dir,
+            guess_chkfile,
+            select_ks_type(
+                mol=mol_sp,
+                scf_config=scf_config,
+                optimizer_mode=optimizer_mode,
+                multiplicity=multiplicity,
+                log_override=False,
+            ),
+            "Single-point SCF",
+        )
+        energy, mf_sp, scf_info = _run_scf_with_retries(
+            _build_mf_sp, scf_config, run_dir, "Single-point SCF", dm0=dm0
+        )
+        scf_converged = getattr(mf_sp, "converged", None)
+        scf_cycles = extract_step_count(mf_sp)
+        if cache_key and _is_scf_converged(mf_sp):
+            store_cached_result(
+                cache_key,
+                energy=energy,
+                converged=True,
+                density=mf_sp.make_rdm1(),
+                metadata={"cycles": scf_cycles},
+            )
     scf_seconds = None
     if scf_start is not None:
         scf_seconds = time.perf_counter() - scf_start
@@ -843,14 +1184,18 @@ def compute_single_point_energy(
         }
     result = {
         "energy": energy,
-        "converged": getattr(mf_sp, "converged", None),
-        "cycles": extract_step_count(mf_sp),
+        "converged": scf_converged,
+        "cycles": scf_cycles,
         "dispersion": dispersion_info,
     }
+    if cache_key:
+        result["result_cache"] = "hit" if cached is not None else "miss"
+    if scf_info.get("scf_retry"):
+        result["scf_retry"] = scf_info["scf_retry"]
     if profiling_enabled:
         result["profiling"] = {
             "scf_seconds": scf_seconds,
-            "scf_cycles": extract_step_count(mf_sp),
+            "scf_cycles": scf_cycles,
         }
     return result
 
@@ -889,6 +1234,209 @@ def _extract_imaginary_mode_from_hessian(hess, mol, atomic_masses, atomic_number
     }
 
 
+MODE_SOLVERS = ("hessian", "davidson", "dimer")
+MODE_SOLVER_DEFAULT_STEP = 0.005
+MODE_SOLVER_DEFAULT_TOL = 1e-3
+MODE_SOLVER_MAX_ITERATIONS = 25
+# Two roots let a single imaginary mode be told apart from several.
+MODE_SOLVER_DEFAULT_ROOTS = 2
+
+
+def _mass_weighted_rigid_basis(positions, masses, extra_directions=None):
+    import numpy as np
+
+    natm = len(masses)
+    sqrt_mass = np.sqrt(np.repeat(np.asarray(masses, dtype=float), 3))
+    center = np.average(positions, axis=0, weights=masses)
+    relative = np.asarray(positions, dtype=float) - center
+    directions = []
+    for axis in range(3):
+        translation = np.zeros((natm, 3))
+        translation[:, axis] = 1.0
+        rotation = np.cross(np.eye(3)[axis], relative)
+        directions.append(translation.ravel() * sqrt_mass)
+        directions.append(rotation.ravel() * sqrt_mass)
+    if extra_directions is not None:
+        # Constraint gradients are covectors, so they scale with 1/sqrt(m).
+        directions.extend(np.atleast_2d(extra_directions) / sqrt_mass)
+    # Linear molecules only have two rotations; drop the null direction.
+    u, singular, _ = np.linalg.svd(np.array(directions).T, full_matrices=False)
+    return u[:, singular > 1e-6 * singular.max()]
+
+
+def _davidson_lowest_modes(
+    matvec, guesses, *, nroots, projector, diagonal=None, tol, max_iterations
+):
+    import numpy as np
+
+    basis = []
+    images = []
+
+    def _extend(vectors):
+        added = 0
+        for vector in vectors:
+            vector = projector(np.asarray(vector, dtype=float))
+            for _ in range(2):
+                for existing in basis:
+                    vector = vector - (existing @ vector) * existing
+            norm = np.linalg.norm(vector)
+            if norm < 1e-8:
+                continue
+            vector = vector / norm
+            basis.append(vector)
+            images.append(projector(matvec(vector)))
+            added += 1
+        return added
+
+    _extend(guesses)
+    converged = False
+    iterations = 0
+    while True:
+        subspace = np.array(basis)
+        reduced = subspace @ np.array(images).T
+        theta, coefficients = np.linalg.eigh(0.5 * (reduced + reduced.T))
+        count = min(nroots, len(theta))
+        ritz = coefficients[:, :count].T @ subspace
+        residuals = coefficients[:, :count].T @ np.array(images) - theta[:count, None] * ritz
+        residual_norms = np.linalg.norm(residuals, axis=1)
+        if np.all(residual_norms < tol):
+            converged = True
+            break
+        if iterations >= max_iterations:
+            break
+        iterations += 1
+        corrections = []
+        for root in np.flatnonzero(residual_norms >= tol):
+            correction = residuals[root]
+            if diagonal is not None:
+                shift = diagonal - theta[root]
+                shift[np.abs(shift) < 1e-2] = 1e-2
+                correction = correction / shift
+            corrections.append(correction)
+        if not _extend(corrections):
+            break
+    return theta[:count], ritz, {
+        "iterations": iterations,
+        "converged": converged,
+        "residual_norms": residual_norms.tolist(),
+        "subspace_size": len(basis),
+    }
+
+
+def _dimer_lowest_mode(matvec, guess, *, projector, tol, max_iterations):
+    import numpy as np
+
+    mode = projector(np.asarray(guess, dtype=float))
+    mode = mode / np.linalg.norm(mode)
+    image = projector(matvec(mode))
+    converged = False
+    iterations = 0
+    while True:
+        curvature = float(mode @ image)
+        rotational_force = image - curvature * mode
+        force_norm = float(np.linalg.norm(rotational_force))
+        if force_norm < tol:
+            converged = True
+            break
+        if iterations >= max_iterations:
+            break
+        iterations += 1
+        # One extra gradient per rotation: curvature along the trial direction is
+        # linear in the displacement, so the optimal angle follows from a 2x2 problem.
+        direction = rotational_force / force_norm
+        direction_image = projector(matvec(direction))
+        coupling = 0.5 * (float(mode @ direction_image) + float(direction @ image))
+        reduced = np.array(
+            [[curvature, coupling], [coupling, float(direction @ direction_image)]]
+        )
+        _, vectors = np.linalg.eigh(reduced)
+        cos_part, sin_part = vectors[:, 0]
+        mode = cos_part * mode + sin_part * direction
+        image = cos_part * image + sin_part * direction_image
+        norm = np.linalg.norm(mode)
+        mode, image = mode / norm, image / norm
+    return np.array([float(mode @ image)]), mode[None, :], {
+        "iterations": iterations,
+        "converged": converged,
+        "residual_norms": [force_norm],
+        "subspace_size": None,
+    }
+
+
+def _mass_weighted_eigenvalue_to_wavenumber(eigenvalue):
+    from pyscf.data import nist
+
+    au2hz = (nist.HARTREE2J / (nist.ATOMIC_MASS * nist.BOHR_SI ** 2)) ** 0.5 / (2 * math.pi)
+    wavenumber = math.sqrt(abs(eigenvalue)) * au2hz / nist.LIGHT_SPEED_SI / 100.0
+    return -wavenumber if eigenvalue < 0 else wavenumber
+
+
+def _model_mass_weighted_hessian(mol, sqrt_mass):
+    import numpy as np
+
+    try:
+        from ase import units
+        from ase_ric import (
+            build_redundant_internals,
+            internal_values_and_wilson_b,
+            lindh_model_hessian,
+        )
+
+        numbers = mol.atom_charges()
+        positions = mol.atom_coords(unit="Angstrom")
+        coordinates, _ = build_redundant_internals(numbers, positions)
+        _, b_matrix = internal_values_and_wilson_b(positions, coordinates)
+        model = b_matrix.T @ lindh_model_hessian(numbers, positions, coordinates) @ b_matrix
+    except Exception as exc:
+        logging.debug("Model Hessian unavailable for mode guesses: %s", exc)
+        return None
+    model = model * (units.Bohr ** 2 / units.Hartree)
+    return model / np.outer(sqrt_mass, sqrt_mass)
+
+
+def _solve_lowest_modes(
+    *, matvec, mol, masses, method, nroots, tol, max_iterations, constraint_jacobians=None
+):
+    import numpy as np
+
+    sqrt_mass = np.sqrt(np.repeat(np.asarray(masses, dtype=float), 3))
+    rigid = _mass_weighted_rigid_basis(mol.atom_coords(), masses, constraint_jacobians)
+
+    def _project(vector):
+        return vector - rigid @ (rigid.T @ vector)
+
+    model = _model_mass_weighted_hessian(mol, sqrt_mass)
+    diagonal = None
+    if model is not None:
+        projector = np.eye(sqrt_mass.size) - rigid @ rigid.T
+        # Push rigid-body directions to the top so they are never picked as guesses.
+        shifted = projector @ model @ projector + rigid @ rigid.T * 1e3
+        _, model_vectors = np.linalg.eigh(0.5 * (shifted + shifted.T))
+        guesses = model_vectors[:, : max(nroots + 2, 3)].T
+        diagonal = np.diag(model).copy()
+    else:
+        guesses = np.random.default_rng(0).normal(size=(max(nroots + 2, 3), sqrt_mass.size))
+    if method == "dimer":
+        eigenvalues, modes_mw, info = _dimer_lowest_mode(
+            matvec, guesses[0], projector=_project, tol=tol, max_iterations=max_iterations
+        )
+    else:
+        eigenvalues, modes_mw, info = _davidson_lowest_modes(
+            matvec,
+            guesses,
+            nroots=nroots,
+            projector=_project,
+            diagonal=diagonal,
+            tol=tol,
+            max_iterations=max_iterations,
+        )
+    modes = []
+    for mode_mw in modes_mw:
+        mode_cart = mode_mw / sqrt_mass
+        modes.append((mode_cart / np.linalg.norm(mode_cart)).reshape(-1, 3))
+    return eigenvalues, modes, info
+
+
 def _evaluate_internal_coordinate(kind, positions, i, j, k=None, l_index=None):
     import numpy as np
 
@@ -1037,28 +1585,345 @@ def _build_dispersion_calculator(atoms, dispersion_settings):
     return DFTD4(atoms=atoms, **settings), "ase-dftd4"
 
 
-def _compute_dispersion_hessian_numerical(atoms, step):
+DISPERSION_HESSIAN_PARALLEL_MIN_ATOMS = 16
+HESSIAN_SYMMETRY_TOLERANCE = 1e-3
+
+
+def _match_atom_permutation(symbols, positions, mapped, tolerance):
     import numpy as np
 
-    base_positions = atoms.get_positions()
-    natoms = len(base_positions)
-    hessian = np.zeros((natoms, natoms, 3, 3), dtype=float)
+    distances = np.linalg.norm(mapped[:, None, :] - positions[None, :, :], axis=-1)
+    same_element = np.asarray(symbols)[:, None] == np.asarray(symbols)[None, :]
+    distances[~same_element] = np.inf
+    permutation = distances.argmin(axis=1)
+    if distances[np.arange(len(positions)), permutation].max() > tolerance:
+        return None
+    if len(set(permutation.tolist())) != len(positions):
+        return None
+    return permutation
+
+
+def _orthogonal_closest(matrix):
+    import numpy as np
+
+    u, _, vt = np.linalg.svd(matrix)
+    return u @ vt
+
+
+def _find_symmetry_operations(symbols, positions, origin):
+    """Find every orthogonal map of the molecule onto itself about ``origin``.
+
+    Each candidate is fixed by sending three reference atoms onto atoms of the same
+    element at matching distances. Returns ``None`` for linear molecules, whose
+    rotation group is continuous.
+    """
+    import numpy as np
+
+    centered = positions - origin
+    tolerance = HESSIAN_SYMMETRY_TOLERANCE
+    norms = np.linalg.norm(centered, axis=1)
+    off_origin = [index for index in range(len(positions)) if norms[index] > tolerance]
+    if not off_origin:
+        return None
+    first = off_origin[0]
+    second = next(
+        (
+            index
+            for index in off_origin
+            if np.linalg.norm(np.cross(centered[first], centered[index]))
+            > tolerance * norms[index]
+        ),
+        None,
+    )
+    if second is None:
+        return None
+    normal = np.cross(centered[first], centered[second])
+    third = next(
+        (
+            index
+            for index in off_origin
+            if abs(normal @ centered[index]) > tolerance * np.linalg.norm(normal)
+        ),
+        None,
+    )
+    references = [first, second] if third is None else [first, second, third]
+    reference = np.stack([centered[index] for index in references], axis=1)
+    if third is None:
+        reference = np.column_stack([reference, normal])
+    reference_inverse = np.linalg.inv(reference)
+
+    def _candidates(index, chosen):
+        for image in range(len(positions)):
+            if symbols[image] != symbols[index] or abs(norms[image] - norms[index]) > tolerance:
+                continue
+            if all(
+                abs(
+                    np.linalg.norm(centered[image] - centered[other_image])
+                    - np.linalg.norm(centered[index] - centered[other])
+                )
+                <= 2 * tolerance
+                for other, other_image in zip(references, chosen)
+            ):
+                yield image
+
+    images = [[]]
+    for index in references:
+        images = [
+            chosen + [image] for chosen in images for image in _candidates(index, chosen)
+        ]
+    operations = []
+    for chosen in images:
+        target = np.stack([centered[index] for index in chosen], axis=1)
+        if third is not None:
+            targets = [target]
+        else:
+            # Planar molecules: the normal maps onto either side of the plane.
+            targets = [
+                np.column_stack([target, sign * np.cross(target[:, 0], target[:, 1])])
+                for sign in (1, -1)
+            ]
+        for target_matrix in targets:
+            rotation = _orthogonal_closest(target_matrix @ reference_inverse)
+            if any(np.allclose(rotation, known, atol=1e-6) for known, _ in operations):
+                continue
+            permutation = _match_atom_permutation(
+                symbols, positions, centered @ rotation.T + origin, tolerance
+            )
+            if permutation is not None:
+                operations.append((rotation, permutation))
+    return operations
+
+
+def _detect_displacement_symmetry(symbols, positions):
+    import numpy as np
+
+    try:
+        from pyscf import symm
+    except ImportError:
+        return None
+    positions = np.asarray(positions, dtype=float)
+    if len(positions) < 2:
+        return None
+    try:
+        group, origin, axes = symm.geom.detect_symm(list(zip(symbols, positions)))
+    except Exception as exc:
+        logging.debug("Point group detection failed: %s", exc)
+        return None
+    identity = (np.eye(3), np.arange(len(positions)))
+    found = _find_symmetry_operations(symbols, positions, np.asarray(origin))
+    if found is None:
+        # Linear molecules: fall back to the D2h-family operations, which are
+        # diagonal in PySCF's symmetry frame.
+        found = []
+        for name, matrix in symm.geom.symm_ops("D2h").items():
+            frame_op = np.eye(3) * matrix if np.isscalar(matrix) else np.asarray(matrix)
+            rotation = axes.T @ frame_op @ axes
+            mapped = (positions - origin) @ rotation.T + origin
+            permutation = _match_atom_permutation(
+                symbols, positions, mapped, HESSIAN_SYMMETRY_TOLERANCE
+            )
+            if permutation is not None:
+                found.append((rotation, permutation))
+    operations = [identity] + [
+        (rotation, permutation)
+        for rotation, permutation in found
+        if not np.allclose(rotation, np.eye(3), atol=1e-6)
+    ]
+    if len(operations) < 2:
+        return None
+    return {"group": group, "axes": np.asarray(axes), "operations": operations}
+
+
+def _build_displacement_plan(natoms, step, symmetry=None):
+    import numpy as np
+
+    if symmetry is None:
+        axes = np.eye(3)
+        operations = [(np.eye(3), np.arange(natoms))]
+    else:
+        axes = symmetry["axes"]
+        operations = symmetry["operations"]
+    orbit = [None] * natoms
+    representatives = []
     for atom_idx in range(natoms):
-        for coord in range(3):
-            pos_plus = base_positions.copy()
-            pos_plus[atom_idx, coord] += step
-            atoms.set_positions(pos_plus)
-            forces_plus = atoms.get_forces()
-            pos_minus = base_positions.copy()
-            pos_minus[atom_idx, coord] -= step
-            atoms.set_positions(pos_minus)
-            forces_minus = atoms.get_forces()
-            delta_forces = (forces_plus - forces_minus) / (2.0 * step)
-            hessian[:, atom_idx, :, coord] = -delta_forces
-    atoms.set_positions(base_positions)
+        if orbit[atom_idx] is not None:
+            continue
+        representatives.append(atom_idx)
+        for op_idx, (_, permutation) in enumerate(operations):
+            image = int(permutation[atom_idx])
+            if orbit[image] is None:
+                orbit[image] = (atom_idx, op_idx)
+    displacements = []
+    sources = {}
+    for atom_idx in representatives:
+        stabilizer = [
+            op_idx
+            for op_idx, (_, permutation) in enumerate(operations)
+            if permutation[atom_idx] == atom_idx
+        ]
+        for axis in range(3):
+            for sign in (1, -1):
+                for op_idx in stabilizer[1:]:
+                    rotation = operations[op_idx][0]
+                    image_sign = int(round(axes[axis] @ rotation @ axes[axis]))
+                    # Only operations that send the axis onto itself (up to sign)
+                    # relate two displacements of the plan.
+                    if abs(image_sign) != 1 or not np.allclose(
+                        rotation @ axes[axis], image_sign * axes[axis], atol=1e-6
+                    ):
+                        continue
+                    source = sources.get((atom_idx, axis, sign * image_sign))
+                    if source is not None and source[1] == 0:
+                        sources[(atom_idx, axis, sign)] = (source[0], op_idx)
+                        break
+                else:
+                    sources[(atom_idx, axis, sign)] = (len(displacements), 0)
+                    displacements.append((atom_idx, sign * step * axes[axis]))
+    return {
+        "group": symmetry["group"] if symmetry else "C1",
+        "axes": axes,
+        "operations": operations,
+        "orbit": orbit,
+        "representatives": representatives,
+        "displacements": displacements,
+        "sources": sources,
+        "step": step,
+    }
+
+
+def _displaced_positions(base_positions, plan):
+    import numpy as np
+
+    batch = np.broadcast_to(base_positions, (len(plan["displacements"]),) + base_positions.shape)
+    batch = batch.copy()
+    for index, (atom_idx, vector) in enumerate(plan["displacements"]):
+        batch[index, atom_idx] += vector
+    return batch
+
+
+def _expand_displacement_hessian(gradients, plan):
+    import numpy as np
+
+    natoms = gradients.shape[1]
+    operations = plan["operations"]
+    hessian = np.zeros((natoms, natoms, 3, 3))
+
+    def _gradient_for(atom_idx, axis, sign):
+        index, op_idx = plan["sources"][(atom_idx, axis, sign)]
+        rotation, permutation = operations[op_idx]
+        transformed = np.empty_like(gradients[index])
+        transformed[permutation] = gradients[index] @ rotation.T
+        return transformed
+
+    for atom_idx in plan["representatives"]:
+        derivative = np.stack(
+            [
+                (_gradient_for(atom_idx, axis, 1) - _gradient_for(atom_idx, axis, -1))
+                / (2.0 * plan["step"])
+                for axis in range(3)
+            ]
+        )
+        # rows[j, y, x] = d grad[j, y] / d x[atom_idx, x]
+        rows = np.einsum("kx,kjy->jyx", plan["axes"], derivative)
+        for image, (representative, op_idx) in enumerate(plan["orbit"]):
+            if representative != atom_idx:
+                continue
+            rotation, permutation = operations[op_idx]
+            hessian[permutation, image] = np.einsum(
+                "yp,jpq,xq->jyx", rotation, rows, rotation
+            )
     return hessian
 
 
+def _evaluate_dispersion_forces_batch(dispersion_settings, numbers, positions_batch):
+    import numpy as np
+    from ase import Atoms
+
+    atoms = Atoms(numbers=numbers, positions=positions_batch[0])
+    atoms.calc, _ = _build_dispersion_calculator(atoms, dispersion_settings)
+    forces = []
+    for positions in positions_batch:
+        atoms.set_positions(positions)
+        forces.append(atoms.get_forces())
+    return np.asarray(forces)
+
+
+def _resolve_dispersion_hessian_workers(natoms, task_count):
+    if natoms < DISPERSION_HESSIAN_PARALLEL_MIN_ATOMS:
+        return 1
+    try:
+        from pyscf import lib as pyscf_lib
+
+        thread_budget = pyscf_lib.num_threads()
+    except ImportError:
+        thread_budget = os.cpu_count() or 1
+    return max(1, min(thread_budget, task_count))
+
+
+def _analytic_dispersion_hessian(atoms):
+    import numpy as np
+
+    get_hessian = getattr(atoms.calc, "get_hessian", None)
+    if get_hessian is None:
+        return None
+    natoms = len(atoms)
+    hessian = np.asarray(get_hessian(atoms), dtype=float)
+    return hessian.reshape(natoms, 3, natoms, 3).transpose(0, 2, 1, 3).copy()
+
+
+def _compute_dispersion_hessian_numerical(
+    atoms, step, dispersion_settings=None, profiling=None
+):
+    import numpy as np
+
+    analytic = _analytic_dispersion_hessian(atoms)
+    if analytic is not None:
+        if profiling is not None:
+            profiling["dispersion_hessian_method"] = "analytic"
+        return analytic
+    base_positions = atoms.get_positions()
+    natoms = len(base_positions)
+    plan = _build_displacement_plan(
+        natoms,
+        step,
+        _detect_displacement_symmetry(atoms.get_chemical_symbols(), base_positions),
+    )
+    displaced = _displaced_positions(base_positions, plan)
+    workers = 1
+    if dispersion_settings is not None:
+        workers = _resolve_dispersion_hessian_workers(natoms, len(displaced))
+    if workers > 1:
+        import concurrent.futures
+
+        batches = np.array_split(displaced, workers)
+        # Called after the SCF has run in this process, so workers must not fork.
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, mp_context=_speculative_scf_context()
+        ) as executor:
+            forces = np.concatenate(
+                list(
+                    executor.map(
+                        _evaluate_dispersion_forces_batch,
+                        [dispersion_settings] * len(batches),
+                        [atoms.get_atomic_numbers()] * len(batches),
+                        batches,
+                    )
+                )
+            )
+    else:
+        forces = np.empty_like(displaced)
+        for index, positions in enumerate(displaced):
+            atoms.set_positions(positions)
+            forces[index] = atoms.get_forces()
+        atoms.set_positions(base_positions)
+    if profiling is not None:
+        profiling["dispersion_hessian_method"] = "numerical"
+        profiling["dispersion_hessian_workers"] = workers
+        profiling["dispersion_hessian_symmetry"] = plan["group"]
+        profiling["dispersion_hessian_displacements"] = len(displaced)
+    return _expand_displacement_hessian(-forces, plan)
+
+
 def _prepare_frequency_dispersion_payload(
     *,
     mol_freq,
@@ -1102,7 +1967,9 @@ def _prepare_frequency_dispersion_payload(
     if dispersion_hessian_mode == "numerical":
         step = dispersion_hessian_step if dispersion_hessian_step is not None else 0.005
         dispersion_hessian_start = time.perf_counter() if profiling else None
-        dispersion_hessian = _compute_dispersion_hessian_numerical(atoms, step)
+        dispersion_hessian = _compute_dispersion_hessian_numerical(
+            atoms, step, dispersion_settings, profiling
+        )
         if dispersion_hessian_start is not None:
             profiling["dispersion_hessian_seconds"] = (
                 time.perf_counter() - dispersion_hessian_start
@@ -1335,6 +2202,7 @@ def _build_ts_quality_payload(
     mol_freq,
     atomic_masses,
     atomic_numbers,
+    mode=None,
 ):
     ts_quality_settings = {}
     if ts_quality is not None:
@@ -1397,12 +2265,13 @@ def _build_ts_quality_payload(
     }
     if internal_coordinates:
         try:
-            mode_result = _extract_imaginary_mode_from_hessian(
-                hess, mol_freq, atomic_masses, atomic_numbers
-            )
+            if mode is None:
+                mode = _extract_imaginary_mode_from_hessian(
+                    hess, mol_freq, atomic_masses, atomic_numbers
+                )["mode"]
             alignment_result = _project_imaginary_mode_to_internal_coordinates(
                 positions=mol_freq.atom_coords(unit="Angstrom"),
-                mode=mode_result["mode"],
+                mode=mode,
                 internal_coordinates=internal_coordinates,
                 projection_step=projection_step,
                 projection_min_abs=projection_min_abs,
@@ -1547,14 +2416,15 @@ def _run_frequency_scf(
     run_dir,
     label,
     profiling,
+    dm0=None,
 ):
     scf_start = time.perf_counter() if profiling else None
     energy, mf_freq, info = _run_scf_with_retries(
-        lambda scf_settings: _build_frequency_mf(
+        _SCFBuilderSpec(
+            _build_frequency_mf,
             mol_freq=mol_freq,
             dft_module=dft_module,
             xc=xc,
-            scf_settings=scf_settings,
             solvent_model=solvent_model,
             solvent_name=solvent_name,
             solvent_eps=solvent_eps,
@@ -1567,6 +2437,7 @@ def _run_frequency_scf(
         scf_config,
         run_dir,
         label,
+        dm0=dm0,
     )
     if scf_start is not None:
         elapsed = time.perf_counter() - scf_start
@@ -1577,13 +2448,103 @@ def _run_frequency_scf(
     return energy, mf_freq, info
 
 
-def _compute_hessian_with_timing(mf_handle, pyscf_hessian, profiling):
-    hess_start = time.perf_counter() if profiling else None
-    if hasattr(mf_handle, "Hessian"):
-        hess_value = mf_handle.Hessian().kernel()
-    else:
-        hess_value = pyscf_hessian.Hessian(mf_handle).kernel()
-    hess_seconds = None
+HESSIAN_STORE_DIRNAME = "hessian_store"
+HESSIAN_STORE_DECIMALS = 6
+# SCF keys that change how convergence is reached, not the converged Hessian.
+_HESSIAN_STORE_IGNORED_SCF_KEYS = ("chkfile", "retry_preset", "retry_parallel", "result_cache")
+
+
+def hessian_store_key(
+    symbols,
+    positions_angstrom,
+    *,
+    basis,
+    xc,
+    scf_config,
+    solvent_model,
+    solvent_name,
+    solvent_eps,
+    charge,
+    spin,
+    ks_type,
+):
+    import numpy as np
+
+    positions = np.round(np.asarray(positions_angstrom, dtype=float), HESSIAN_STORE_DECIMALS)
+    scf_payload = {
+        key: value
+        for key, value in (scf_config or {}).items()
+        if key not in _HESSIAN_STORE_IGNORED_SCF_KEYS
+    }
+    return compute_method_fingerprint(
+        {
+            "symbols": list(symbols),
+            # Adding 0.0 folds -0.0 into 0.0 so mirrored zeros share a key.
+            "positions": (positions + 0.0).tolist(),
+            "basis": basis,
+            "xc": normalize_xc_functional(xc),
+            "scf": scf_payload,
+            "solvent_model": solvent_model.lower() if solvent_model else None,
+            "solvent_name": solvent_name if solvent_model else None,
+            "solvent_eps": solvent_eps if solvent_model else None,
+            "charge": charge,
+            "spin": spin,
+            "ks_type": ks_type,
+        }
+    )
+
+
+def _hessian_store_key_for_mol(mol, **method):
+    symbols = [mol.atom_symbol(index) for index in range(mol.natm)]
+    return hessian_store_key(
+        symbols,
+        mol.atom_coords(unit="Angstrom"),
+        basis=mol.basis,
+        charge=mol.charge,
+        spin=mol.spin,
+        **method,
+    )
+
+
+def _hessian_store_path(run_dir, key):
+    return os.path.join(run_dir, HESSIAN_STORE_DIRNAME, f"{key}.npy")
+
+
+def load_stored_hessian(run_dir, key):
+    import numpy as np
+
+    if not run_dir or not key:
+        return None
+    path = _hessian_store_path(run_dir, key)
+    if not os.path.exists(path):
+        return None
+    try:
+        return np.load(path, allow_pickle=False)
+    except (OSError, ValueError) as exc:
+        logging.warning("Ignoring unreadable stored Hessian %s: %s", path, exc)
+        return None
+
+
+def save_stored_hessian(run_dir, key, hess):
+    import numpy as np
+
+    if not run_dir or not key:
+        return None
+    path = _hessian_store_path(run_dir, key)
+    ensure_parent_dir(path)
+    tmp_path = f"{path}.tmp.npy"
+    np.save(tmp_path, np.asarray(hess), allow_pickle=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _compute_hessian_with_timing(mf_handle, pyscf_hessian, profiling):
+    hess_start = time.perf_counter() if profiling else None
+    if hasattr(mf_handle, "Hessian"):
+        hess_value = mf_handle.Hessian().kernel()
+    else:
+        hess_value = pyscf_hessian.Hessian(mf_handle).kernel()
+    hess_seconds = None
     if hess_start is not None:
         hess_seconds = time.perf_counter() - hess_start
     return hess_value, hess_seconds
@@ -1657,6 +2618,392 @@ def _run_frequency_hessian_with_retry(
     return energy, mf_freq, dispersion_info, dispersion_hessian, hess
 
 
+NUMERICAL_HESSIAN_DIRNAME = "numerical_hessian"
+NUMERICAL_HESSIAN_MANIFEST_NAME = "manifest.json"
+NUMERICAL_HESSIAN_DEFAULT_STEP = 0.005
+NUMERICAL_HESSIAN_POLL_SECONDS = 5.0
+NUMERICAL_HESSIAN_CLAIM_TIMEOUT = 6 * 3600.0
+# Give up when no new gradient has appeared for this long; this outlasts the
+# claim timeout so stale claims get reclaimed before the wait fails.
+NUMERICAL_HESSIAN_WAIT_TIMEOUT = 2 * NUMERICAL_HESSIAN_CLAIM_TIMEOUT
+
+
+def _numerical_hessian_point_result_path(hessian_dir, index):
+    return os.path.join(hessian_dir, f"point_{index:04d}.json")
+
+
+def _write_json_atomic(path, payload):
+    ensure_parent_dir(path)
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _write_numerical_hessian_manifest(
+    *,
+    manifest_path,
+    hessian_dir,
+    key,
+    mol_freq,
+    plan,
+    reference_dm,
+    settings,
+):
+    points = [
+        {
+            "index": index,
+            "atom": atom_idx,
+            "displacement": vector.tolist(),
+            "result_file": _numerical_hessian_point_result_path(hessian_dir, index),
+        }
+        for index, (atom_idx, vector) in enumerate(plan["displacements"])
+    ]
+    payload = {
+        "schema_version": 1,
+        "generated_at": datetime.now().isoformat(),
+        "key": key,
+        "hessian_dir": hessian_dir,
+        "molecule": mol_freq.dumps(),
+        "positions_bohr": mol_freq.atom_coords().tolist(),
+        "step_bohr": plan["step"],
+        "symmetry": plan["group"],
+        "reference_dm": reference_dm,
+        "settings": settings,
+        "points": points,
+        "command_template": [
+            "dftflow",
+            "frequency-point",
+            "--manifest",
+            manifest_path,
+            "--index",
+            "{index}",
+        ],
+    }
+    _write_json_atomic(manifest_path, payload)
+    return payload
+
+
+def _load_numerical_hessian_gradient(result_path, key):
+    import numpy as np
+
+    if not os.path.exists(result_path):
+        return None
+    try:
+        with open(result_path, "r", encoding="utf-8") as handle:
+            result = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if result.get("key") != key:
+        return None
+    return np.asarray(result["gradient"], dtype=float)
+
+
+def _numerical_hessian_claim_is_stale(claim_path):
+    try:
+        with open(claim_path, "r", encoding="utf-8") as handle:
+            claim = json.load(handle)
+    except (OSError, ValueError):
+        return True
+    if time.time() - float(claim.get("claimed_at") or 0.0) > NUMERICAL_HESSIAN_CLAIM_TIMEOUT:
+        return True
+    if claim.get("host") != socket.gethostname():
+        return False
+    try:
+        os.kill(int(claim.get("pid")), 0)
+    except ProcessLookupError:
+        return True
+    except (PermissionError, TypeError, ValueError):
+        return False
+    return False
+
+
+def _claim_numerical_hessian_point(claim_path):
+    for _ in range(2):
+        try:
+            fd = os.open(claim_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if not _numerical_hessian_claim_is_stale(claim_path):
+                return False
+            logging.warning("Reclaiming stale numerical Hessian claim %s.", claim_path)
+            try:
+                os.remove(claim_path)
+            except FileNotFoundError:
+                pass
+            continue
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(
+                {"host": socket.gethostname(), "pid": os.getpid(), "claimed_at": time.time()},
+                handle,
+            )
+        return True
+    return False
+
+
+def _evaluate_numerical_hessian_gradient(manifest, point):
+    import numpy as np
+    from pyscf import dft, gto
+
+    settings = manifest.get("settings") or {}
+    positions = np.asarray(manifest["positions_bohr"], dtype=float)
+    positions[point["atom"]] += np.asarray(point["displacement"], dtype=float)
+    mol_point = gto.loads(manifest["molecule"])
+    mol_point.set_geom_(positions, unit="Bohr")
+    dm0 = None
+    reference_dm = manifest.get("reference_dm")
+    if reference_dm and os.path.exists(reference_dm):
+        dm0 = np.load(reference_dm, allow_pickle=False)
+
+    def _run(apply_density_fit):
+        energy, mf_point, _ = _run_frequency_scf(
+            mol_freq=mol_point,
+            dft_module=dft,
+            xc=settings.get("xc"),
+            scf_config=settings.get("scf_config"),
+            solvent_model=settings.get("solvent_model"),
+            solvent_name=settings.get("solvent_name"),
+            solvent_eps=settings.get("solvent_eps"),
+            apply_density_fit=apply_density_fit,
+            verbose=False,
+            optimizer_mode=settings.get("optimizer_mode"),
+            multiplicity=settings.get("multiplicity"),
+            log_override=False,
+            run_dir=None,
+            label=f"Numerical Hessian SCF (point {point['index']})",
+            profiling=None,
+            dm0=dm0,
+        )
+        return energy, mf_point, mf_point.nuc_grad_method().kernel()
+
+    try:
+        energy, mf_point, gradient = _run(True)
+    except Exception as exc:
+        if not is_density_fit_gradient_einsum_error(exc):
+            raise
+        logging.warning(
+            "Density-fitting gradient failed; retrying without density fitting."
+        )
+        energy, mf_point, gradient = _run(False)
+    return energy, _is_scf_converged(mf_point), np.asarray(gradient, dtype=float)
+
+
+def run_numerical_hessian_point(manifest_path, index, thread_count=None):
+    if not os.path.exists(manifest_path):
+        raise FileNotFoundError(f"Manifest file not found: {manifest_path}")
+    with open(manifest_path, "r", encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    points = manifest.get("points") or []
+    if not 0 <= index < len(points):
+        raise ValueError(f"Numerical Hessian point {index} not found in manifest.")
+    point = points[index]
+    result_path = point["result_file"]
+    if _load_numerical_hessian_gradient(result_path, manifest.get("key")) is not None:
+        return False
+    claim_path = f"{result_path}.claim"
+    if not _claim_numerical_hessian_point(claim_path):
+        return False
+    try:
+        if thread_count:
+            apply_thread_settings(thread_count)
+        energy, converged, gradient = _evaluate_numerical_hessian_gradient(manifest, point)
+        if not converged:
+            logging.warning("Numerical Hessian point %s SCF did not converge.", index)
+        _write_json_atomic(
+            result_path,
+            {
+                "key": manifest.get("key"),
+                "index": index,
+                "energy": energy,
+                "converged": converged,
+                "gradient": gradient.tolist(),
+            },
+        )
+    finally:
+        try:
+            os.remove(claim_path)
+        except FileNotFoundError:
+            pass
+    return True
+
+
+def _run_numerical_hessian_task(task):
+    manifest_path, index, thread_count = task
+    return run_numerical_hessian_point(manifest_path, index, thread_count=thread_count)
+
+
+def _resolve_numerical_hessian_workers(requested, task_count):
+    if requested:
+        return max(1, min(int(requested), task_count))
+    try:
+        from pyscf import lib as pyscf_lib
+
+        thread_budget = pyscf_lib.num_threads()
+    except ImportError:
+        thread_budget = os.cpu_count() or 1
+    return max(1, min(thread_budget, task_count))
+
+
+def _collect_numerical_hessian_gradients(manifest_path, manifest):
+    import numpy as np
+
+    points = manifest["points"]
+    key = manifest["key"]
+    gradients = [None] * len(points)
+    deadline = time.monotonic() + NUMERICAL_HESSIAN_WAIT_TIMEOUT
+    previous_missing = None
+    while True:
+        missing = []
+        for point in points:
+            if gradients[point["index"]] is None:
+                gradients[point["index"]] = _load_numerical_hessian_gradient(
+                    point["result_file"], key
+                )
+            if gradients[point["index"]] is None:
+                missing.append(point["index"])
+        if not missing:
+            return np.asarray(gradients)
+        if previous_missing is None or len(missing) < previous_missing:
+            deadline = time.monotonic() + NUMERICAL_HESSIAN_WAIT_TIMEOUT
+        elif time.monotonic() >= deadline:
+            raise RuntimeError(
+                "Timed out waiting for numerical Hessian points "
+                f"{missing} from other workers (no progress for "
+                f"{NUMERICAL_HESSIAN_WAIT_TIMEOUT:.0f} s); check the workers or "
+                f"remove their claim files next to {manifest_path}."
+            )
+        previous_missing = len(missing)
+        # Pick up anything unclaimed; claimed points belong to other workers.
+        evaluated = False
+        for index in missing:
+            evaluated = run_numerical_hessian_point(manifest_path, index) or evaluated
+        if not evaluated:
+            logging.info(
+                "Waiting for %s numerical Hessian points from other workers.",
+                len(missing),
+            )
+            time.sleep(NUMERICAL_HESSIAN_POLL_SECONDS)
+
+
+def _compute_numerical_frequency_hessian(
+    *,
+    mf_freq,
+    mol_freq,
+    xc,
+    scf_config,
+    solvent_model,
+    solvent_name,
+    solvent_eps,
+    optimizer_mode,
+    multiplicity,
+    run_dir,
+    store_key,
+    hessian_settings,
+    profiling,
+):
+    import numpy as np
+    from pyscf.data import nist
+
+    hess_start = time.perf_counter() if profiling else None
+    step = hessian_settings.get("step") or NUMERICAL_HESSIAN_DEFAULT_STEP
+    step_bohr = step / nist.BOHR
+    if run_dir:
+        hessian_dir = resolve_run_path(run_dir, NUMERICAL_HESSIAN_DIRNAME)
+    else:
+        hessian_dir = tempfile.mkdtemp(prefix="dftflow_numerical_hessian_")
+    try:
+        os.makedirs(hessian_dir, exist_ok=True)
+        manifest_path = os.path.join(hessian_dir, NUMERICAL_HESSIAN_MANIFEST_NAME)
+        symbols = [mol_freq.atom_symbol(index) for index in range(mol_freq.natm)]
+        plan = _build_displacement_plan(
+            mol_freq.natm,
+            step_bohr,
+            _detect_displacement_symmetry(symbols, mol_freq.atom_coords()),
+        )
+        reference_dm = None
+        if _is_scf_converged(mf_freq):
+            reference_dm = os.path.join(hessian_dir, "reference_dm.npy")
+            np.save(reference_dm, np.asarray(mf_freq.make_rdm1()), allow_pickle=False)
+        # Workers run concurrently, so they must not share the frequency chkfile.
+        worker_scf_config = {
+            key: value for key, value in (scf_config or {}).items() if key != "chkfile"
+        }
+        manifest = _write_numerical_hessian_manifest(
+            manifest_path=manifest_path,
+            hessian_dir=hessian_dir,
+            key=f"{store_key}:{step_bohr:.8f}:{plan['group']}",
+            mol_freq=mol_freq,
+            plan=plan,
+            reference_dm=reference_dm,
+            settings={
+                "xc": xc,
+                "scf_config": worker_scf_config,
+                "solvent_model": solvent_model,
+                "solvent_name": solvent_name,
+                "solvent_eps": solvent_eps,
+                "optimizer_mode": optimizer_mode,
+                "multiplicity": multiplicity,
+            },
+        )
+        pending = [
+            point["index"]
+            for point in manifest["points"]
+            if _load_numerical_hessian_gradient(point["result_file"], manifest["key"]) is None
+        ]
+        workers = _resolve_numerical_hessian_workers(
+            hessian_settings.get("workers"), max(1, len(pending))
+        )
+        logging.info(
+            "Numerical Hessian: %s of %s displaced gradients pending (%s workers); "
+            "manifest at %s.",
+            len(pending),
+            len(manifest["points"]),
+            workers,
+            manifest_path,
+        )
+        if workers > 1 and pending:
+            import concurrent.futures
+
+            try:
+                from pyscf import lib as pyscf_lib
+
+                thread_budget = pyscf_lib.num_threads()
+            except ImportError:
+                thread_budget = os.cpu_count() or 1
+            threads_per_worker = max(1, thread_budget // workers)
+            # The frequency SCF already ran here, so workers must not fork.
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, mp_context=_speculative_scf_context()
+            ) as executor:
+                list(
+                    executor.map(
+                        _run_numerical_hessian_task,
+                        [(manifest_path, index, threads_per_worker) for index in pending],
+                    )
+                )
+        gradients = _collect_numerical_hessian_gradients(manifest_path, manifest)
+        hess = _expand_displacement_hessian(gradients, plan)
+        hess = 0.5 * (hess + hess.transpose(1, 0, 3, 2))
+        if hess_start is not None:
+            profiling["hessian_seconds"] = (profiling["hessian_seconds"] or 0.0) + (
+                time.perf_counter() - hess_start
+            )
+        hessian_info = {
+            "method": "numerical",
+            "step": step,
+            "points": len(manifest["points"]),
+            "full_points": 6 * mol_freq.natm,
+            "symmetry": plan["group"],
+            "evaluated": len(pending),
+            "workers": workers,
+            "manifest": manifest_path if run_dir else None,
+        }
+        return hess, hessian_info
+    finally:
+        # Without a run directory nothing can resume from the manifest.
+        if not run_dir:
+            shutil.rmtree(hessian_dir, ignore_errors=True)
+
+
 def _project_frequency_constraints(*, hess, mol_freq, atoms, atoms_cls, constraints):
     if not constraints:
         return hess, None, atoms
@@ -1720,6 +3067,8 @@ def _build_frequency_result_payload(
     thermochemistry,
     constraint_projection,
     profiling,
+    scf_retry=None,
+    hessian_info=None,
 ):
     result = {
         "energy": energy,
@@ -1740,6 +3089,10 @@ def _build_frequency_result_payload(
         "thermochemistry": thermochemistry,
         "constraint_projection": constraint_projection,
     }
+    if scf_retry:
+        result["scf_retry"] = scf_retry
+    if hessian_info:
+        result["hessian"] = hessian_info
     if profiling:
         result["profiling"] = profiling
     return result
@@ -1767,6 +3120,8 @@ def compute_frequencies(
     ts_quality=None,
     profiling_enabled=False,
     log_override=True,
+    hessian_settings=None,
+    guess_chkfile=None,
 ):
     from ase import units
     from ase import Atoms
@@ -1813,29 +3168,82 @@ def compute_frequencies(
         run_dir=run_dir,
         label="Frequency SCF",
         profiling=profiling,
+        dm0=_resolve_projected_density_guess(
+            mol_freq,
+            scf_config,
+            run_dir,
+            guess_chkfile,
+            select_ks_type(
+                mol=mol_freq,
+                scf_config=scf_config,
+                optimizer_mode=optimizer_mode,
+                multiplicity=multiplicity,
+                log_override=False,
+            ),
+            "Frequency SCF",
+        ),
+    )
+    store_key = _hessian_store_key_for_mol(
+        mol_freq,
+        xc=xc,
+        scf_config=scf_config,
+        solvent_model=solvent_model,
+        solvent_name=solvent_name,
+        solvent_eps=solvent_eps,
+        ks_type=select_ks_type(
+            mol=mol_freq,
+            scf_config=scf_config,
+            optimizer_mode=optimizer_mode,
+            multiplicity=multiplicity,
+            log_override=False,
+        ),
     )
-    energy, mf_freq, dispersion_info, dispersion_hessian, hess = (
-        _run_frequency_hessian_with_retry(
-            energy=energy,
+    hessian_settings = hessian_settings or {}
+    hessian_info = None
+    if hessian_settings.get("method") == "numerical":
+        energy, dispersion_info, dispersion_hessian = _apply_dispersion_payload(
+            energy, dispersion_payload
+        )
+        hess, hessian_info = _compute_numerical_frequency_hessian(
             mf_freq=mf_freq,
-            scf_info=scf_info,
-            dispersion_payload=dispersion_payload,
             mol_freq=mol_freq,
-            dft_module=dft,
-            pyscf_hessian=pyscf_hessian,
             xc=xc,
             scf_config=scf_config,
             solvent_model=solvent_model,
             solvent_name=solvent_name,
             solvent_eps=solvent_eps,
-            verbose=verbose,
             optimizer_mode=optimizer_mode,
             multiplicity=multiplicity,
-            log_override=log_override,
             run_dir=run_dir,
+            store_key=store_key,
+            hessian_settings=hessian_settings,
             profiling=profiling,
         )
-    )
+    else:
+        energy, mf_freq, dispersion_info, dispersion_hessian, hess = (
+            _run_frequency_hessian_with_retry(
+                energy=energy,
+                mf_freq=mf_freq,
+                scf_info=scf_info,
+                dispersion_payload=dispersion_payload,
+                mol_freq=mol_freq,
+                dft_module=dft,
+                pyscf_hessian=pyscf_hessian,
+                xc=xc,
+                scf_config=scf_config,
+                solvent_model=solvent_model,
+                solvent_name=solvent_name,
+                solvent_eps=solvent_eps,
+                verbose=verbose,
+                optimizer_mode=optimizer_mode,
+                multiplicity=multiplicity,
+                log_override=log_override,
+                run_dir=run_dir,
+                profiling=profiling,
+            )
+        )
+    if _is_scf_converged(mf_freq):
+        save_stored_hessian(run_dir, store_key, hess)
     if dispersion_hessian is not None:
         hess = hess + dispersion_hessian
     hess, constraint_projection, atoms = _project_frequency_constraints(
@@ -1885,6 +3293,8 @@ def compute_frequencies(
         thermochemistry=thermochemistry,
         constraint_projection=constraint_projection,
         profiling=profiling,
+        scf_retry=scf_info.get("scf_retry"),
+        hessian_info=hessian_info,
     )
 
 
@@ -1895,6 +3305,7 @@ def _init_imaginary_mode_profiling(profiling_enabled):
         "scf_seconds": None,
         "scf_cycles": None,
         "hessian_seconds": None,
+        "dispersion_hessian_seconds": None,
     }
 
 
@@ -2027,6 +3438,7 @@ def _compute_imaginary_mode_dispersion_hessian(
     xc,
     dispersion_hessian_step,
     dispersion_params,
+    profiling=None,
 ):
     atoms = _atoms_from_molecule(mol_mode, atoms_cls)
     dispersion_settings = parse_dispersion_settings(
@@ -2041,7 +3453,14 @@ def _compute_imaginary_mode_dispersion_hessian(
     )
     atoms.calc = dispersion_calc
     step = dispersion_hessian_step if dispersion_hessian_step is not None else 0.005
-    dispersion_hessian = _compute_dispersion_hessian_numerical(atoms, step)
+    dispersion_hessian_start = time.perf_counter() if profiling else None
+    dispersion_hessian = _compute_dispersion_hessian_numerical(
+        atoms, step, dispersion_settings, profiling
+    )
+    if dispersion_hessian_start is not None:
+        profiling["dispersion_hessian_seconds"] = (
+            time.perf_counter() - dispersion_hessian_start
+        )
     return dispersion_hessian * ((1.0 / units_module.Hartree) / (units_module.Bohr ** 2))
 
 
@@ -2090,6 +3509,32 @@ def _prepare_capability_check_molecule(mol, basis, memory_mb):
     return mol_check
 
 
+def _build_capability_probe_molecule(mol_check):
+    # One atom per distinct element (basis labels kept) on a 2 A chain, with the
+    # charge nudged so the electron-count parity, and hence RKS/UKS, is preserved.
+    labels = []
+    nuclear_charges = {}
+    for index in range(mol_check.natm):
+        label = mol_check.atom_symbol(index)
+        if label not in nuclear_charges:
+            labels.append(label)
+            nuclear_charges[label] = int(mol_check.atom_charge(index))
+    if len(labels) == 1:
+        labels.append(labels[0])
+    electrons = sum(nuclear_charges[label] for label in labels)
+    charge = 0 if electrons % 2 == mol_check.nelectron % 2 else 1
+    electrons -= charge
+    spin = mol_check.spin if mol_check.spin <= electrons else electrons % 2
+    probe = mol_check.copy()
+    probe.atom = [(label, (0.0, 0.0, 2.0 * index)) for index, label in enumerate(labels)]
+    probe.unit = "Angstrom"
+    probe.charge = charge
+    probe.spin = spin
+    probe.symmetry = False
+    probe.build()
+    return probe
+
+
 def _validate_capability_dispersion(mol_check, dispersion, xc, dispersion_params):
     if dispersion is None:
         return
@@ -2199,6 +3644,224 @@ def _run_capability_hessian_with_retry(
     return mf_check, density_fit_applied
 
 
+def _gradient_scanner_with_fallback(mf_mode, build_without_density_fit, mol_mode):
+    scanner = mf_mode.nuc_grad_method().as_scanner()
+    try:
+        _, gradient = scanner(mol_mode)
+    except Exception as exc:
+        if not is_density_fit_gradient_einsum_error(exc):
+            raise
+        logging.warning(
+            "Density-fitting gradient failed; retrying without density fitting."
+        )
+        scanner = build_without_density_fit().nuc_grad_method().as_scanner()
+        _, gradient = scanner(mol_mode)
+    return scanner, gradient
+
+
+def _compute_imaginary_mode_iteratively(
+    *,
+    mol_mode,
+    dft_module,
+    xc,
+    scf_config,
+    solvent_model,
+    solvent_name,
+    solvent_eps,
+    verbose,
+    ks_type,
+    run_dir,
+    masses,
+    dispersion_hessian,
+    constraint_jacobians,
+    method,
+    nroots,
+    step,
+    profiling,
+):
+    import numpy as np
+
+    def _build(apply_density_fit):
+        mf_mode, _ = _build_imaginary_mode_mf(
+            mol_mode=mol_mode,
+            dft_module=dft_module,
+            xc=xc,
+            scf_config=scf_config,
+            solvent_model=solvent_model,
+            solvent_name=solvent_name,
+            solvent_eps=solvent_eps,
+            apply_density_fit=apply_density_fit,
+            verbose=verbose,
+            ks_type=ks_type,
+        )
+        _run_imaginary_mode_scf(mf_mode, scf_config, run_dir, profiling)
+        return mf_mode
+
+    solver_start = time.perf_counter() if profiling else None
+    scanner, reference_gradient = _gradient_scanner_with_fallback(
+        _build(True), lambda: _build(False), mol_mode
+    )
+    reference_gradient = np.asarray(reference_gradient, dtype=float).ravel()
+    reference_coords = mol_mode.atom_coords()
+    sqrt_mass = np.sqrt(np.repeat(np.asarray(masses, dtype=float), 3))
+    dispersion_flat = None
+    if dispersion_hessian is not None:
+        natm = mol_mode.natm
+        dispersion_flat = np.asarray(dispersion_hessian).transpose(0, 2, 1, 3).reshape(
+            natm * 3, natm * 3
+        )
+    gradient_count = {"value": 1}
+
+    def _matvec(vector_mw):
+        displacement = vector_mw / sqrt_mass
+        norm = np.linalg.norm(displacement)
+        displaced = reference_coords + (step / norm) * displacement.reshape(-1, 3)
+        _, gradient = scanner(mol_mode.set_geom_(displaced, unit="Bohr", inplace=False))
+        gradient_count["value"] += 1
+        if not getattr(scanner, "converged", True):
+            logging.warning("Mode solver SCF did not converge at a displaced geometry.")
+        product = (np.asarray(gradient, dtype=float).ravel() - reference_gradient) * (
+            norm / step
+        )
+        if dispersion_flat is not None:
+            product = product + dispersion_flat @ displacement
+        return product / sqrt_mass
+
+    eigenvalues, modes, info = _solve_lowest_modes(
+        matvec=_matvec,
+        mol=mol_mode,
+        masses=masses,
+        method=method,
+        nroots=nroots,
+        tol=MODE_SOLVER_DEFAULT_TOL,
+        max_iterations=MODE_SOLVER_MAX_ITERATIONS,
+        constraint_jacobians=constraint_jacobians,
+    )
+    if not info["converged"]:
+        logging.warning(
+            "Lowest-mode %s solver stopped after %s iterations without converging "
+            "(residual %s).",
+            method,
+            info["iterations"],
+            ", ".join(f"{value:.2e}" for value in info["residual_norms"]),
+        )
+    if solver_start is not None:
+        profiling["hessian_seconds"] = (profiling["hessian_seconds"] or 0.0) + (
+            time.perf_counter() - solver_start
+        )
+    eigenvalues = [float(value) for value in eigenvalues]
+    solver_info = {
+        "method": method,
+        "step": step,
+        "gradients": gradient_count["value"],
+        "eigenvalues": eigenvalues,
+        "frequencies_wavenumber": [
+            _mass_weighted_eigenvalue_to_wavenumber(value) for value in eigenvalues
+        ],
+        **info,
+    }
+    logging.info(
+        "Lowest-mode %s solver used %s gradients; lowest frequencies: %s cm^-1.",
+        method,
+        solver_info["gradients"],
+        ", ".join(f"{value:.1f}" for value in solver_info["frequencies_wavenumber"]),
+    )
+    return eigenvalues, modes, solver_info
+
+
+def _compute_imaginary_mode_without_hessian(
+    *,
+    mol_mode,
+    dft_module,
+    xc,
+    scf_config,
+    solvent_model,
+    solvent_name,
+    solvent_eps,
+    verbose,
+    ks_type,
+    run_dir,
+    dispersion,
+    dispersion_hessian_step,
+    dispersion_params,
+    constraints,
+    optimizer_mode,
+    ts_quality,
+    method,
+    nroots,
+    profiling,
+):
+    from ase import Atoms, units
+    from ase.data import atomic_masses, atomic_numbers
+
+    symbols = [mol_mode.atom_symbol(i) for i in range(mol_mode.natm)]
+    masses = [atomic_masses[atomic_numbers[symbol]] for symbol in symbols]
+    dispersion_hessian = None
+    if dispersion is not None:
+        dispersion_hessian = _compute_imaginary_mode_dispersion_hessian(
+            mol_mode=mol_mode,
+            atoms_cls=Atoms,
+            units_module=units,
+            dispersion=dispersion,
+            xc=xc,
+            dispersion_hessian_step=dispersion_hessian_step,
+            dispersion_params=dispersion_params,
+            profiling=profiling,
+        )
+    constraint_jacobians = None
+    if constraints:
+        constraint_jacobians = _collect_constraint_jacobians(
+            _atoms_from_molecule(mol_mode, Atoms), constraints
+        )
+    eigenvalues, modes, solver_info = _compute_imaginary_mode_iteratively(
+        mol_mode=mol_mode,
+        dft_module=dft_module,
+        xc=xc,
+        scf_config=scf_config,
+        solvent_model=solvent_model,
+        solvent_name=solvent_name,
+        solvent_eps=solvent_eps,
+        verbose=verbose,
+        ks_type=ks_type,
+        run_dir=run_dir,
+        masses=masses,
+        dispersion_hessian=dispersion_hessian,
+        constraint_jacobians=constraint_jacobians,
+        method=method,
+        nroots=nroots,
+        step=MODE_SOLVER_DEFAULT_STEP,
+        profiling=profiling,
+    )
+    result = {
+        "mode": modes[0],
+        "eigenvalue": eigenvalues[0],
+        "natoms": mol_mode.natm,
+        "symbols": symbols,
+        "modes": modes,
+        "hessian_source": "mode_solver",
+        "mode_solver": solver_info,
+    }
+    if ts_quality is not None or optimizer_mode == "transition_state":
+        frequencies = solver_info["frequencies_wavenumber"]
+        imaginary = [value for value in frequencies if value < 0]
+        # The count is only known once a real mode bounds the imaginary ones.
+        imaginary_count = len(imaginary) if len(imaginary) < len(frequencies) else None
+        result["ts_quality"] = _build_ts_quality_payload(
+            ts_quality=ts_quality,
+            optimizer_mode=optimizer_mode,
+            imaginary_frequencies=imaginary,
+            imaginary_count=imaginary_count,
+            hess=None,
+            mol_freq=mol_mode,
+            atomic_masses=atomic_masses,
+            atomic_numbers=atomic_numbers,
+            mode=modes[0],
+        )
+    return _finalize_imaginary_mode_result(
+        result, hess=None, profiling=profiling, return_hessian=False
+    )
+
+
 def compute_imaginary_mode(
     mol,
     basis,
@@ -2219,6 +3882,9 @@ def compute_imaginary_mode(
     profiling_enabled=False,
     log_override=True,
     return_hessian=False,
+    mode_solver=None,
+    mode_count=None,
+    ts_quality=None,
 ):
     try:
         from ase import Atoms, units
@@ -2239,20 +3905,58 @@ def compute_imaginary_mode(
         multiplicity=multiplicity,
         log_override=log_override,
     )
-    hess = _run_imaginary_mode_hessian_with_retry(
-        mol_mode=mol_mode,
-        dft_module=dft,
-        pyscf_hessian=pyscf_hessian,
+    store_key = _hessian_store_key_for_mol(
+        mol_mode,
         xc=xc,
         scf_config=scf_config,
         solvent_model=solvent_model,
         solvent_name=solvent_name,
         solvent_eps=solvent_eps,
-        verbose=verbose,
         ks_type=ks_type,
-        run_dir=run_dir,
-        profiling=profiling,
     )
+    hess = load_stored_hessian(run_dir, store_key)
+    if hess is not None and hess.shape == (mol_mode.natm, mol_mode.natm, 3, 3):
+        logging.info("Reusing stored Hessian for the imaginary mode (%s).", store_key[:12])
+        hessian_source = "store"
+    elif mode_solver in ("davidson", "dimer"):
+        return _compute_imaginary_mode_without_hessian(
+            mol_mode=mol_mode,
+            dft_module=dft,
+            xc=xc,
+            scf_config=scf_config,
+            solvent_model=solvent_model,
+            solvent_name=solvent_name,
+            solvent_eps=solvent_eps,
+            verbose=verbose,
+            ks_type=ks_type,
+            run_dir=run_dir,
+            dispersion=dispersion,
+            dispersion_hessian_step=dispersion_hessian_step,
+            dispersion_params=dispersion_params,
+            constraints=constraints,
+            optimizer_mode=optimizer_mode,
+            ts_quality=ts_quality,
+            method=mode_solver,
+            nroots=mode_count or MODE_SOLVER_DEFAULT_ROOTS,
+            profiling=profiling,
+        )
+    else:
+        hess = _run_imaginary_mode_hessian_with_retry(
+            mol_mode=mol_mode,
+            dft_module=dft,
+            pyscf_hessian=pyscf_hessian,
+            xc=xc,
+            scf_config=scf_config,
+            solvent_model=solvent_model,
+            solvent_name=solvent_name,
+            solvent_eps=solvent_eps,
+            verbose=verbose,
+            ks_type=ks_type,
+            run_dir=run_dir,
+            profiling=profiling,
+        )
+        save_stored_hessian(run_dir, store_key, hess)
+        hessian_source = "computed"
     if dispersion is not None:
         dispersion_hessian = _compute_imaginary_mode_dispersion_hessian(
             mol_mode=mol_mode,
@@ -2262,6 +3966,7 @@ def compute_imaginary_mode(
             xc=xc,
             dispersion_hessian_step=dispersion_hessian_step,
             dispersion_params=dispersion_params,
+            profiling=profiling,
         )
         hess = hess + dispersion_hessian
 
@@ -2270,6 +3975,7 @@ def compute_imaginary_mode(
     result = _extract_imaginary_mode_from_hessian(
         hess, mol_mode, atomic_masses, atomic_numbers
     )
+    result["hessian_source"] = hessian_source
     return _finalize_imaginary_mode_result(
         result,
         hess=hess,
@@ -2295,10 +4001,13 @@ def run_capability_check(
     max_scf_cycles=1,
     optimizer_mode=None,
     multiplicity=None,
+    probe=False,
 ):
     from pyscf import dft, hessian as pyscf_hessian
 
     mol_check = _prepare_capability_check_molecule(mol, basis, memory_mb)
+    if probe:
+        mol_check = _build_capability_probe_molecule(mol_check)
     _validate_capability_dispersion(mol_check, dispersion, xc, dispersion_params)
     ks_type = select_ks_type(
         mol=mol_check,
@@ -183,6 +183,13 @@ def compute_text_hash(text, algorithm="sha256"):
     return hasher.hexdigest()
 
 
+def compute_method_fingerprint(payload, algorithm="sha256"):
+    if payload is None:
+        return None
+    text = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return compute_text_hash(text, algorithm=algorithm)
+
+
 def collect_git_metadata(base_path):
     if not base_path:
         return None
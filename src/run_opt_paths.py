@@ -15,5 +15,9 @@ def get_runs_base_dir() -> str:
     return os.path.join(get_app_base_dir(), "runs")
 
 
+def get_cache_base_dir() -> str:
+    return os.path.join(get_app_base_dir(), "cache")
+
+
 def get_smoke_runs_base_dir() -> str:
     return os.path.join(get_runs_base_dir(), "smoke")
@@ -0,0 +1,228 @@
+import json
+import logging
+import os
+import time
+from datetime import datetime
+
+from run_opt_metadata import compute_method_fingerprint, get_package_version
+from run_opt_paths import get_cache_base_dir
+
+
+RESULT_CACHE_DIRNAME = "results"
+RESULT_CACHE_SUFFIX = ".npz"
+RESULT_CACHE_DECIMALS = 6
+DEFAULT_RESULT_CACHE_MAX_MB = 2048
+# Prune below the limit so a burst of stores does not evict on every write.
+RESULT_CACHE_PRUNE_FRACTION = 0.9
+# SCF keys that change how convergence is reached, not the converged result.
+_RESULT_CACHE_IGNORED_SCF_KEYS = (
+    "chkfile",
+    "retry_preset",
+    "retry_parallel",
+    "result_cache",
+)
+
+
+def get_result_cache_dir():
+    return os.path.join(get_cache_base_dir(), RESULT_CACHE_DIRNAME)
+
+
+def result_cache_enabled(scf_config):
+    return bool((scf_config or {}).get("result_cache"))
+
+
+def result_cache_max_bytes():
+    value = os.environ.get("DFTFLOW_RESULT_CACHE_MAX_MB")
+    megabytes = DEFAULT_RESULT_CACHE_MAX_MB
+    if value is not None and value.strip():
+        try:
+            megabytes = float(value)
+        except ValueError:
+            logging.warning(
+                "Ignoring invalid DFTFLOW_RESULT_CACHE_MAX_MB=%r; using %s MB.",
+                value,
+                DEFAULT_RESULT_CACHE_MAX_MB,
+            )
+    return int(max(megabytes, 0.0) * 1024 * 1024)
+
+
+def result_cache_key(
+    symbols,
+    positions_angstrom,
+    *,
+    basis,
+    xc,
+    scf_config,
+    solvent_model,
+    solvent_name,
+    solvent_eps,
+    charge,
+    spin,
+    ks_type,
+):
+    import numpy as np
+
+    positions = np.round(np.asarray(positions_angstrom, dtype=float), RESULT_CACHE_DECIMALS)
+    scf_payload = {
+        key: value
+        for key, value in (scf_config or {}).items()
+        if key not in _RESULT_CACHE_IGNORED_SCF_KEYS
+    }
+    return compute_method_fingerprint(
+        {
+            "symbols": [str(symbol).strip().capitalize() for symbol in symbols],
+            # Adding 0.0 folds -0.0 into 0.0 so mirrored zeros share a key.
+            "positions": (positions + 0.0).tolist(),
+            "basis": basis,
+            "xc": xc,
+            "scf": scf_payload,
+            "solvent_model": solvent_model.lower() if solvent_model else None,
+            "solvent_name": solvent_name if solvent_model else None,
+            "solvent_eps": solvent_eps if solvent_model else None,
+            "charge": charge,
+            "spin": spin,
+            "ks_type": ks_type,
+            "pyscf": get_package_version("pyscf"),
+        }
+    )
+
+
+def _result_cache_path(key, cache_dir=None):
+    return os.path.join(cache_dir or get_result_cache_dir(), key[:2], key + RESULT_CACHE_SUFFIX)
+
+
+def load_cached_result(key, cache_dir=None):
+    import numpy as np
+
+    if not key:
+        return None
+    path = _result_cache_path(key, cache_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as payload:
+            result = {
+                "energy": float(payload["energy"]),
+                "converged": bool(payload["converged"]),
+                "gradient": payload["gradient"] if "gradient" in payload else None,
+                "density": payload["density"] if "density" in payload else None,
+                "metadata": json.loads(str(payload["metadata"])),
+            }
+    except (OSError, KeyError, ValueError) as exc:
+        logging.warning("Ignoring unreadable cached result %s: %s", path, exc)
+        return None
+    try:
+        # mtime doubles as the LRU timestamp.
+        os.utime(path)
+    except OSError:
+        pass
+    return result
+
+
+def store_cached_result(
+    key,
+    *,
+    energy,
+    converged,
+    gradient=None,
+    density=None,
+    metadata=None,
+    cache_dir=None,
+    max_bytes=None,
+):
+    import numpy as np
+
+    if not key:
+        return None
+    path = _result_cache_path(key, cache_dir)
+    arrays = {
+        "energy": np.asarray(float(energy)),
+        "converged": np.asarray(bool(converged)),
+        "metadata": np.asarray(
+            json.dumps(
+                {"created_at": datetime.now().isoformat(), **(metadata or {})},
+                default=str,
+            )
+        ),
+    }
+    if gradient is not None:
+        arrays["gradient"] = np.asarray(gradient, dtype=float)
+    if density is not None:
+        arrays["density"] = np.asarray(density, dtype=float)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as handle:
+            np.savez_compressed(handle, **arrays)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logging.warning("Failed to write cached result %s: %s", path, exc)
+        return None
+    limit = result_cache_max_bytes() if max_bytes is None else max_bytes
+    if limit:
+        prune_result_cache(
+            max_bytes=limit, cache_dir=cache_dir, target_fraction=RESULT_CACHE_PRUNE_FRACTION
+        )
+    return path
+
+
+def _iter_result_cache_entries(cache_dir=None):
+    root = cache_dir or get_result_cache_dir()
+    if not os.path.isdir(root):
+        return []
+    entries = []
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            if not filename.endswith(RESULT_CACHE_SUFFIX):
+                continue
+            path = os.path.join(dirpath, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()
+    return entries
+
+
+def result_cache_stats(cache_dir=None):
+    entries = _iter_result_cache_entries(cache_dir)
+    return {
+        "path": cache_dir or get_result_cache_dir(),
+        "entries": len(entries),
+        "size_bytes": sum(size for _, size, _ in entries),
+        "max_bytes": result_cache_max_bytes(),
+        "oldest_used": (
+            datetime.fromtimestamp(entries[0][0]).isoformat() if entries else None
+        ),
+        "newest_used": (
+            datetime.fromtimestamp(entries[-1][0]).isoformat() if entries else None
+        ),
+    }
+
+
+def prune_result_cache(
+    max_bytes=None, older_than_days=None, cache_dir=None, target_fraction=1.0
+):
+    entries = _iter_result_cache_entries(cache_dir)
+    total = sum(size for _, size, _ in entries)
+    cutoff = None
+    if older_than_days is not None:
+        cutoff = time.time() - older_than_days * 86400
+    target = None if max_bytes is None else max_bytes * target_fraction
+    removed = 0
+    freed = 0
+    for mtime, size, path in entries:
+        expired = cutoff is not None and mtime < cutoff
+        over_limit = max_bytes is not None and total > max_bytes and total - freed > target
+        if not (expired or over_limit):
+            if cutoff is None:
+                break
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        removed += 1
+        freed += size
+    return {"removed": removed, "freed_bytes": freed, "remaining_bytes": total - freed}
@@ -55,7 +55,9 @@ from .utils import (
     _prepare_frequency_scf_config,
     _recommend_density_fit,
     _resolve_d3_params,
+    _resolve_irc_mode_solver,
     _resolve_scf_chkfile,
+    _run_cached_capability_check,
     _warn_missing_chkfile,
 )
 
@@ -458,12 +460,19 @@ def _prepare_frequency_runtime_state(
                     freq_dispersion_mode,
                 )
             freq_dispersion_step = None
+    freq_hessian_settings = {"method": "analytic", "step": None, "workers": None}
+    if frequency_config and frequency_config.hessian_method:
+        freq_hessian_settings["method"] = frequency_config.hessian_method.lower()
+    if freq_hessian_settings["method"] == "numerical":
+        freq_hessian_settings["step"] = frequency_config.hessian_step
+        freq_hessian_settings["workers"] = frequency_config.hessian_workers
     return {
         "frequency_use_chkfile": frequency_use_chkfile,
         "freq_scf_config": freq_scf_config,
         "freq_dispersion_mode": freq_dispersion_mode,
         "freq_dispersion_model": freq_dispersion_model,
         "freq_dispersion_step": freq_dispersion_step,
+        "freq_hessian_settings": freq_hessian_settings,
     }
 
 
@@ -540,6 +549,7 @@ def _prepare_runtime_state(
     context["freq_dispersion_mode"] = freq_runtime["freq_dispersion_mode"]
     context["freq_dispersion_model"] = freq_runtime["freq_dispersion_model"]
     context["freq_dispersion_step"] = freq_runtime["freq_dispersion_step"]
+    context["freq_hessian_settings"] = freq_runtime["freq_hessian_settings"]
 
     return {
         "molecule_context": molecule_context,
@@ -637,16 +647,16 @@ def _run_non_optimization_mode(
     if skip_capability_check:
         logging.warning("Skipping capability check (DFTFLOW_SKIP_CAPABILITY_CHECK=1).")
     else:
-        logging.info(
-            "Running capability check for %s calculation (SCF%s)...",
-            "single-point"
-            if calculation_mode == "single_point"
-            else "frequency"
-            if calculation_mode == "frequency"
-            else "IRC",
-            " + Hessian" if calculation_mode in ("frequency", "irc") else "",
-        )
-        engine_adapter.run_capability_check(
+        _run_cached_capability_check(
+            engine_adapter,
+            "{label} calculation (SCF{hessian})".format(
+                label="single-point"
+                if calculation_mode == "single_point"
+                else "frequency"
+                if calculation_mode == "frequency"
+                else "IRC",
+                hessian=" + Hessian" if calculation_mode in ("frequency", "irc") else "",
+            ),
             mol,
             calc_basis,
             calc_xc,
@@ -664,6 +674,8 @@ def _run_non_optimization_mode(
             memory_mb=memory_mb,
             optimizer_mode=optimizer_mode,
             multiplicity=multiplicity,
+            probe=context.get("capability_check_mode") == "probe",
+            recheck=bool(context.get("capability_recheck")),
         )
     logging.info("Run ID: %s", run_id)
     logging.info("Run directory: %s", run_dir)
@@ -804,6 +816,7 @@ def _run_non_optimization_mode(
         "calc_dispersion_model": calc_dispersion_model,
         "freq_dispersion_mode": freq_dispersion_mode,
         "freq_dispersion_step": context.get("freq_dispersion_step"),
+        "freq_hessian_settings": context.get("freq_hessian_settings"),
         "thermo": context["thermo"],
         "ts_quality": context.get("ts_quality"),
         "verbose": verbose,
@@ -881,6 +894,8 @@ def _run_non_optimization_mode(
         multiplicity=multiplicity,
         profiling_enabled=profiling_enabled,
         return_hessian=True,
+        ts_quality=context.get("ts_quality"),
+        **_resolve_irc_mode_solver(irc_config),
     )
     if mode_result.get("eigenvalue", 0.0) >= 0:
         logging.warning(
@@ -893,6 +908,8 @@ def _run_non_optimization_mode(
             "mode_vector": mode_result["mode"],
             "mode_hessian": mode_result.get("hessian"),
             "mode_eigenvalue": mode_result.get("eigenvalue"),
+            "mode_solver": mode_result.get("mode_solver"),
+            "mode_ts_quality": mode_result.get("ts_quality"),
             "mode_profiling": mode_result.get("profiling") if profiling_enabled else None,
             "irc_steps": irc_steps,
             "irc_step_size": irc_step_size,
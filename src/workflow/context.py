@@ -138,6 +138,10 @@ def prepare_run_context(args, config: RunConfig, config_raw) -> RunContext:
     profiling_enabled = bool(getattr(args, "profile", False)) or _env_truthy(
         "DFTFLOW_PROFILE"
     )
+    capability_recheck = bool(getattr(args, "recheck", False)) or _env_truthy(
+        "DFTFLOW_CAPABILITY_RECHECK"
+    )
+    capability_check_mode = config.capability_check or "full"
     resume_dir = getattr(args, "resume", None)
     run_dir = args.run_dir or resume_dir or create_run_directory()
     os.makedirs(run_dir, exist_ok=True)
@@ -249,6 +253,8 @@ def prepare_run_context(args, config: RunConfig, config_raw) -> RunContext:
         "memory_gb": memory_gb,
         "verbose": verbose,
         "profiling_enabled": profiling_enabled,
+        "capability_recheck": capability_recheck,
+        "capability_check_mode": capability_check_mode,
         "io_write_interval_steps": io_write_interval_steps,
         "io_write_interval_seconds": io_write_interval_seconds,
         "scan_write_interval_points": scan_write_interval_points,
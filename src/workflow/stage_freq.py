@@ -12,6 +12,7 @@ from .utils import (
     _frequency_units,
     _frequency_versions,
     _resolve_d3_params,
+    _resolve_irc_mode_solver,
     _thermochemistry_payload,
     _update_checkpoint_scf,
 )
@@ -43,6 +44,7 @@ def _compute_frequency_result(stage_context, profiling_enabled, engine_adapter):
         ts_quality=stage_context.get("ts_quality"),
         profiling_enabled=profiling_enabled,
         log_override=False,
+        hessian_settings=stage_context.get("freq_hessian_settings"),
     )
 
 
@@ -328,6 +330,7 @@ def _run_irc_for_frequency_geometry(
             multiplicity=stage_context["multiplicity"],
             profiling_enabled=profiling_enabled,
             return_hessian=True,
+            **_resolve_irc_mode_solver(stage_context.get("irc_config")),
         )
         if mode_result.get("eigenvalue", 0.0) >= 0:
             logging.warning(
@@ -341,6 +344,7 @@ def _run_irc_for_frequency_geometry(
                 "mode_vector": mode_result["mode"],
                 "mode_hessian": mode_result.get("hessian"),
                 "mode_eigenvalue": mode_result.get("eigenvalue"),
+                "mode_solver": mode_result.get("mode_solver"),
                 "mode_profiling": mode_result.get("profiling") if profiling_enabled else None,
                 "irc_steps": irc_steps,
                 "irc_step_size": irc_step_size,
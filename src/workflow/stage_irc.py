@@ -357,6 +357,8 @@ def _build_irc_payload(
         "step_size": stage_context["irc_step_size"],
         "force_threshold": stage_context["irc_force_threshold"],
         "mode_eigenvalue": stage_context.get("mode_eigenvalue"),
+        "mode_solver": stage_context.get("mode_solver"),
+        "ts_quality": stage_context.get("mode_ts_quality"),
         "profile": profile,
         "profile_csv_file": stage_context["irc_profile_csv_path"],
         "profiling": {
@@ -32,13 +32,20 @@ from .utils import (
     _frequency_units,
     _frequency_versions,
     _resolve_d3_params,
+    _resolve_irc_mode_solver,
+    _reuse_optimizer_single_point,
+    _run_cached_capability_check,
     _seed_scf_checkpoint,
+    _single_point_method_fingerprint,
+    _start_capability_probe,
     _thermochemistry_payload,
 )
 
 
 DEFAULT_ENGINE_ADAPTER = WorkflowEngineAdapter()
 DEFAULT_METADATA_RECORDER = RunMetadataRecorder()
+LADDER_DIR_NAME = "ladder"
+LADDER_DEFAULT_FMAX = 0.1
 
 
 def _build_optimization_stage_context(context: RunContext) -> OptimizationStageContext:
@@ -107,12 +114,15 @@ def _build_optimization_stage_context(context: RunContext) -> OptimizationStageC
     )
     optional_keys = (
         "resume_dir",
+        "capability_recheck",
+        "capability_check_mode",
         "previous_status",
         "dispersion_info",
         "applied_scf",
         "sp_chkfile",
         "eps",
         "freq_dispersion_step",
+        "freq_hessian_settings",
         "freq_scf_config",
         "frequency_use_chkfile",
     )
@@ -146,18 +156,30 @@ def _run_optimization_capability_checks(
     engine_adapter: WorkflowEngineAdapter,
     verbose,
     memory_mb,
-) -> None:
+) -> list[Any]:
     skip_capability_check = bool(os.environ.get("DFTFLOW_SKIP_CAPABILITY_CHECK"))
     if skip_capability_check:
         logging.warning(
             "Skipping capability check (DFTFLOW_SKIP_CAPABILITY_CHECK=1)."
         )
-        return
+        return []
 
-    logging.info(
-        "Running capability check for geometry optimization (SCF + gradient)..."
-    )
-    engine_adapter.run_capability_check(
+    recheck = bool(context.get("capability_recheck"))
+    # Probe mode checks a small stand-in molecule in the background while the
+    # optimizer starts; the returned probes are polled from the step callback.
+    probe_mode = context.get("capability_check_mode") == "probe"
+    probes = []
+
+    def _check(description, *args, **kwargs):
+        if not probe_mode:
+            _run_cached_capability_check(engine_adapter, description, *args, **kwargs)
+            return
+        probe = _start_capability_probe(engine_adapter, description, *args, **kwargs)
+        if probe is not None:
+            probes.append(probe)
+
+    _check(
+        "geometry optimization (SCF + gradient)",
         mol,
         basis,
         xc,
@@ -173,14 +195,13 @@ def _run_optimization_capability_checks(
         memory_mb=memory_mb,
         optimizer_mode=optimizer_mode,
         multiplicity=multiplicity,
+        recheck=recheck,
     )
     if not context["frequency_enabled"]:
-        return
+        return probes
 
-    logging.info(
-        "Running capability check for frequency calculation (SCF + gradient + Hessian)..."
-    )
-    engine_adapter.run_capability_check(
+    _check(
+        "frequency calculation (SCF + gradient + Hessian)",
         mol,
         context["sp_basis"],
         context["sp_xc"],
@@ -196,7 +217,9 @@ def _run_optimization_capability_checks(
         memory_mb=memory_mb,
         optimizer_mode=optimizer_mode,
         multiplicity=multiplicity,
+        recheck=recheck,
     )
+    return probes
 
 
 def _log_optimization_start(
@@ -404,6 +427,14 @@ def _build_optimization_metadata(
     return optimization_metadata
 
 
+def _projected_guess_chkfile(context: OptimizationStageContext):
+    # Only a basis change needs projection; same-basis runs reuse the seeded chkfile.
+    base_chkfile = context.get("pyscf_chkfile")
+    if not base_chkfile or context["basis"] == context["sp_basis"]:
+        return None
+    return base_chkfile
+
+
 def _run_frequency_for_optimized_geometry(
     *,
     context: OptimizationStageContext,
@@ -428,6 +459,7 @@ def _run_frequency_for_optimized_geometry(
 
     if frequency_enabled:
         logging.info("Calculating harmonic frequencies for optimized geometry...")
+        guess_chkfile = _projected_guess_chkfile(context)
         try:
             frequency_result = engine_adapter.compute_frequencies(
                 mol_optimized,
@@ -450,6 +482,8 @@ def _run_frequency_for_optimized_geometry(
                 multiplicity=multiplicity,
                 ts_quality=context.get("ts_quality"),
                 profiling_enabled=profiling_enabled,
+                hessian_settings=context.get("freq_hessian_settings"),
+                **({"guess_chkfile": guess_chkfile} if guess_chkfile else {}),
             )
             last_scf_energy = frequency_result.get("energy")
             last_scf_converged = frequency_result.get("converged")
@@ -984,12 +1018,15 @@ def _build_optimization_step_callback(
     checkpoint_base: dict[str, Any],
     checkpoint_path,
     checkpoint_common: dict[str, Any],
+    capability_probes=(),
 ):
     last_snapshot_write = {"step": n_steps["value"]}
     last_checkpoint_write = {"step": n_steps["value"]}
     first_checkpoint_step = n_steps["value"] + 1
 
     def _step_callback(*_args, **_kwargs):
+        for probe in capability_probes:
+            probe.poll()
         n_steps["value"] += 1
         step_value = n_steps["value"]
         now = time.monotonic()
@@ -1323,6 +1360,9 @@ def _compute_optimized_geometry_mode(
         multiplicity=multiplicity,
         profiling_enabled=profiling_enabled,
         return_hessian=True,
+        # Without a frequency stage, the mode solver supplies the TS quality check.
+        ts_quality=None if context["frequency_enabled"] else context.get("ts_quality"),
+        **_resolve_irc_mode_solver(context.get("irc_config")),
     )
     if mode_result.get("eigenvalue", 0.0) >= 0:
         logging.warning(
@@ -1330,6 +1370,14 @@ def _compute_optimized_geometry_mode(
             "structure may not be a first-order saddle point.",
             mode_result.get("eigenvalue", 0.0),
         )
+    ts_quality_result = mode_result.get("ts_quality") or {}
+    if ts_quality_result.get("message"):
+        if ts_quality_result.get("status") in ("pass", "warn"):
+            logging.info("TS quality check (mode solver): %s", ts_quality_result["message"])
+        else:
+            logging.warning(
+                "TS quality check (mode solver): %s", ts_quality_result["message"]
+            )
     return mode_result
 
 
@@ -1406,6 +1454,8 @@ def _build_success_irc_payload_for_optimized_geometry(
         "step_size": irc_step_size,
         "force_threshold": irc_force_threshold,
         "mode_eigenvalue": mode_result.get("eigenvalue"),
+        "mode_solver": mode_result.get("mode_solver"),
+        "ts_quality": mode_result.get("ts_quality"),
         "profile": profile,
         "profiling": {
             "mode": mode_profiling,
@@ -1606,24 +1656,42 @@ def _run_single_point_for_optimized_geometry(
     final_sp_converged = None
     final_sp_cycles = None
     if run_single_point:
-        logging.info("Calculating single-point energy for optimized geometry...")
-        sp_result = engine_adapter.compute_single_point_energy(
-            mol_optimized,
-            context["sp_basis"],
-            context["sp_xc"],
-            context["sp_scf_config"],
-            context["sp_solvent_model"] if context["sp_solvent_name"] else None,
-            context["sp_solvent_name"],
-            context["sp_eps"],
-            context["freq_dispersion_model"],
-            _resolve_d3_params(optimizer_ase_dict),
-            verbose,
-            memory_mb,
-            run_dir=run_dir,
-            optimizer_mode=optimizer_mode,
-            multiplicity=multiplicity,
-            profiling_enabled=profiling_enabled,
+        final_point = optimization_metadata.get("final_point") or {}
+        sp_result = _reuse_optimizer_single_point(
+            final_point,
+            final_point.get("method_fingerprint"),
+            _single_point_method_fingerprint(
+                context["sp_basis"],
+                context["sp_xc"],
+                context["sp_scf_config"],
+                context["sp_solvent_model"] if context["sp_solvent_name"] else None,
+                context["sp_solvent_name"],
+                context["sp_eps"],
+                context["freq_dispersion_model"],
+                _resolve_d3_params(optimizer_ase_dict),
+            ),
         )
+        if sp_result is None:
+            logging.info("Calculating single-point energy for optimized geometry...")
+            guess_chkfile = _projected_guess_chkfile(context)
+            sp_result = engine_adapter.compute_single_point_energy(
+                mol_optimized,
+                context["sp_basis"],
+                context["sp_xc"],
+                context["sp_scf_config"],
+                context["sp_solvent_model"] if context["sp_solvent_name"] else None,
+                context["sp_solvent_name"],
+                context["sp_eps"],
+                context["freq_dispersion_model"],
+                _resolve_d3_params(optimizer_ase_dict),
+                verbose,
+                memory_mb,
+                run_dir=run_dir,
+                optimizer_mode=optimizer_mode,
+                multiplicity=multiplicity,
+                profiling_enabled=profiling_enabled,
+                **({"guess_chkfile": guess_chkfile} if guess_chkfile else {}),
+            )
         final_sp_energy = sp_result["energy"]
         final_sp_converged = sp_result["converged"]
         final_sp_cycles = sp_result["cycles"]
@@ -1632,6 +1700,8 @@ def _run_single_point_for_optimized_geometry(
         optimization_metadata["single_point"]["dispersion_info"] = sp_result.get(
             "dispersion"
         )
+        if sp_result.get("reused_from"):
+            optimization_metadata["single_point"]["reused_from"] = sp_result["reused_from"]
         if profiling_enabled and sp_result.get("profiling"):
             optimization_metadata["single_point"]["profiling"] = sp_result.get(
                 "profiling"
@@ -1651,6 +1721,177 @@ def _run_single_point_for_optimized_geometry(
     )
 
 
+def _resolve_ladder_rungs(optimizer_config) -> list[dict[str, Any]]:
+    ladder = getattr(optimizer_config, "ladder", None) if optimizer_config else None
+    return [dict(rung) for rung in ladder or []]
+
+
+def _merge_ladder_scf_config(scf_config, rung_scf, chkfile_path) -> dict[str, Any]:
+    merged = dict(scf_config or {})
+    rung_scf = dict(rung_scf or {})
+    rung_extra = rung_scf.pop("extra", None)
+    merged.update(rung_scf)
+    if rung_extra is not None:
+        merged["extra"] = {**(merged.get("extra") or {}), **rung_extra}
+    merged["chkfile"] = chkfile_path
+    return merged
+
+
+def _build_ladder_rung_settings(
+    rung: dict[str, Any],
+    *,
+    index: int,
+    run_dir,
+    basis,
+    xc,
+    scf_config,
+    optimizer_ase_dict,
+) -> dict[str, Any]:
+    rung_name = f"rung_{index}"
+    rung_optimizer = dict(optimizer_ase_dict or {})
+    target_fmax = rung_optimizer.get("fmax", 0.05)
+    rung_optimizer["fmax"] = rung.get("fmax") or max(LADDER_DEFAULT_FMAX, target_fmax)
+    if rung.get("steps") is not None:
+        rung_optimizer["steps"] = rung["steps"]
+    for key in ("trajectory", "logfile"):
+        if rung_optimizer.get(key):
+            rung_optimizer[key] = os.path.join(
+                LADDER_DIR_NAME, f"{rung_name}_{os.path.basename(rung_optimizer[key])}"
+            )
+    return {
+        "basis": rung.get("basis") or basis,
+        "xc": rung.get("xc") or xc,
+        "scf_config": _merge_ladder_scf_config(
+            scf_config,
+            rung.get("scf"),
+            resolve_run_path(run_dir, os.path.join(LADDER_DIR_NAME, f"{rung_name}.chk")),
+        ),
+        "optimizer_ase_dict": rung_optimizer,
+        "output_xyz_path": resolve_run_path(
+            run_dir, os.path.join(LADDER_DIR_NAME, f"{rung_name}.xyz")
+        ),
+    }
+
+
+def _run_optimization_ladder(
+    *,
+    ladder_rungs: list[dict[str, Any]],
+    engine_adapter: WorkflowEngineAdapter,
+    run_dir,
+    optimizer_input_xyz,
+    charge,
+    spin,
+    multiplicity,
+    basis,
+    xc,
+    scf_config,
+    solvent_model,
+    solvent_name,
+    eps,
+    dispersion_model,
+    verbose,
+    memory_mb,
+    optimizer_ase_dict,
+    optimizer_mode,
+    constraints,
+    profiling_enabled,
+    step_callback,
+    optimization_metadata: dict[str, Any],
+    checkpoint_base: dict[str, Any] | None,
+    checkpoint_path,
+    checkpoint_common: dict[str, Any] | None,
+) -> tuple[Any, str | None]:
+    completed_rungs = 0
+    if checkpoint_base:
+        completed_rungs = _parse_nonnegative_step(
+            checkpoint_base.get("ladder_completed_rungs")
+        ) or 0
+    if completed_rungs >= len(ladder_rungs):
+        return optimizer_input_xyz, None
+    ladder_metadata = optimization_metadata.setdefault("ladder", [])
+    guess_chkfile = None
+    for index, rung in enumerate(ladder_rungs):
+        settings = _build_ladder_rung_settings(
+            rung,
+            index=index,
+            run_dir=run_dir,
+            basis=basis,
+            xc=xc,
+            scf_config=scf_config,
+            optimizer_ase_dict=optimizer_ase_dict,
+        )
+        rung_chkfile = settings["scf_config"]["chkfile"]
+        if index < completed_rungs:
+            logging.info(
+                "Skipping completed optimization ladder rung %d (%s/%s).",
+                index,
+                settings["xc"],
+                settings["basis"],
+            )
+            guess_chkfile = rung_chkfile if os.path.exists(rung_chkfile) else None
+            continue
+        logging.info(
+            "Optimization ladder rung %d/%d: %s/%s (fmax=%s)",
+            index + 1,
+            len(ladder_rungs),
+            settings["xc"],
+            settings["basis"],
+            settings["optimizer_ase_dict"]["fmax"],
+        )
+        ensure_parent_dir(settings["output_xyz_path"])
+        rung_start = time.perf_counter()
+        rung_result = engine_adapter.run_ase_optimizer(
+            optimizer_input_xyz,
+            settings["output_xyz_path"],
+            run_dir,
+            charge,
+            spin,
+            multiplicity,
+            settings["basis"],
+            settings["xc"],
+            settings["scf_config"],
+            solvent_model.lower() if solvent_model else None,
+            solvent_name,
+            eps,
+            dispersion_model,
+            verbose,
+            memory_mb,
+            settings["optimizer_ase_dict"],
+            optimizer_mode,
+            constraints,
+            profiling_enabled=profiling_enabled,
+            step_callback=step_callback,
+            **({"guess_chkfile": guess_chkfile} if guess_chkfile else {}),
+        )
+        rung_entry = {
+            "index": index,
+            "basis": settings["basis"],
+            "xc": settings["xc"],
+            "fmax": settings["optimizer_ase_dict"]["fmax"],
+            "n_steps": rung_result.get("n_steps"),
+            "output_xyz": settings["output_xyz_path"],
+            "elapsed_seconds": time.perf_counter() - rung_start,
+        }
+        if profiling_enabled and rung_result.get("profiling"):
+            rung_entry["profiling"] = rung_result.get("profiling")
+        ladder_metadata.append(rung_entry)
+        optimizer_input_xyz = settings["output_xyz_path"]
+        guess_chkfile = rung_chkfile
+        if checkpoint_base is not None and checkpoint_common is not None:
+            checkpoint_base["ladder_completed_rungs"] = index + 1
+            rung_atom_spec, _, _, _ = engine_adapter.load_xyz(optimizer_input_xyz)
+            _update_optimization_checkpoint(
+                checkpoint_base,
+                checkpoint_path,
+                checkpoint_common,
+                atom_spec=rung_atom_spec,
+                status="running",
+            )
+    if guess_chkfile and not os.path.exists(guess_chkfile):
+        guess_chkfile = None
+    return optimizer_input_xyz, guess_chkfile
+
+
 def _run_geometry_optimization_phase(
     *,
     args,
@@ -1678,12 +1919,45 @@ def _run_geometry_optimization_phase(
     step_callback,
     optimization_metadata: dict[str, Any],
     n_steps: dict[str, int],
+    ladder_rungs: list[dict[str, Any]] | None = None,
+    checkpoint_base: dict[str, Any] | None = None,
+    checkpoint_path=None,
+    checkpoint_common: dict[str, Any] | None = None,
 ) -> tuple[Any, Any, int | None, str]:
     from pyscf import gto
 
     if args.xyz_file and input_xyz_path:
         if os.path.abspath(args.xyz_file) != os.path.abspath(input_xyz_path):
             shutil.copy2(args.xyz_file, input_xyz_path)
+    guess_chkfile = None
+    if ladder_rungs:
+        optimizer_input_xyz, guess_chkfile = _run_optimization_ladder(
+            ladder_rungs=ladder_rungs,
+            engine_adapter=engine_adapter,
+            run_dir=run_dir,
+            optimizer_input_xyz=optimizer_input_xyz,
+            charge=charge,
+            spin=spin,
+            multiplicity=multiplicity,
+            basis=basis,
+            xc=xc,
+            scf_config=scf_config,
+            solvent_model=solvent_model,
+            solvent_name=solvent_name,
+            eps=eps,
+            dispersion_model=dispersion_model,
+            verbose=verbose,
+            memory_mb=memory_mb,
+            optimizer_ase_dict=optimizer_ase_dict,
+            optimizer_mode=optimizer_mode,
+            constraints=constraints,
+            profiling_enabled=profiling_enabled,
+            step_callback=step_callback,
+            optimization_metadata=optimization_metadata,
+            checkpoint_base=checkpoint_base,
+            checkpoint_path=checkpoint_path,
+            checkpoint_common=checkpoint_common,
+        )
     ensure_parent_dir(output_xyz_path)
     opt_result = engine_adapter.run_ase_optimizer(
         optimizer_input_xyz,
@@ -1706,8 +1980,24 @@ def _run_geometry_optimization_phase(
         constraints,
         profiling_enabled=profiling_enabled,
         step_callback=step_callback,
+        **({"guess_chkfile": guess_chkfile} if guess_chkfile else {}),
     )
     n_steps_value = opt_result.get("n_steps")
+    final_point = opt_result.get("final_point")
+    if final_point is not None:
+        optimization_metadata["final_point"] = {
+            **final_point,
+            "method_fingerprint": _single_point_method_fingerprint(
+                basis,
+                xc,
+                scf_config,
+                solvent_model,
+                solvent_name,
+                eps,
+                dispersion_model,
+                _resolve_d3_params(optimizer_ase_dict),
+            ),
+        }
     if profiling_enabled and opt_result.get("profiling"):
         optimization_metadata.setdefault("profiling", {})["optimizer"] = opt_result.get(
             "profiling"
@@ -2162,7 +2452,7 @@ def _prepare_optimization_runtime_state(
     multiplicity = molecule_context["multiplicity"]
     ks_type = molecule_context["ks_type"]
 
-    _run_optimization_capability_checks(
+    capability_probes = _run_optimization_capability_checks(
         context=context,
         mol=mol,
         basis=basis,
@@ -2307,6 +2597,7 @@ def _prepare_optimization_runtime_state(
         checkpoint_base=checkpoint_base,
         checkpoint_path=checkpoint_path,
         checkpoint_common=checkpoint_common,
+        capability_probes=capability_probes,
     )
     return {
         "basis": basis,
@@ -2319,6 +2610,7 @@ def _prepare_optimization_runtime_state(
         "optimizer_mode": optimizer_mode,
         "single_point_enabled": single_point_enabled,
         "profiling_enabled": profiling_enabled,
+        "ladder_rungs": _resolve_ladder_rungs(optimizer_config),
         "freq_scf_config": freq_scf_config,
         "run_dir": run_dir,
         "log_path": log_path,
@@ -2354,6 +2646,7 @@ def _prepare_optimization_runtime_state(
         "output_xyz_path": output_xyz_path,
         "checkpoint_common": checkpoint_common,
         "step_callback": step_callback,
+        "capability_probes": capability_probes,
         "engine_adapter": engine_adapter,
         "metadata_recorder": metadata_recorder,
     }
@@ -2418,8 +2711,16 @@ def run_optimization_stage(
             step_callback=runtime["step_callback"],
             optimization_metadata=runtime["optimization_metadata"],
             n_steps=runtime["n_steps"],
+            ladder_rungs=runtime["ladder_rungs"],
+            checkpoint_base=runtime["checkpoint_base"],
+            checkpoint_path=runtime["checkpoint_path"],
+            checkpoint_common=runtime["checkpoint_common"],
         )
+        for probe in runtime["capability_probes"]:
+            probe.wait()
     except Exception as exc:
+        for probe in runtime["capability_probes"]:
+            probe.cancel()
         logging.exception("Geometry optimization failed.")
         _handle_optimization_failure(
             error=exc,
@@ -1,11 +1,13 @@
 import concurrent.futures
 import copy
 import csv
+import heapq
 import itertools
 import json
 import logging
 import math
 import os
+import signal
 import time
 import traceback
 from datetime import datetime
@@ -14,6 +16,7 @@ from run_queue import record_status_event
 from run_opt_metadata import (
     collect_git_metadata,
     compute_file_hash,
+    compute_method_fingerprint,
     compute_text_hash,
     get_package_version,
     write_run_metadata,
@@ -32,14 +35,20 @@ from .utils import (
     _atoms_to_atom_spec,
     _build_scan_constraints,
     _dimension_key,
+    _measure_scan_geometry,
     _merge_constraints,
     _parse_scan_dimensions,
     _resolve_d3_params,
+    _reuse_optimizer_single_point,
+    _run_cached_capability_check,
     _seed_scf_checkpoint,
+    _single_point_method_fingerprint,
+    _start_capability_probe,
 )
 
 
 SCAN_EXECUTORS = ("serial", "local", "manifest")
+DEFAULT_SCAN_ADAPTIVE_TOLERANCE = 1e-4
 DEFAULT_ENGINE_ADAPTER = WorkflowEngineAdapter()
 
 
@@ -110,10 +119,8 @@ def _resolve_scan_threads_per_worker(scan_config, thread_count):
 def _resolve_scan_batch_size(scan_config, total_points, max_workers):
     batch_size = scan_config.get("batch_size") if scan_config else None
     if batch_size is None:
-        if not total_points or not max_workers:
-            return 1
-        target = math.ceil(total_points / (max_workers * 4))
-        return max(1, min(25, target))
+        # Points are handed out one at a time so uneven costs balance across workers.
+        return 1
     if not isinstance(batch_size, int) or isinstance(batch_size, bool):
         raise ValueError("scan.batch_size must be a positive integer.")
     if batch_size < 1:
@@ -123,20 +130,108 @@ def _resolve_scan_batch_size(scan_config, total_points, max_workers):
     return batch_size
 
 
-def _build_scan_batches(scan_points, batch_size):
+def _build_scan_chain_order(grid_counts):
+    # Boustrophedon walk: consecutive points differ by one step in one dimension.
+    walk = [()]
+    for count in reversed(grid_counts):
+        next_walk = []
+        for position in range(count):
+            inner = walk if position % 2 == 0 else walk[::-1]
+            next_walk.extend((position, *rest) for rest in inner)
+        walk = next_walk
+    order = []
+    for position in walk:
+        index = 0
+        for value, count in zip(position, grid_counts, strict=True):
+            index = index * count + value
+        order.append(index)
+    return order
+
+
+def _build_scan_chain_segments(scan_points, chain_order, segment_count):
+    segment_count = max(1, min(segment_count, len(chain_order)))
+    segments = []
+    for segment in range(segment_count):
+        start = segment * len(chain_order) // segment_count
+        end = (segment + 1) * len(chain_order) // segment_count
+        segments.append([(index, scan_points[index]) for index in chain_order[start:end]])
+    return segments
+
+
+def _build_scan_batches(scan_points, batch_size, completed=(), order=None):
+    pending = [
+        (index, scan_points[index])
+        for index in (order if order is not None else range(len(scan_points)))
+        if index not in completed
+    ]
     batches = []
-    for start in range(0, len(scan_points), batch_size):
-        batch = []
-        for index in range(start, min(start + batch_size, len(scan_points))):
-            batch.append((index, scan_points[index]))
-        batches.append(batch)
+    for start in range(0, len(pending), batch_size):
+        batches.append(pending[start:start + batch_size])
     return batches
 
 
+def _resolve_scan_adaptive_settings(scan_config, values_grid, scan_executor):
+    adaptive = scan_config.get("adaptive")
+    if not adaptive:
+        return None
+    if scan_executor == "manifest":
+        logging.warning(
+            "scan.adaptive is ignored by the manifest executor; only the coarse grid is written."
+        )
+        return None
+    if len(values_grid) != 1:
+        raise ValueError("scan.adaptive requires a single scan dimension.")
+    coarse = sorted(set(values_grid[0]))
+    if len(coarse) < 3:
+        raise ValueError("scan.adaptive requires at least 3 coarse grid points.")
+    settings = adaptive if isinstance(adaptive, dict) else {}
+    coarse_step = min(upper - lower for lower, upper in zip(coarse, coarse[1:]))
+    return {
+        "tolerance": settings.get("tolerance", DEFAULT_SCAN_ADAPTIVE_TOLERANCE),
+        "max_points": settings.get("max_points", 3 * len(coarse)),
+        "min_step": settings.get("min_step", coarse_step / 8),
+    }
+
+
+def _select_adaptive_refinements(values, energies, *, tolerance, min_step, limit):
+    # Piecewise-quadratic surrogate: second divided differences give the local
+    # curvature, and h^2/8 * |E''| bounds the error of interpolating across an interval.
+    count = len(values)
+    if count < 3 or limit < 1:
+        return []
+    slopes = [
+        (energies[i + 1] - energies[i]) / (values[i + 1] - values[i])
+        for i in range(count - 1)
+    ]
+    curvature = [0.0] * count
+    for i in range(1, count - 1):
+        curvature[i] = 2.0 * (slopes[i] - slopes[i - 1]) / (values[i + 1] - values[i - 1])
+    curvature[0] = curvature[1]
+    curvature[-1] = curvature[-2]
+    candidates = []
+    for i in range(count - 1):
+        width = values[i + 1] - values[i]
+        if width / 2 < min_step:
+            continue
+        error = width * width / 8 * max(abs(curvature[i]), abs(curvature[i + 1]))
+        # An interval next to a slope sign change brackets a minimum or maximum.
+        stationary = (i > 0 and slopes[i - 1] * slopes[i] < 0) or (
+            i + 1 < count - 1 and slopes[i] * slopes[i + 1] < 0
+        )
+        if stationary or error > tolerance:
+            candidates.append((not stationary, -error, i))
+    candidates.sort()
+    return [i for _, _, i in candidates[:limit]]
+
+
 def _scan_point_dir(scan_dir, index):
     return os.path.join(scan_dir, "points", f"point_{index:03d}")
 
 
+def _scan_attempt_dir(scan_dir, index, attempt):
+    return f"{_scan_point_dir(scan_dir, index)}_attempt{attempt}"
+
+
 def _scan_point_result_path(scan_dir, index):
     return os.path.join(_scan_point_dir(scan_dir, index), "result.json")
 
@@ -148,6 +243,123 @@ def _build_point_label(dimensions, values, index):
     return point_label
 
 
+def _scan_point_fingerprint(
+    *,
+    values,
+    dimensions,
+    scan_mode,
+    xyz_file,
+    charge,
+    spin,
+    multiplicity,
+    basis,
+    xc,
+    scf_config,
+    solvent_name,
+    solvent_model,
+    solvent_eps,
+    dispersion_model,
+    optimizer_mode,
+    optimizer_ase_dict,
+    constraints,
+):
+    optimization = scan_mode == "optimization"
+    return compute_method_fingerprint(
+        {
+            "method": _single_point_method_fingerprint(
+                basis,
+                xc,
+                scf_config,
+                solvent_model if solvent_name else None,
+                solvent_name,
+                solvent_eps,
+                dispersion_model,
+                _resolve_d3_params(optimizer_ase_dict),
+            ),
+            "scan_mode": scan_mode,
+            "optimizer_mode": optimizer_mode if optimization else None,
+            "optimizer_ase": optimizer_ase_dict if optimization else None,
+            "constraints": constraints if optimization else None,
+            "xyz_file_hash": compute_file_hash(xyz_file),
+            "charge": charge,
+            "spin": spin,
+            "multiplicity": multiplicity,
+            # Only what the coordinates are; start/end/step may change between runs.
+            "coordinates": [
+                [dimension.get("type"), list(dimension.get("indices") or [])]
+                for dimension in dimensions
+            ],
+            "values": [float(value) for value in values],
+        }
+    )
+
+
+def _load_completed_scan_point(scan_dir, index, fingerprint):
+    path = _scan_point_result_path(scan_dir, index)
+    if not fingerprint or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            point_result = json.load(handle)
+    except (OSError, ValueError):
+        logging.warning("Ignoring unreadable scan point result: %s", path)
+        return None
+    if not isinstance(point_result, dict):
+        return None
+    if point_result.get("fingerprint") != fingerprint or point_result.get("index") != index:
+        return None
+    # Unconverged points are recomputed rather than trusted on resume.
+    if point_result.get("energy") is None or point_result.get("converged") is False:
+        return None
+    output_xyz = point_result.get("output_xyz")
+    if output_xyz and not os.path.exists(output_xyz):
+        return None
+    return point_result
+
+
+def _load_completed_scan_points(
+    *,
+    scan_dir,
+    scan_points,
+    start=0,
+    dimensions,
+    scan_mode,
+    xyz_file,
+    charge,
+    spin,
+    multiplicity,
+    calc_state,
+):
+    completed = {}
+    for index, values in enumerate(scan_points[start:], start=start):
+        point_result = _load_completed_scan_point(
+            scan_dir,
+            index,
+            _scan_point_fingerprint(
+                values=values,
+                dimensions=dimensions,
+                scan_mode=scan_mode,
+                xyz_file=xyz_file,
+                charge=charge,
+                spin=spin,
+                multiplicity=multiplicity,
+                basis=calc_state["basis"],
+                xc=calc_state["xc"],
+                scf_config=calc_state["scf_config"],
+                solvent_name=calc_state["solvent_name"],
+                solvent_model=calc_state["solvent_model"],
+                solvent_eps=calc_state["solvent_eps"],
+                dispersion_model=calc_state["dispersion_model"],
+                optimizer_mode=calc_state["optimizer_mode"],
+                optimizer_ase_dict=calc_state["optimizer_ase_dict"],
+                constraints=calc_state["constraints"],
+            ),
+        )
+        if point_result is not None:
+            completed[index] = point_result
+    return completed
+
+
 def _prepare_point_scf_config(base_scf_config, run_dir, parallel):
     scf_config = copy.deepcopy(base_scf_config or {})
     if not scf_config:
@@ -160,12 +372,32 @@ def _prepare_point_scf_config(base_scf_config, run_dir, parallel):
 
 def _write_point_result(path, result):
     ensure_parent_dir(path)
-    with open(path, "w", encoding="utf-8") as handle:
+    # Write then rename so a killed worker never leaves a half-written result behind.
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
         json.dump(result, handle, indent=2)
+    os.replace(temp_path, path)
+
+
+def _ordered_scan_indices(results_by_index, scan_points=None):
+    if scan_points is None:
+        return sorted(results_by_index)
+    # Adaptive points are appended after the coarse grid, so order them along
+    # the coordinate in the direction the coarse grid was scanned.
+    direction = 1.0 if scan_points[1][0] >= scan_points[0][0] else -1.0
+    return sorted(
+        results_by_index,
+        key=lambda index: (direction * float(scan_points[index][0]), index),
+    )
 
 
-def _write_scan_results(results_by_index, scan_result_path, scan_result_csv_path):
-    results = [results_by_index[index] for index in sorted(results_by_index)]
+def _write_scan_results(
+    results_by_index, scan_result_path, scan_result_csv_path, scan_points=None
+):
+    results = [
+        results_by_index[index]
+        for index in _ordered_scan_indices(results_by_index, scan_points)
+    ]
     with open(scan_result_path, "w", encoding="utf-8") as handle:
         json.dump({"results": results}, handle, indent=2)
     if scan_result_csv_path:
@@ -239,6 +471,8 @@ def _run_scan_point(
     parallel,
     profiling_enabled=False,
     engine_adapter: WorkflowEngineAdapter = DEFAULT_ENGINE_ADAPTER,
+    chain_state=None,
+    staging_dir=None,
 ):
     from ase.io import read as ase_read
     from ase.io import write as ase_write
@@ -249,19 +483,25 @@ def _run_scan_point(
     point_label = _build_point_label(dimensions, values, index)
     point_run_dir = run_dir
     os.makedirs(point_run_dir, exist_ok=True)
-    input_xyz_path = resolve_run_path(scan_dir, f"scan_{index:03d}_input.xyz")
+    # A staged attempt keeps its files to itself until it is promoted.
+    output_dir = staging_dir or scan_dir
+    input_xyz_path = resolve_run_path(output_dir, f"scan_{index:03d}_input.xyz")
     output_xyz_path = None
-    if atoms_template is None:
+    chain_state = chain_state if chain_state is not None else {}
+    if chain_state.get("atoms") is not None:
+        atoms = chain_state["atoms"].copy()
+    elif atoms_template is None:
         atoms = ase_read(xyz_file).copy()
     else:
         atoms = atoms_template.copy()
     _apply_scan_geometry(atoms, dimensions, values)
     ase_write(input_xyz_path, atoms)
     point_scf_config = _prepare_point_scf_config(scf_config, point_run_dir, parallel)
-    if seed_chkfile and point_scf_config.get("chkfile"):
-        target_chkfile = resolve_run_path(
-            point_run_dir, point_scf_config.get("chkfile")
-        )
+    seed_chkfile = chain_state.get("chkfile") or seed_chkfile
+    target_chkfile = None
+    if point_scf_config.get("chkfile"):
+        target_chkfile = resolve_run_path(point_run_dir, point_scf_config.get("chkfile"))
+    if seed_chkfile and target_chkfile:
         _seed_scf_checkpoint(
             seed_chkfile,
             target_chkfile,
@@ -269,9 +509,10 @@ def _run_scan_point(
         )
     n_steps = None
     optimizer_profile = None
+    scf_result = None
     if scan_mode == "optimization":
         output_xyz_path = resolve_run_path(
-            scan_dir, f"scan_{index:03d}_optimized.xyz"
+            output_dir, f"scan_{index:03d}_optimized.xyz"
         )
         scan_constraints = _build_scan_constraints(dimensions, values)
         merged_constraints = _merge_constraints(constraints, scan_constraints)
@@ -295,37 +536,46 @@ def _run_scan_point(
             optimizer_mode,
             merged_constraints,
             profiling_enabled=profiling_enabled,
+            **(
+                {"initial_hessian": chain_state["hessian"]}
+                if chain_state.get("hessian") is not None
+                else {}
+            ),
         )
         n_steps = opt_result.get("n_steps")
         optimizer_profile = opt_result.get("profiling") if profiling_enabled else None
         atoms = ase_read(output_xyz_path)
-    atom_spec = _atoms_to_atom_spec(atoms)
-    mol_scan = gto.M(
-        atom=atom_spec,
-        basis=basis,
-        charge=charge,
-        spin=spin,
-    )
-    if memory_mb:
-        mol_scan.max_memory = memory_mb
-    scf_result = engine_adapter.compute_single_point_energy(
-        mol_scan,
-        basis,
-        xc,
-        point_scf_config,
-        solvent_model if solvent_name else None,
-        solvent_name,
-        solvent_eps,
-        dispersion_model,
-        _resolve_d3_params(optimizer_ase_dict),
-        verbose,
-        memory_mb,
-        run_dir=point_run_dir,
-        optimizer_mode=optimizer_mode,
-        multiplicity=multiplicity,
-        log_override=False,
-        profiling_enabled=profiling_enabled,
-    )
+        # The point's single point uses the optimizer's own method settings, so the
+        # final point only has to be converged at full precision to stand in for it.
+        scf_result = _reuse_optimizer_single_point(opt_result.get("final_point"))
+    if scf_result is None:
+        atom_spec = _atoms_to_atom_spec(atoms)
+        mol_scan = gto.M(
+            atom=atom_spec,
+            basis=basis,
+            charge=charge,
+            spin=spin,
+        )
+        if memory_mb:
+            mol_scan.max_memory = memory_mb
+        scf_result = engine_adapter.compute_single_point_energy(
+            mol_scan,
+            basis,
+            xc,
+            point_scf_config,
+            solvent_model if solvent_name else None,
+            solvent_name,
+            solvent_eps,
+            dispersion_model,
+            _resolve_d3_params(optimizer_ase_dict),
+            verbose,
+            memory_mb,
+            run_dir=point_run_dir,
+            optimizer_mode=optimizer_mode,
+            multiplicity=multiplicity,
+            log_override=False,
+            profiling_enabled=profiling_enabled,
+        )
     point_result = {
         "index": index,
         "values": point_label,
@@ -333,6 +583,9 @@ def _run_scan_point(
         "energy": scf_result.get("energy") if scf_result else None,
         "converged": scf_result.get("converged") if scf_result else None,
         "cycles": scf_result.get("cycles") if scf_result else None,
+        "single_point_source": scf_result.get("reused_from", "single_point")
+        if scf_result
+        else None,
         "optimizer_steps": n_steps,
         "profiling": {
             "optimizer": optimizer_profile,
@@ -342,9 +595,36 @@ def _run_scan_point(
         else None,
         "input_xyz": input_xyz_path,
         "output_xyz": output_xyz_path,
+        "fingerprint": _scan_point_fingerprint(
+            values=values,
+            dimensions=dimensions,
+            scan_mode=scan_mode,
+            xyz_file=xyz_file,
+            charge=charge,
+            spin=spin,
+            multiplicity=multiplicity,
+            basis=basis,
+            xc=xc,
+            scf_config=scf_config,
+            solvent_name=solvent_name,
+            solvent_model=solvent_model,
+            solvent_eps=solvent_eps,
+            dispersion_model=dispersion_model,
+            optimizer_mode=optimizer_mode,
+            optimizer_ase_dict=optimizer_ase_dict,
+            constraints=constraints,
+        ),
     }
-    point_result_path = _scan_point_result_path(scan_dir, index)
+    if staging_dir:
+        point_result_path = os.path.join(staging_dir, "result.json")
+    else:
+        point_result_path = _scan_point_result_path(scan_dir, index)
     _write_point_result(point_result_path, point_result)
+    if scan_mode == "optimization":
+        chain_state["atoms"] = atoms
+        chain_state["hessian"] = opt_result.get("final_hessian")
+    if target_chkfile and os.path.exists(target_chkfile):
+        chain_state["chkfile"] = target_chkfile
     return point_result
 
 
@@ -376,11 +656,26 @@ def _run_scan_batch(
     parallel,
     profiling_enabled=False,
     engine_adapter: WorkflowEngineAdapter = DEFAULT_ENGINE_ADAPTER,
+    chain=False,
+    chain_state=None,
+    attempt=None,
 ):
     results = []
     errors = []
+    # A chained batch walks neighbouring points, each seeded from the last success.
+    if chain_state is not None:
+        chain_state = dict(chain_state)
+    elif chain:
+        chain_state = {}
     for index, values in batch_items:
         point_run_dir = _scan_point_dir(scan_dir, index) if parallel else run_dir
+        staging_dir = None
+        if attempt is not None:
+            # Racing attempts of one point share no files; the winner is promoted later.
+            point_run_dir = staging_dir = _scan_attempt_dir(scan_dir, index, attempt)
+            os.makedirs(staging_dir, exist_ok=True)
+            with open(os.path.join(staging_dir, "worker.pid"), "w", encoding="utf-8") as handle:
+                handle.write(str(os.getpid()))
         try:
             result = _run_scan_point(
                 index=index,
@@ -410,6 +705,8 @@ def _run_scan_batch(
                 parallel=parallel,
                 profiling_enabled=profiling_enabled,
                 engine_adapter=engine_adapter,
+                chain_state=chain_state,
+                staging_dir=staging_dir,
             )
             results.append(result)
         except Exception as exc:
@@ -420,7 +717,226 @@ def _run_scan_batch(
                     "traceback": traceback.format_exc(),
                 }
             )
-    return {"results": results, "errors": errors}
+    return {"results": results, "errors": errors, "attempt": attempt}
+
+
+def _promote_scan_point_attempt(point_result, scan_dir):
+    index = point_result["index"]
+    promoted = dict(point_result)
+    for key, suffix in (("input_xyz", "input"), ("output_xyz", "optimized")):
+        staged_path = point_result.get(key)
+        if staged_path:
+            target_path = resolve_run_path(scan_dir, f"scan_{index:03d}_{suffix}.xyz")
+            os.replace(staged_path, target_path)
+            promoted[key] = target_path
+    _write_point_result(_scan_point_result_path(scan_dir, index), promoted)
+    return promoted
+
+
+def _terminate_scan_attempts(scan_dir, attempts):
+    # Pool workers cannot be cancelled once running, and the interpreter joins them
+    # at exit, so an attempt that lost the race is stopped through its recorded pid.
+    pids = set()
+    for index, attempt in attempts:
+        pid_path = os.path.join(_scan_attempt_dir(scan_dir, index, attempt), "worker.pid")
+        try:
+            with open(pid_path, "r", encoding="utf-8") as handle:
+                pids.add(int(handle.read().strip()))
+        except (OSError, ValueError):
+            continue
+    for pid in sorted(pids):
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            continue
+        logging.info("Terminated superseded scan worker (pid %s).", pid)
+    return sorted(pids)
+
+
+def _scan_point_chain_state(point_result, *, scan_dir, scan_mode, scf_config):
+    from ase.io import read as ase_read
+
+    if not point_result:
+        return None
+    chain_state = {}
+    output_xyz = point_result.get("output_xyz")
+    if scan_mode == "optimization" and output_xyz and os.path.exists(output_xyz):
+        chain_state["atoms"] = ase_read(output_xyz)
+    point_dir = _scan_point_dir(scan_dir, point_result["index"])
+    chkfile = _prepare_point_scf_config(scf_config, point_dir, True).get("chkfile")
+    if chkfile:
+        chkfile = resolve_run_path(point_dir, chkfile)
+        if os.path.exists(chkfile):
+            chain_state["chkfile"] = chkfile
+    return chain_state or None
+
+
+def _run_wavefront_schedule(
+    *,
+    executor,
+    submit,
+    collect,
+    wait_for_probe,
+    scan_points,
+    grid_counts,
+    max_workers,
+    results_by_index,
+    scan_dir,
+    scan_mode,
+    scf_config,
+):
+    rows, columns = grid_counts
+    # A point is ready once its left and upper neighbours have finished.
+    waiting_on = {
+        index: int(index // columns > 0) + int(index % columns > 0)
+        for index in range(len(scan_points))
+    }
+    seeds = {}
+    ready = []
+    in_flight = {}
+    probe_checked = False
+
+    def _release(index):
+        seed = _scan_point_chain_state(
+            results_by_index.get(index),
+            scan_dir=scan_dir,
+            scan_mode=scan_mode,
+            scf_config=scf_config,
+        )
+        row, column = divmod(index, columns)
+        successors = []
+        if column + 1 < columns:
+            successors.append(index + 1)
+        if row + 1 < rows:
+            successors.append(index + columns)
+        for successor in successors:
+            # Prefer the left neighbour: it differs only in the inner coordinate.
+            if seed is not None and (successor == index + 1 or successor not in seeds):
+                seeds[successor] = seed
+            waiting_on[successor] -= 1
+            if waiting_on[successor] == 0:
+                _make_ready(successor)
+
+    def _make_ready(index):
+        # Points restored from a previous attempt count as finished straight away.
+        if index in results_by_index:
+            seeds.pop(index, None)
+            _release(index)
+            return
+        row, column = divmod(index, columns)
+        heapq.heappush(ready, (row + column, row, index))
+
+    if scan_points:
+        _make_ready(0)
+    while ready or in_flight:
+        # Anti-diagonal order keeps the front advancing evenly across the grid.
+        while ready and len(in_flight) < max_workers:
+            _, _, index = heapq.heappop(ready)
+            future = submit(executor, [(index, scan_points[index])], seeds.pop(index, None))
+            in_flight[future] = index
+        if not probe_checked:
+            wait_for_probe(in_flight)
+            probe_checked = True
+        done, _ = concurrent.futures.wait(
+            in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            index = in_flight.pop(future)
+            collect(future)
+            _release(index)
+
+
+def _estimate_scan_point_costs(xyz_file, dimensions, scan_points):
+    from ase.io import read as ase_read
+
+    # Points far from the input geometry need the most optimizer steps.
+    reference = _measure_scan_geometry(ase_read(xyz_file), dimensions)
+    spans = []
+    for position, dimension in enumerate(dimensions):
+        column = [values[position] for values in scan_points]
+        spans.append((max(column) - min(column)) or 1.0)
+    costs = []
+    for values in scan_points:
+        cost = 0.0
+        for position, dimension in enumerate(dimensions):
+            offset = abs(values[position] - reference[position])
+            if dimension["type"] == "dihedral":
+                offset = min(offset % 360.0, 360.0 - offset % 360.0)
+            cost += offset / spans[position]
+        costs.append(cost)
+    return costs
+
+
+def _run_dynamic_schedule(
+    *,
+    executor,
+    submit,
+    collect,
+    wait_for_probe,
+    work_items,
+    max_in_flight,
+    straggler_timeout=None,
+):
+    pending = list(reversed(work_items))
+    in_flight = {}
+    finished = set()
+    backed_up = set()
+    probe_checked = False
+    while len(finished) < len(work_items):
+        while pending and len(in_flight) < max_in_flight:
+            item_id = len(work_items) - len(pending)
+            # With re-dispatch enabled every attempt is staged, including the first.
+            attempt = 0 if straggler_timeout else None
+            future = submit(executor, pending.pop(), attempt=attempt)
+            in_flight[future] = (item_id, time.monotonic(), attempt)
+        if not probe_checked:
+            wait_for_probe(in_flight)
+            probe_checked = True
+        if straggler_timeout and not pending and len(in_flight) < max_in_flight:
+            # Idle workers at the tail of the scan pick up a second copy of a straggler.
+            now = time.monotonic()
+            for item_id, started, _ in sorted(in_flight.values(), key=lambda entry: entry[1]):
+                if len(in_flight) >= max_in_flight:
+                    break
+                if item_id in finished or item_id in backed_up:
+                    continue
+                if now - started < straggler_timeout:
+                    continue
+                logging.warning(
+                    "Scan work item %s exceeded %s s; dispatching a second attempt.",
+                    item_id,
+                    straggler_timeout,
+                )
+                backed_up.add(item_id)
+                future = submit(executor, work_items[item_id], attempt=1)
+                in_flight[future] = (item_id, now, 1)
+        timeout = None
+        if straggler_timeout and not pending and len(in_flight) < max_in_flight:
+            deadlines = [
+                started + straggler_timeout - time.monotonic()
+                for item_id, started, _ in in_flight.values()
+                if item_id not in finished and item_id not in backed_up
+            ]
+            timeout = max(0.0, min(deadlines)) if deadlines else None
+        done, _ = concurrent.futures.wait(
+            in_flight, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            item_id, _, _ = in_flight.pop(future)
+            if item_id in finished:
+                continue
+            twin_running = any(other == item_id for other, _, _ in in_flight.values())
+            if twin_running and (future.exception() is not None or future.result().get("errors")):
+                # The other attempt may still succeed.
+                continue
+            finished.add(item_id)
+            collect(future)
+    # Attempts that lost the race and are still running.
+    return [
+        (work_items[item_id], attempt)
+        for future, (item_id, _, attempt) in in_flight.items()
+        if not future.done()
+    ]
 
 
 def _write_scan_manifest(
@@ -433,6 +949,7 @@ def _write_scan_manifest(
     dimensions,
     scan_points,
     settings,
+    completed=(),
 ):
     points = []
     for index, values in enumerate(scan_points):
@@ -451,6 +968,7 @@ def _write_scan_manifest(
                 if scan_mode == "optimization"
                 else None,
                 "result_file": point_result_path,
+                "completed": index in completed,
             }
         )
     payload = {
@@ -497,6 +1015,35 @@ def run_scan_point_from_manifest(
     if target is None:
         raise ValueError(f"Scan point {index} not found in manifest.")
     settings = manifest.get("settings") or {}
+    scan_dir = manifest.get("scan_dir")
+    completed = _load_completed_scan_point(
+        scan_dir,
+        index,
+        _scan_point_fingerprint(
+            values=target.get("values") or [],
+            dimensions=manifest.get("dimensions") or [],
+            scan_mode=manifest.get("scan_mode"),
+            xyz_file=manifest.get("xyz_file"),
+            charge=settings.get("charge"),
+            spin=settings.get("spin"),
+            multiplicity=settings.get("multiplicity"),
+            basis=settings.get("basis"),
+            xc=settings.get("xc"),
+            scf_config=settings.get("scf_config"),
+            solvent_name=settings.get("solvent"),
+            solvent_model=settings.get("solvent_model"),
+            solvent_eps=settings.get("solvent_eps"),
+            dispersion_model=settings.get("dispersion"),
+            optimizer_mode=settings.get("optimizer_mode"),
+            optimizer_ase_dict=settings.get("optimizer_ase"),
+            constraints=settings.get("constraints"),
+        ),
+    )
+    if completed is not None:
+        logging.info(
+            "Scan point %s already completed; reusing %s.", index, target.get("result_file")
+        )
+        return completed
     thread_count = settings.get("threads_per_worker") or settings.get("thread_count") or 1
     return _run_scan_point(
         index=index,
@@ -505,7 +1052,7 @@ def run_scan_point_from_manifest(
         scan_mode=manifest.get("scan_mode"),
         xyz_file=manifest.get("xyz_file"),
         seed_chkfile=settings.get("seed_chkfile"),
-        scan_dir=manifest.get("scan_dir"),
+        scan_dir=scan_dir,
         run_dir=target.get("work_dir") or manifest.get("run_dir"),
         charge=settings.get("charge"),
         spin=settings.get("spin"),
@@ -537,8 +1084,40 @@ def _resolve_scan_executor_state(
     thread_count,
     openmp_available,
     effective_threads,
+    grid_counts=None,
 ):
     scan_executor = _normalize_scan_executor(scan_config.get("executor"))
+    schedule = scan_config.get("schedule") or "batch"
+    if schedule == "wavefront":
+        if scan_executor != "local":
+            logging.warning(
+                "scan.schedule=wavefront only applies to the local executor; ignoring it."
+            )
+            schedule = "batch"
+        elif len(grid_counts or []) != 2:
+            logging.warning(
+                "scan.schedule=wavefront requires a 2D scan grid; using batch scheduling."
+            )
+            schedule = "batch"
+    chain_order = None
+    if scan_config.get("chain"):
+        if scan_executor == "manifest":
+            logging.warning(
+                "scan.chain is ignored by the manifest executor; points run independently."
+            )
+        else:
+            chain_order = _build_scan_chain_order(grid_counts or [total_points])
+    order = scan_config.get("order") or "grid"
+    straggler_timeout = scan_config.get("straggler_timeout")
+    if (order != "grid" or straggler_timeout) and (
+        scan_executor != "local" or schedule != "batch" or chain_order
+    ):
+        logging.warning(
+            "scan.order and scan.straggler_timeout only apply to unchained batch "
+            "scheduling on the local executor; ignoring them."
+        )
+        order = "grid"
+        straggler_timeout = None
     scan_max_workers = None
     scan_batch_size = None
     manifest_setting = scan_config.get("manifest_file")
@@ -577,6 +1156,11 @@ def _resolve_scan_executor_state(
         "executor": scan_executor,
         "max_workers": scan_max_workers,
         "batch_size": scan_batch_size,
+        "chain_order": chain_order,
+        "schedule": schedule,
+        "order": order,
+        "straggler_timeout": straggler_timeout,
+        "grid_counts": list(grid_counts or [total_points]),
         "manifest_path": scan_manifest_path,
         "thread_count": scan_thread_count,
         "openmp_available": openmp_available,
@@ -711,7 +1295,14 @@ def _build_scan_summary(
             "threads_per_worker": executor_state["thread_count"],
             "batch_size": executor_state["batch_size"]
             if executor_state["executor"] == "local"
+            and executor_state["schedule"] == "batch"
+            and not executor_state["chain_order"]
             else None,
+            "chain": bool(executor_state["chain_order"]),
+            "schedule": executor_state["schedule"],
+            "order": executor_state["order"],
+            "straggler_timeout": executor_state["straggler_timeout"],
+            "adaptive": executor_state["adaptive"],
             "write_interval_points": scan_write_interval_points,
         }
     )
@@ -739,12 +1330,17 @@ def _run_scan_capability_check_if_needed(
     memory_mb,
     multiplicity,
     engine_adapter,
+    recheck=False,
+    probe_mode=False,
 ):
     if scan_executor == "manifest":
         logging.info("Manifest executor selected; skipping capability check.")
-        return
+        return None
     mol = molecule_context["mol"]
-    engine_adapter.run_capability_check(
+    run_check = _start_capability_probe if probe_mode else _run_cached_capability_check
+    result = run_check(
+        engine_adapter,
+        "scan (SCF + gradient)",
         mol,
         calc_state["basis"],
         calc_state["xc"],
@@ -760,7 +1356,9 @@ def _run_scan_capability_check_if_needed(
         memory_mb=memory_mb,
         optimizer_mode=calc_state["optimizer_mode"],
         multiplicity=multiplicity,
+        recheck=recheck,
     )
+    return result if probe_mode else None
 
 
 def _log_scan_execution_plan(
@@ -775,10 +1373,31 @@ def _log_scan_execution_plan(
 ):
     logging.info("Starting scan (%s mode) with %d points.", scan_mode, point_count)
     logging.info("Scan executor: %s", executor_state["executor"])
+    if executor_state["adaptive"]:
+        logging.info(
+            "Adaptive refinement: tolerance %s Eh, up to %s points, min step %s.",
+            executor_state["adaptive"]["tolerance"],
+            executor_state["adaptive"]["max_points"],
+            executor_state["adaptive"]["min_step"],
+        )
     if executor_state["executor"] == "local":
         logging.info("Scan workers: %s", executor_state["max_workers"])
-        if executor_state["batch_size"]:
-            logging.info("Scan batch size: %s", executor_state["batch_size"])
+        if executor_state["schedule"] == "wavefront":
+            logging.info("Scan schedule: wavefront (points seeded from finished neighbours).")
+        elif executor_state["chain_order"]:
+            logging.info("Scan chaining: each worker walks a contiguous segment of the grid.")
+        else:
+            logging.info(
+                "Scan dispatch: %s point(s) per task, %s order.",
+                executor_state["batch_size"],
+                "most expensive first" if executor_state["order"] == "cost" else "grid",
+            )
+            if executor_state["straggler_timeout"]:
+                logging.info(
+                    "Straggler re-dispatch after %s s.", executor_state["straggler_timeout"]
+                )
+    elif executor_state["chain_order"]:
+        logging.info("Scan chaining: each point starts from the previous optimized point.")
     if executor_state["thread_count"]:
         logging.info("Threads per worker: %s", executor_state["thread_count"])
     if memory_mb:
@@ -799,6 +1418,7 @@ def _build_scan_result_writer(
     scan_write_interval_points,
     scan_summary,
     run_metadata_path,
+    scan_points=None,
 ):
     last_scan_write = {"count": 0}
 
@@ -811,7 +1431,9 @@ def _build_scan_result_writer(
             or scan_write_interval_points <= 1
             or completed - last_scan_write["count"] >= scan_write_interval_points
         ):
-            _write_scan_results(results_by_index, scan_result_path, scan_result_csv_path)
+            _write_scan_results(
+                results_by_index, scan_result_path, scan_result_csv_path, scan_points
+            )
             scan_summary["scan"]["completed_points"] = completed
             scan_summary["run_updated_at"] = datetime.now().isoformat()
             write_run_metadata(run_metadata_path, scan_summary)
@@ -867,8 +1489,9 @@ def _finalize_scan_manifest_only(
     run_dir,
     scan_summary,
     queue_update_fn,
+    completed_points=0,
 ):
-    scan_summary["scan"]["completed_points"] = 0
+    scan_summary["scan"]["completed_points"] = completed_points
     scan_summary["summary"] = {
         "elapsed_seconds": time.perf_counter() - run_start,
         "n_points": 0,
@@ -908,6 +1531,7 @@ def _execute_manifest_scan(
     verbose,
     scan_write_interval_points,
     profiling_enabled,
+    completed=(),
 ):
     manifest_settings = _build_manifest_settings(
         calc_state=calc_state,
@@ -929,6 +1553,7 @@ def _execute_manifest_scan(
         dimensions=dimensions,
         scan_points=scan_points,
         settings=manifest_settings,
+        completed=completed,
     )
     logging.info("Wrote scan manifest to %s", executor_state["manifest_path"])
 
@@ -952,72 +1577,159 @@ def _execute_local_scan(
     results_by_index,
     maybe_write_scan_results,
     engine_adapter,
+    capability_probe=None,
 ):
     error = None
-    batch_size = executor_state["batch_size"] or 1
-    batches = _build_scan_batches(scan_points, batch_size)
-    with concurrent.futures.ProcessPoolExecutor(
-        max_workers=executor_state["max_workers"]
-    ) as executor:
-        futures = {}
-        for batch in batches:
-            futures[
-                executor.submit(
-                    _run_scan_batch,
-                    batch_items=batch,
-                    dimensions=dimensions,
-                    scan_mode=scan_mode,
-                    xyz_file=args.xyz_file,
-                    seed_chkfile=calc_state["seed_chkfile"],
-                    scan_dir=scan_dir,
-                    run_dir=run_dir,
-                    charge=charge,
-                    spin=spin,
-                    multiplicity=multiplicity,
-                    basis=calc_state["basis"],
-                    xc=calc_state["xc"],
-                    scf_config=calc_state["scf_config"],
-                    solvent_name=calc_state["solvent_name"],
-                    solvent_model=calc_state["solvent_model"],
-                    solvent_eps=calc_state["solvent_eps"],
-                    dispersion_model=calc_state["dispersion_model"],
-                    optimizer_mode=calc_state["optimizer_mode"],
-                    optimizer_ase_dict=calc_state["optimizer_ase_dict"],
-                    constraints=calc_state["constraints"],
-                    verbose=verbose,
-                    memory_mb=memory_mb,
-                    thread_count=executor_state["thread_count"],
-                    parallel=True,
-                    profiling_enabled=profiling_enabled,
-                    engine_adapter=engine_adapter,
+    chain_order = executor_state.get("chain_order")
+    wavefront = executor_state.get("schedule") == "wavefront"
+
+    def _submit(executor, batch, chain_state=None, attempt=None):
+        return executor.submit(
+            _run_scan_batch,
+            batch_items=batch,
+            dimensions=dimensions,
+            scan_mode=scan_mode,
+            xyz_file=args.xyz_file,
+            seed_chkfile=calc_state["seed_chkfile"],
+            scan_dir=scan_dir,
+            run_dir=run_dir,
+            charge=charge,
+            spin=spin,
+            multiplicity=multiplicity,
+            basis=calc_state["basis"],
+            xc=calc_state["xc"],
+            scf_config=calc_state["scf_config"],
+            solvent_name=calc_state["solvent_name"],
+            solvent_model=calc_state["solvent_model"],
+            solvent_eps=calc_state["solvent_eps"],
+            dispersion_model=calc_state["dispersion_model"],
+            optimizer_mode=calc_state["optimizer_mode"],
+            optimizer_ase_dict=calc_state["optimizer_ase_dict"],
+            constraints=calc_state["constraints"],
+            verbose=verbose,
+            memory_mb=memory_mb,
+            thread_count=executor_state["thread_count"],
+            parallel=True,
+            profiling_enabled=profiling_enabled,
+            engine_adapter=engine_adapter,
+            chain=bool(chain_order),
+            chain_state=chain_state,
+            attempt=attempt,
+        )
+
+    def _wait_for_probe(futures):
+        if capability_probe is None:
+            return
+        # Workers are already busy; the main process only waits on the probe.
+        try:
+            capability_probe.wait()
+        except RuntimeError:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def _collect(future):
+        nonlocal error
+        try:
+            batch_result = future.result()
+        except Exception as exc:
+            logging.exception("Scan batch failed.")
+            error = exc
+            return
+        for point_result in batch_result.get("results", []):
+            if batch_result.get("attempt") is not None:
+                point_result = _promote_scan_point_attempt(point_result, scan_dir)
+            results_by_index[point_result["index"]] = point_result
+        for failure in batch_result.get("errors", []):
+            logging.error(
+                "Scan point %s failed: %s",
+                failure.get("index"),
+                failure.get("error"),
+            )
+            if failure.get("traceback"):
+                logging.error("%s", failure.get("traceback"))
+            if error is None:
+                error = RuntimeError(
+                    "Scan point {index} failed: {error}".format(
+                        index=failure.get("index"),
+                        error=failure.get("error"),
+                    )
                 )
-            ] = batch
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                batch_result = future.result()
-            except Exception as exc:
-                logging.exception("Scan batch failed.")
-                error = exc
-                continue
-            for point_result in batch_result.get("results", []):
-                results_by_index[point_result["index"]] = point_result
-            for failure in batch_result.get("errors", []):
-                logging.error(
-                    "Scan point %s failed: %s",
-                    failure.get("index"),
-                    failure.get("error"),
+        if batch_result.get("results") or batch_result.get("errors"):
+            maybe_write_scan_results(force=bool(batch_result.get("errors")))
+
+    superseded = []
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=executor_state["max_workers"])
+    try:
+        if wavefront:
+            _run_wavefront_schedule(
+                executor=executor,
+                submit=_submit,
+                collect=_collect,
+                wait_for_probe=_wait_for_probe,
+                scan_points=scan_points,
+                grid_counts=executor_state["grid_counts"],
+                max_workers=executor_state["max_workers"] or 1,
+                results_by_index=results_by_index,
+                scan_dir=scan_dir,
+                scan_mode=scan_mode,
+                scf_config=calc_state["scf_config"],
+            )
+        elif chain_order:
+            futures = []
+            pending_order = [index for index in chain_order if index not in results_by_index]
+            batches = (
+                _build_scan_chain_segments(
+                    scan_points, pending_order, executor_state["max_workers"] or 1
                 )
-                if failure.get("traceback"):
-                    logging.error("%s", failure.get("traceback"))
-                if error is None:
-                    error = RuntimeError(
-                        "Scan point {index} failed: {error}".format(
-                            index=failure.get("index"),
-                            error=failure.get("error"),
-                        )
+                if pending_order
+                else []
+            )
+            for batch in batches:
+                # A resumed segment starts from the point before it on the walk.
+                position = chain_order.index(batch[0][0])
+                previous = chain_order[position - 1] if position else None
+                futures.append(
+                    _submit(
+                        executor,
+                        batch,
+                        _scan_point_chain_state(
+                            results_by_index.get(previous),
+                            scan_dir=scan_dir,
+                            scan_mode=scan_mode,
+                            scf_config=calc_state["scf_config"],
+                        ),
                     )
-            if batch_result.get("results") or batch_result.get("errors"):
-                maybe_write_scan_results(force=bool(batch_result.get("errors")))
+                )
+            _wait_for_probe(futures)
+            for future in concurrent.futures.as_completed(futures):
+                _collect(future)
+        else:
+            order = None
+            if executor_state.get("order") == "cost":
+                costs = _estimate_scan_point_costs(args.xyz_file, dimensions, scan_points)
+                order = sorted(range(len(scan_points)), key=lambda index: -costs[index])
+            superseded = _run_dynamic_schedule(
+                executor=executor,
+                submit=_submit,
+                collect=_collect,
+                wait_for_probe=_wait_for_probe,
+                work_items=_build_scan_batches(
+                    scan_points,
+                    executor_state["batch_size"] or 1,
+                    completed=results_by_index,
+                    order=order,
+                ),
+                max_in_flight=executor_state["max_workers"] or 1,
+                straggler_timeout=executor_state.get("straggler_timeout"),
+            )
+    finally:
+        if superseded:
+            _terminate_scan_attempts(
+                scan_dir,
+                [(index, attempt) for batch, attempt in superseded for index, _ in batch],
+            )
+        executor.shutdown(wait=True)
     if error:
         maybe_write_scan_results(force=True)
         raise error
@@ -1043,16 +1755,25 @@ def _execute_serial_scan(
     results_by_index,
     maybe_write_scan_results,
     engine_adapter,
+    capability_probe=None,
 ):
+    from ase.io import read as ase_read
+
     atoms_template = None
     if scan_executor == "serial":
-        from ase.io import read as ase_read
-
         atoms_template = ase_read(args.xyz_file)
-    for index, values in enumerate(scan_points):
+    chain_order = executor_state.get("chain_order")
+    chain_state = {} if chain_order else None
+    for index in chain_order or range(len(scan_points)):
+        if index in results_by_index:
+            if chain_state is not None and scan_mode == "optimization":
+                # The restored geometry still seeds the next point; its Hessian is gone.
+                chain_state["atoms"] = ase_read(results_by_index[index]["output_xyz"])
+                chain_state.pop("hessian", None)
+            continue
         point_result = _run_scan_point(
             index=index,
-            values=values,
+            values=scan_points[index],
             dimensions=dimensions,
             scan_mode=scan_mode,
             xyz_file=args.xyz_file,
@@ -1079,9 +1800,176 @@ def _execute_serial_scan(
             parallel=False,
             profiling_enabled=profiling_enabled,
             engine_adapter=engine_adapter,
+            chain_state=chain_state,
         )
         results_by_index[index] = point_result
         maybe_write_scan_results()
+        if capability_probe is not None:
+            capability_probe.poll()
+
+
+def _execute_adaptive_refinement(
+    *,
+    args,
+    dimensions,
+    scan_mode,
+    scan_points,
+    scan_dir,
+    run_dir,
+    charge,
+    spin,
+    multiplicity,
+    calc_state,
+    verbose,
+    memory_mb,
+    executor_state,
+    profiling_enabled,
+    results_by_index,
+    maybe_write_scan_results,
+    engine_adapter,
+):
+    adaptive = executor_state["adaptive"]
+    parallel = executor_state["executor"] == "local"
+    batch_settings = {
+        "dimensions": dimensions,
+        "scan_mode": scan_mode,
+        "xyz_file": args.xyz_file,
+        "seed_chkfile": calc_state["seed_chkfile"],
+        "scan_dir": scan_dir,
+        "run_dir": run_dir,
+        "charge": charge,
+        "spin": spin,
+        "multiplicity": multiplicity,
+        "basis": calc_state["basis"],
+        "xc": calc_state["xc"],
+        "scf_config": calc_state["scf_config"],
+        "solvent_name": calc_state["solvent_name"],
+        "solvent_model": calc_state["solvent_model"],
+        "solvent_eps": calc_state["solvent_eps"],
+        "dispersion_model": calc_state["dispersion_model"],
+        "optimizer_mode": calc_state["optimizer_mode"],
+        "optimizer_ase_dict": calc_state["optimizer_ase_dict"],
+        "constraints": calc_state["constraints"],
+        "verbose": verbose,
+        "memory_mb": memory_mb,
+        "thread_count": executor_state["thread_count"],
+        "parallel": parallel,
+        "profiling_enabled": profiling_enabled,
+        "engine_adapter": engine_adapter,
+    }
+    pool = (
+        concurrent.futures.ProcessPoolExecutor(max_workers=executor_state["max_workers"])
+        if parallel
+        else None
+    )
+    refinement_round = 0
+    try:
+        while len(scan_points) < adaptive["max_points"]:
+            energies_by_value = {}
+            for index, point_result in results_by_index.items():
+                if point_result.get("energy") is not None:
+                    energies_by_value[float(scan_points[index][0])] = (
+                        point_result["energy"],
+                        index,
+                    )
+            values = sorted(energies_by_value)
+            positions = _select_adaptive_refinements(
+                values,
+                [energies_by_value[value][0] for value in values],
+                tolerance=adaptive["tolerance"],
+                min_step=adaptive["min_step"],
+                limit=adaptive["max_points"] - len(scan_points),
+            )
+            if not positions:
+                break
+            refinement_round += 1
+            start = len(scan_points)
+            seeds = {}
+            for position in positions:
+                seeds[len(scan_points)] = energies_by_value[values[position]][1]
+                scan_points.append(((values[position] + values[position + 1]) / 2,))
+            restored = _load_completed_scan_points(
+                scan_dir=scan_dir,
+                scan_points=scan_points,
+                start=start,
+                dimensions=dimensions,
+                scan_mode=scan_mode,
+                xyz_file=args.xyz_file,
+                charge=charge,
+                spin=spin,
+                multiplicity=multiplicity,
+                calc_state=calc_state,
+            )
+            results_by_index.update(restored)
+            logging.info(
+                "Adaptive scan round %d: refining %d intervals (%d restored).",
+                refinement_round,
+                len(positions),
+                len(restored),
+            )
+            batch_results = []
+            futures = []
+            for index in range(start, len(scan_points)):
+                if index in restored:
+                    continue
+                # With chaining, a new point starts from its lower neighbour.
+                chain_state = (
+                    _scan_point_chain_state(
+                        results_by_index.get(seeds[index]),
+                        scan_dir=scan_dir,
+                        scan_mode=scan_mode,
+                        scf_config=calc_state["scf_config"],
+                    )
+                    if executor_state["chain_order"]
+                    else None
+                )
+                batch_items = [(index, scan_points[index])]
+                if pool is None:
+                    batch_results.append(
+                        _run_scan_batch(
+                            batch_items=batch_items, chain_state=chain_state, **batch_settings
+                        )
+                    )
+                else:
+                    futures.append(
+                        pool.submit(
+                            _run_scan_batch,
+                            batch_items=batch_items,
+                            chain_state=chain_state,
+                            **batch_settings,
+                        )
+                    )
+            batch_results.extend(future.result() for future in futures)
+            failures = []
+            for batch_result in batch_results:
+                for point_result in batch_result.get("results", []):
+                    results_by_index[point_result["index"]] = point_result
+                failures.extend(batch_result.get("errors", []))
+            maybe_write_scan_results(force=True)
+            if failures:
+                for failure in failures:
+                    logging.error(
+                        "Scan point %s failed: %s",
+                        failure.get("index"),
+                        failure.get("error"),
+                    )
+                    if failure.get("traceback"):
+                        logging.error("%s", failure.get("traceback"))
+                raise RuntimeError(
+                    "Scan point {index} failed: {error}".format(
+                        index=failures[0].get("index"),
+                        error=failures[0].get("error"),
+                    )
+                )
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    logging.info(
+        "Adaptive scan finished after %d rounds with %d points.",
+        refinement_round,
+        len(scan_points),
+    )
+    return refinement_round
 
 
 def _finalize_scan_with_results(
@@ -1097,8 +1985,11 @@ def _finalize_scan_with_results(
     run_id,
     run_dir,
     queue_update_fn,
+    scan_points=None,
 ):
-    results = _write_scan_results(results_by_index, scan_result_path, scan_result_csv_path)
+    results = _write_scan_results(
+        results_by_index, scan_result_path, scan_result_csv_path, scan_points
+    )
     elapsed_seconds = time.perf_counter() - run_start
     converged_points = sum(1 for item in results if item.get("converged") is True)
     scan_summary["summary"] = {
@@ -1167,6 +2058,10 @@ def run_scan_stage(
         thread_count,
         openmp_available,
         effective_threads,
+        grid_counts=[len(values) for values in values_grid],
+    )
+    executor_state["adaptive"] = _resolve_scan_adaptive_settings(
+        scan_config, values_grid, executor_state["executor"]
     )
     calc_state = _resolve_scan_calculation_state(context, scan_mode)
     scan_summary = _build_scan_summary(
@@ -1193,7 +2088,7 @@ def run_scan_stage(
         calc_state=calc_state,
     )
     _record_scan_start(scan_summary, run_metadata_path, event_log_path, run_id, run_dir, context)
-    _run_scan_capability_check_if_needed(
+    capability_probe = _run_scan_capability_check_if_needed(
         scan_executor=executor_state["executor"],
         molecule_context=molecule_context,
         calc_state=calc_state,
@@ -1201,6 +2096,8 @@ def run_scan_stage(
         memory_mb=memory_mb,
         multiplicity=multiplicity,
         engine_adapter=engine_adapter,
+        recheck=bool(context.get("capability_recheck")),
+        probe_mode=context.get("capability_check_mode") == "probe",
     )
     _log_scan_execution_plan(
         scan_mode=scan_mode,
@@ -1213,7 +2110,25 @@ def run_scan_stage(
     )
 
     run_start = time.perf_counter()
-    results_by_index: dict[int, dict[str, object]] = {}
+    results_by_index: dict[int, dict[str, object]] = _load_completed_scan_points(
+        scan_dir=scan_dir,
+        scan_points=scan_points,
+        dimensions=dimensions,
+        scan_mode=scan_mode,
+        xyz_file=args.xyz_file,
+        charge=charge,
+        spin=spin,
+        multiplicity=multiplicity,
+        calc_state=calc_state,
+    )
+    scan_summary["scan"]["resumed_points"] = len(results_by_index)
+    if results_by_index:
+        logging.info(
+            "Resuming scan: %d of %d points already completed; dispatching the rest.",
+            len(results_by_index),
+            len(scan_points),
+        )
+    result_order_points = scan_points if executor_state["adaptive"] else None
     maybe_write_scan_results = _build_scan_result_writer(
         results_by_index=results_by_index,
         scan_result_path=scan_result_path,
@@ -1221,6 +2136,7 @@ def run_scan_stage(
         scan_write_interval_points=scan_write_interval_points,
         scan_summary=scan_summary,
         run_metadata_path=run_metadata_path,
+        scan_points=result_order_points,
     )
     try:
         if executor_state["executor"] == "manifest":
@@ -1240,6 +2156,7 @@ def run_scan_stage(
                 verbose=verbose,
                 scan_write_interval_points=scan_write_interval_points,
                 profiling_enabled=profiling_enabled,
+                completed=results_by_index,
             )
             _finalize_scan_manifest_only(
                 run_start=run_start,
@@ -1251,6 +2168,7 @@ def run_scan_stage(
                 run_dir=run_dir,
                 scan_summary=scan_summary,
                 queue_update_fn=queue_update_fn,
+                completed_points=len(results_by_index),
             )
             return
 
@@ -1273,6 +2191,7 @@ def run_scan_stage(
                 results_by_index=results_by_index,
                 maybe_write_scan_results=maybe_write_scan_results,
                 engine_adapter=engine_adapter,
+                capability_probe=capability_probe,
             )
         else:
             _execute_serial_scan(
@@ -1294,8 +2213,35 @@ def run_scan_stage(
                 results_by_index=results_by_index,
                 maybe_write_scan_results=maybe_write_scan_results,
                 engine_adapter=engine_adapter,
+                capability_probe=capability_probe,
             )
 
+        if capability_probe is not None:
+            capability_probe.wait()
+        if executor_state["adaptive"]:
+            coarse_points = len(scan_points)
+            refinement_rounds = _execute_adaptive_refinement(
+                args=args,
+                dimensions=dimensions,
+                scan_mode=scan_mode,
+                scan_points=scan_points,
+                scan_dir=scan_dir,
+                run_dir=run_dir,
+                charge=charge,
+                spin=spin,
+                multiplicity=multiplicity,
+                calc_state=calc_state,
+                verbose=verbose,
+                memory_mb=memory_mb,
+                executor_state=executor_state,
+                profiling_enabled=profiling_enabled,
+                results_by_index=results_by_index,
+                maybe_write_scan_results=maybe_write_scan_results,
+                engine_adapter=engine_adapter,
+            )
+            scan_summary["scan"]["refinement_rounds"] = refinement_rounds
+            scan_summary["scan"]["refined_points"] = len(scan_points) - coarse_points
+            scan_summary["scan"]["total_points"] = len(scan_points)
         _finalize_scan_with_results(
             results_by_index=results_by_index,
             scan_result_path=scan_result_path,
@@ -1308,8 +2254,11 @@ def run_scan_stage(
             run_id=run_id,
             run_dir=run_dir,
             queue_update_fn=queue_update_fn,
+            scan_points=result_order_points,
         )
     except Exception as exc:
+        if capability_probe is not None:
+            capability_probe.cancel()
         logging.exception("Scan calculation failed.")
         finalize_metadata(
             run_metadata_path,
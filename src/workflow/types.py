@@ -27,6 +27,8 @@ class RunContext(TypedDict):
     memory_gb: float | None
     verbose: bool
     profiling_enabled: NotRequired[bool]
+    capability_recheck: NotRequired[bool]
+    capability_check_mode: NotRequired[str]
     io_write_interval_steps: NotRequired[int]
     io_write_interval_seconds: NotRequired[float | None]
     scan_write_interval_points: NotRequired[int]
@@ -68,6 +70,7 @@ class RunContext(TypedDict):
     freq_dispersion_mode: NotRequired[str]
     freq_dispersion_model: NotRequired[str | None]
     freq_dispersion_step: NotRequired[float | None]
+    freq_hessian_settings: NotRequired[dict[str, Any]]
     freq_scf_config: NotRequired[dict[str, Any]]
     frequency_use_chkfile: NotRequired[bool]
 
@@ -104,6 +107,8 @@ class OptimizationStageContext(TypedDict):
     memory_gb: float | None
     verbose: bool
     profiling_enabled: NotRequired[bool]
+    capability_recheck: NotRequired[bool]
+    capability_check_mode: NotRequired[str]
     io_write_interval_steps: NotRequired[int]
     io_write_interval_seconds: NotRequired[float | None]
     snapshot_interval_steps: NotRequired[int]
@@ -143,5 +148,6 @@ class OptimizationStageContext(TypedDict):
     freq_dispersion_mode: NotRequired[str]
     freq_dispersion_model: NotRequired[str | None]
     freq_dispersion_step: NotRequired[float | None]
+    freq_hessian_settings: NotRequired[dict[str, Any]]
     freq_scf_config: NotRequired[dict[str, Any]]
     frequency_use_chkfile: NotRequired[bool]
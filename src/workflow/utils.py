@@ -1,13 +1,28 @@
 import copy
+import hashlib
 import json
 import logging
 import os
 import re
 import shutil
+import time
+from datetime import datetime
 
-from run_opt_metadata import get_package_version, write_checkpoint
+from run_opt_metadata import compute_method_fingerprint, get_package_version, write_checkpoint
+from run_opt_paths import get_cache_base_dir
 from run_opt_resources import ensure_parent_dir, resolve_run_path
 from run_opt_config import DEFAULT_SCF_CHKFILE
+from run_opt_engine import _speculative_scf_context
+
+CAPABILITY_CACHE_FILENAME = "capability_checks.json"
+CAPABILITY_CACHE_TTL_HOURS = 24 * 7
+CAPABILITY_CACHE_MAX_ENTRIES = 500
+SINGLE_POINT_REUSE_IGNORED_SCF_KEYS = (
+    "chkfile",
+    "retry_preset",
+    "retry_parallel",
+    "result_cache",
+)
 
 
 def _xc_includes_dispersion(xc):
@@ -64,6 +79,65 @@ def _resolve_d3_params(optimizer_ase_dict):
     return optimizer_ase_dict.get("d3_params") or optimizer_ase_dict.get("dftd3_params")
 
 
+def _single_point_method_fingerprint(
+    basis,
+    xc,
+    scf_config,
+    solvent_model,
+    solvent_name,
+    solvent_eps,
+    dispersion,
+    dispersion_params,
+):
+    # chkfile/retry/cache keys change how the SCF gets there, not the energy it lands on.
+    scf_settings = {
+        key: value
+        for key, value in (scf_config or {}).items()
+        if key not in SINGLE_POINT_REUSE_IGNORED_SCF_KEYS
+    }
+    return compute_method_fingerprint(
+        {
+            "basis": basis,
+            "xc": xc,
+            "scf": scf_settings,
+            "solvent_model": solvent_model.lower() if solvent_model else None,
+            "solvent_name": solvent_name,
+            "solvent_eps": solvent_eps,
+            "dispersion": dispersion,
+            "dispersion_params": dispersion_params if dispersion else None,
+        }
+    )
+
+
+def _reuse_optimizer_single_point(
+    final_point, optimizer_fingerprint=None, single_point_fingerprint=None
+):
+    if not final_point or optimizer_fingerprint != single_point_fingerprint:
+        return None
+    if not final_point.get("converged"):
+        return None
+    logging.info(
+        "Single-point settings match the optimizer; reusing its final SCF energy."
+    )
+    return {
+        "energy": final_point["energy"],
+        "converged": final_point["converged"],
+        "cycles": final_point.get("cycles"),
+        "dispersion": final_point.get("dispersion"),
+        "reused_from": "optimizer",
+    }
+
+
+def _resolve_irc_mode_solver(irc_config):
+    mode_solver = None
+    mode_count = None
+    if irc_config:
+        if irc_config.mode_solver:
+            mode_solver = irc_config.mode_solver.lower()
+        mode_count = irc_config.mode_count
+    return {"mode_solver": mode_solver, "mode_count": mode_count}
+
+
 def _frequency_units():
     return {
         "frequencies_wavenumber": "cm^-1",
@@ -187,6 +261,282 @@ def _frequency_versions():
     }
 
 
+def _capability_cache_path():
+    return os.path.join(get_cache_base_dir(), CAPABILITY_CACHE_FILENAME)
+
+
+def _capability_cache_ttl_seconds():
+    value = os.environ.get("DFTFLOW_CAPABILITY_CACHE_TTL_HOURS")
+    if value is None or not value.strip():
+        return CAPABILITY_CACHE_TTL_HOURS * 3600.0
+    try:
+        hours = float(value)
+    except ValueError:
+        logging.warning(
+            "Ignoring invalid DFTFLOW_CAPABILITY_CACHE_TTL_HOURS=%r; using %s hours.",
+            value,
+            CAPABILITY_CACHE_TTL_HOURS,
+        )
+        return CAPABILITY_CACHE_TTL_HOURS * 3600.0
+    return max(hours, 0.0) * 3600.0
+
+
+def _capability_cache_key(
+    mol,
+    basis,
+    xc,
+    scf_config,
+    solvent_model,
+    solvent_name,
+    solvent_eps,
+    dispersion,
+    dispersion_hessian_mode,
+    *,
+    dispersion_params=None,
+    require_hessian=False,
+    optimizer_mode=None,
+    probe=False,
+    **_kwargs,
+):
+    # Only the settings that decide whether PySCF/ASE can run the method are keyed;
+    # geometry, chkfile paths and the exact charge/spin only matter through parity.
+    scf_settings = {
+        key: value for key, value in (scf_config or {}).items() if key != "chkfile"
+    }
+    payload = {
+        "basis": basis,
+        "xc": xc,
+        "scf": scf_settings,
+        "solvent_model": solvent_model,
+        "solvent_name": solvent_name,
+        "solvent_eps": solvent_eps,
+        "dispersion": dispersion,
+        "dispersion_hessian_mode": dispersion_hessian_mode,
+        "dispersion_params": dispersion_params,
+        "require_hessian": bool(require_hessian),
+        "optimizer_mode": optimizer_mode,
+        # A probe only checks a small stand-in molecule, so it never vouches for a full check.
+        "mode": "probe" if probe else "full",
+        "elements": sorted({mol.atom_pure_symbol(i) for i in range(mol.natm)}),
+        "charge_parity": int(mol.charge) % 2,
+        "spin_parity": int(mol.spin) % 2,
+        "open_shell": bool(mol.spin),
+        "versions": _frequency_versions(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _load_capability_cache(path):
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as exc:
+        logging.warning("Ignoring unreadable capability cache %s: %s", path, exc)
+        return {}
+    entries = payload.get("entries") if isinstance(payload, dict) else None
+    return entries if isinstance(entries, dict) else {}
+
+
+def _lookup_capability_cache(key, ttl_seconds, path=None):
+    entry = _load_capability_cache(path or _capability_cache_path()).get(key)
+    if not isinstance(entry, dict):
+        return None
+    checked_at = entry.get("checked_at")
+    if not isinstance(checked_at, (int, float)):
+        return None
+    if time.time() - checked_at > ttl_seconds:
+        return None
+    return entry
+
+
+def _record_capability_cache(key, ttl_seconds, details=None, path=None):
+    path = path or _capability_cache_path()
+    now = time.time()
+    entries = {
+        entry_key: entry
+        for entry_key, entry in _load_capability_cache(path).items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("checked_at"), (int, float))
+        and now - entry["checked_at"] <= ttl_seconds
+    }
+    entries[key] = {
+        "checked_at": now,
+        "checked_at_iso": datetime.fromtimestamp(now).isoformat(),
+        **(details or {}),
+    }
+    if len(entries) > CAPABILITY_CACHE_MAX_ENTRIES:
+        newest = sorted(entries.items(), key=lambda item: item[1]["checked_at"])
+        entries = dict(newest[-CAPABILITY_CACHE_MAX_ENTRIES:])
+    ensure_parent_dir(path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump({"entries": entries}, handle, indent=2)
+    os.replace(temp_path, path)
+
+
+def _lookup_cached_capability_check(description, args, kwargs, recheck):
+    ttl_seconds = _capability_cache_ttl_seconds()
+    key = None
+    if ttl_seconds > 0:
+        try:
+            key = _capability_cache_key(*args, **kwargs)
+        except Exception as exc:
+            logging.debug("Capability cache key unavailable: %s", exc)
+    if key and not recheck:
+        entry = _lookup_capability_cache(key, ttl_seconds)
+        if entry is None and kwargs.get("probe"):
+            # A passing full check covers everything a probe would test.
+            full_key = _capability_cache_key(*args, **{**kwargs, "probe": False})
+            entry = _lookup_capability_cache(full_key, ttl_seconds)
+        if entry is not None:
+            logging.info(
+                "Capability check for %s passed at %s; reusing cached result "
+                "(use --recheck to run it again).",
+                description,
+                entry.get("checked_at_iso"),
+            )
+            return key, ttl_seconds, True
+    return key, ttl_seconds, False
+
+
+def _store_capability_check(key, ttl_seconds, description, args, mode):
+    if not key:
+        return
+    try:
+        _record_capability_cache(
+            key,
+            ttl_seconds,
+            details={
+                "description": description,
+                "basis": args[1],
+                "xc": args[2],
+                "mode": mode,
+            },
+        )
+    except OSError as exc:
+        logging.warning("Failed to update capability cache: %s", exc)
+
+
+def _run_cached_capability_check(
+    engine_adapter, description, *args, recheck=False, **kwargs
+):
+    key, ttl_seconds, hit = _lookup_cached_capability_check(
+        description, args, kwargs, recheck
+    )
+    if hit:
+        return True
+    probe = bool(kwargs.get("probe"))
+    logging.info(
+        "Running capability %s for %s...", "probe" if probe else "check", description
+    )
+    engine_adapter.run_capability_check(*args, **kwargs)
+    _store_capability_check(
+        key, ttl_seconds, description, args, "probe" if probe else "full"
+    )
+    return False
+
+
+def _describe_capability_error(exc):
+    cause = exc.__cause__ or exc.__context__
+    if cause is not None and str(cause) and str(cause) != str(exc):
+        return f"{exc} ({cause})"
+    return str(exc)
+
+
+class _CapabilityProbe:
+    def __init__(self, *, description, process, receiver, on_success):
+        self.description = description
+        self.process = process
+        self.receiver = receiver
+        self.on_success = on_success
+        self.finished = False
+
+    def poll(self):
+        self._collect(block=False)
+
+    def wait(self):
+        self._collect(block=True)
+
+    def cancel(self):
+        if self.finished:
+            return
+        self.finished = True
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.receiver.close()
+
+    def _collect(self, *, block):
+        if self.finished:
+            return
+        if not block and not self.receiver.poll():
+            return
+        try:
+            error = self.receiver.recv()
+        except EOFError:
+            error = f"probe process exited with code {self.process.exitcode}"
+        self.process.join()
+        self.receiver.close()
+        self.finished = True
+        if error:
+            raise RuntimeError(
+                f"Capability probe for {self.description} failed: {error}"
+            )
+        logging.info("Capability probe for %s passed.", self.description)
+        self.on_success()
+
+
+def _run_capability_probe(engine_adapter, args, kwargs, sender):
+    try:
+        from pyscf import lib
+
+        lib.num_threads(1)
+        engine_adapter.run_capability_check(*args, **kwargs)
+    except BaseException as exc:
+        sender.send(_describe_capability_error(exc) or type(exc).__name__)
+    else:
+        sender.send(None)
+    finally:
+        sender.close()
+
+
+def _start_capability_probe(engine_adapter, description, *args, recheck=False, **kwargs):
+    kwargs["probe"] = True
+    key, ttl_seconds, hit = _lookup_cached_capability_check(
+        description, args, kwargs, recheck
+    )
+    if hit:
+        return None
+
+    # Do not fork: the parent may already have run PySCF kernels, and a forked
+    # child can deadlock in libgomp. The adapter and arguments are pickled.
+    context = _speculative_scf_context()
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_run_capability_probe,
+        args=(engine_adapter, args, kwargs, sender),
+        daemon=True,
+    )
+    process.start()
+    sender.close()
+    logging.info(
+        "Started capability probe for %s in the background (pid %s).",
+        description,
+        process.pid,
+    )
+    return _CapabilityProbe(
+        description=description,
+        process=process,
+        receiver=receiver,
+        on_success=lambda: _store_capability_check(
+            key, ttl_seconds, description, args, "probe"
+        ),
+    )
+
+
 def _thermochemistry_payload(thermo_config, thermochemistry):
     if thermochemistry is not None:
         return thermochemistry
@@ -509,6 +859,19 @@ def _apply_scan_geometry(atoms, dimensions, values):
     return atoms
 
 
+def _measure_scan_geometry(atoms, dimensions):
+    values = []
+    for dimension in dimensions:
+        indices = dimension["indices"]
+        if dimension["type"] == "bond":
+            values.append(atoms.get_distance(indices[0], indices[1]))
+        elif dimension["type"] == "angle":
+            values.append(atoms.get_angle(indices[0], indices[1], indices[2]))
+        else:
+            values.append(atoms.get_dihedral(indices[0], indices[1], indices[2], indices[3]))
+    return values
+
+
 def _atoms_to_atom_spec(atoms):
     symbols = atoms.get_chemical_symbols()
     positions = atoms.get_positions()
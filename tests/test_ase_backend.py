@@ -0,0 +1,434 @@
+import numpy as np
+import pytest
+
+from ase_backend import (
+    _extrapolate_density_guess,
+    _geometry_cache_key,
+    _project_density_guess,
+    _resolve_result_cache_size,
+    _resolve_scf_session_mode,
+    _resolve_scf_warm_start_settings,
+    _select_precision_tier,
+)
+
+
+def test_project_density_guess_restores_electron_count():
+    overlap = np.array([[1.0, 0.4], [0.4, 1.0]])
+    mo_coeff = np.array([[0.8, 0.6], [0.6, -0.8]])
+    mo_occ = np.array([2.0, 0.0])
+
+    dm = _project_density_guess(overlap, mo_coeff, mo_occ)
+
+    assert np.trace(dm @ overlap) == pytest.approx(2.0)
+    assert np.allclose(dm, dm.T)
+
+
+def test_project_density_guess_handles_unrestricted_orbitals():
+    overlap = np.eye(2)
+    mo_coeff = np.stack([np.eye(2), np.eye(2)])
+    mo_occ = np.array([[1.0, 0.0], [0.0, 0.0]])
+
+    dm = _project_density_guess(overlap, mo_coeff, mo_occ)
+
+    assert dm.shape == (2, 2, 2)
+    assert np.trace(dm[0]) == pytest.approx(1.0)
+    assert np.allclose(dm[1], 0.0)
+
+
+def test_extrapolate_density_guess_is_linear_for_first_order():
+    history = [np.full((2, 2), 1.0), np.full((2, 2), 2.0)]
+
+    assert np.allclose(_extrapolate_density_guess(history, 1), 3.0)
+    assert np.allclose(_extrapolate_density_guess(history, 2), 2.0)
+    assert np.allclose(_extrapolate_density_guess(history, 0), 2.0)
+
+
+def test_resolve_scf_warm_start_settings_defaults_to_enabled():
+    assert _resolve_scf_warm_start_settings({}) == (True, 0)
+    assert _resolve_scf_warm_start_settings(
+        {"scf_warm_start": False, "scf_extrapolation_order": 2}
+    ) == (False, 2)
+
+
+def test_resolve_scf_session_mode_normalizes_and_rejects_unknown():
+    assert _resolve_scf_session_mode({}) == "rebuild"
+    assert _resolve_scf_session_mode({"scf_session": " Scanner "}) == "scanner"
+    with pytest.raises(ValueError, match="Use rebuild or scanner"):
+        _resolve_scf_session_mode({"scf_session": "cached"})
+
+
+def test_geometry_cache_key_rounds_coordinates_and_signed_zero():
+    positions = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 0.74]])
+    nudged = positions + 1e-11
+    mirrored = np.array([[-0.0, 0.0, 0.0], [0.0, -0.0, 0.74]])
+
+    key = _geometry_cache_key("fp", ["H", "H"], positions)
+
+    assert _geometry_cache_key("fp", ["H", "H"], nudged) == key
+    assert _geometry_cache_key("fp", ["H", "H"], mirrored) == key
+    assert _geometry_cache_key("other", ["H", "H"], positions) != key
+    assert _geometry_cache_key("fp", ["H", "H"], positions + 1e-4) != key
+
+
+def test_resolve_result_cache_size_rejects_negative_values():
+    assert _resolve_result_cache_size({}) == 8
+    assert _resolve_result_cache_size({"result_cache_size": 0}) == 0
+    with pytest.raises(ValueError, match="result_cache_size"):
+        _resolve_result_cache_size({"result_cache_size": -1})
+
+
+def _build_fake_calculator_class(energy, force):
+    from ase.calculators.calculator import Calculator, all_changes
+
+    class _FakeCalculator(Calculator):
+        implemented_properties = ["energy", "forces"]
+
+        def __init__(self, **kwargs):
+            kwargs.pop("atoms", None)
+            super().__init__()
+            self.calls = 0
+
+        def calculate(self, atoms=None, properties=None, system_changes=all_changes):
+            super().calculate(atoms, properties, system_changes)
+            self.calls += 1
+            self.results["energy"] = energy
+            self.results["forces"] = np.full((len(atoms), 3), force)
+
+        def get_profile(self):
+            return {"scf_seconds": 0.0}
+
+    return _FakeCalculator
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_sum_calculator_merges_dispersion_parts(monkeypatch, concurrent):
+    pytest.importorskip("pyscf")
+    ase_build = pytest.importorskip("ase.build")
+    import ase_backend
+
+    monkeypatch.setattr(
+        ase_backend,
+        "parse_dispersion_settings",
+        lambda *args, **kwargs: {"backend": "d3", "settings": {}},
+    )
+    monkeypatch.setattr(
+        ase_backend,
+        "load_d3_calculator",
+        lambda _backend: (_build_fake_calculator_class(-0.5, 0.25), None),
+    )
+    atoms = ase_build.molecule("H2O")
+    calc = ase_backend._build_pyscf_calculator(
+        atoms=atoms,
+        run_dir=None,
+        charge=0,
+        spin=0,
+        multiplicity=1,
+        basis="sto-3g",
+        xc="b3lyp",
+        scf_config={},
+        solvent_model=None,
+        solvent_name=None,
+        solvent_eps=None,
+        dispersion_model="d3bj",
+        verbose=False,
+        memory_mb=None,
+        optimizer_config={"concurrent_dispersion": concurrent},
+        optimization_mode="minimum",
+        profiling_enabled=True,
+    )
+    calc.calculators[0] = _build_fake_calculator_class(-10.0, 1.0)()
+    atoms.calc = calc
+
+    assert atoms.get_potential_energy() == pytest.approx(-10.5)
+    assert np.allclose(atoms.get_forces(), 1.25)
+    profile = calc.get_profile()
+    assert profile["dispersion_calls"] == 1
+    assert profile["dispersion_concurrent"] is concurrent
+
+
+def test_hessian_to_ev_flattens_pyscf_block_layout():
+    from ase import units
+
+    from ase_backend import _hessian_to_ev
+
+    hessian = np.zeros((2, 2, 3, 3))
+    hessian[0, 1, 2, 0] = 1.0
+
+    flattened = _hessian_to_ev(hessian, 2)
+
+    assert flattened[2, 3] == pytest.approx(units.Hartree / units.Bohr ** 2)
+    with pytest.raises(ValueError, match="atom count does not match"):
+        _hessian_to_ev(hessian, 3)
+
+
+def test_regularize_minimum_hessian_is_positive_definite():
+    from ase_backend import _regularize_minimum_hessian
+
+    positions = np.array([[0.0, 0.0, 0.0], [0.96, 0.0, 0.0], [-0.24, 0.93, 0.0]])
+    hessian = np.diag([-1.0, 5.0, 0.0, 2.0, 0.0, 3.0, 1.0, 0.0, 4.0])
+
+    regularized = _regularize_minimum_hessian(hessian, positions)
+
+    assert np.allclose(regularized, regularized.T)
+    assert np.linalg.eigvalsh(regularized).min() > 0
+
+
+def test_run_ase_optimizer_seeds_bfgs_with_initial_hessian(monkeypatch, tmp_path):
+    pytest.importorskip("ase")
+    from ase.build import molecule
+    from ase.calculators.emt import EMT
+    from ase.io import write as ase_write
+
+    import ase_backend
+
+    atoms = molecule("CH3CH2OH")
+    atoms.rattle(0.05, seed=1)
+    input_xyz = tmp_path / "input.xyz"
+    ase_write(input_xyz, atoms)
+    hessian_path = tmp_path / "hessian.npy"
+    np.save(hessian_path, np.eye(len(atoms) * 3) * 0.5)
+    monkeypatch.setattr(ase_backend, "_build_pyscf_calculator", lambda **_kwargs: EMT())
+    monkeypatch.setattr(ase_backend, "_apply_constraints", lambda *_args: None)
+
+    def _run(initial_hessian):
+        return ase_backend._run_ase_optimizer(
+            str(input_xyz),
+            str(tmp_path / "out.xyz"),
+            str(tmp_path),
+            0,
+            0,
+            1,
+            "sto-3g",
+            "b3lyp",
+            {},
+            None,
+            None,
+            None,
+            None,
+            False,
+            None,
+            {"optimizer": "bfgs", "fmax": 0.05, "initial_hessian": initial_hessian},
+            "minimum",
+            None,
+        )
+
+    assert _run("hessian.npy")["n_steps"] > 0
+    assert _run("model")["n_steps"] > 0
+    with pytest.raises(FileNotFoundError, match="Initial Hessian file not found"):
+        _run("missing.npy")
+
+
+_FAKE_SELLA = """
+class _PES:
+    def __init__(self, atoms, hessian_function):
+        self.atoms = atoms
+        self.hessian_function = hessian_function
+        self.diagonalisations = []
+
+    def diag(self):
+        if self.hessian_function is None:
+            self.diagonalisations.append("iterative")
+        else:
+            self.diagonalisations.append(self.hessian_function(self.atoms))
+
+
+class Sella:
+    instances = []
+
+    def __init__(self, atoms, order=0, trajectory=None, logfile=None, hessian_function=None):
+        self.pes = _PES(atoms, hessian_function)
+        self.nsteps = 0
+        Sella.instances.append(self)
+
+    def run(self, fmax=0.05, steps=200):
+        for _ in range(3):
+            self.pes.diag()
+            self.nsteps += 1
+"""
+
+
+def test_sella_uses_initial_hessian_only_for_first_diagonalisation(monkeypatch, tmp_path):
+    pytest.importorskip("ase")
+    import sys
+
+    from ase.build import molecule
+    from ase.calculators.emt import EMT
+    from ase.io import write as ase_write
+
+    import ase_backend
+
+    package = tmp_path / "fake_site" / "sella"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text(_FAKE_SELLA)
+    monkeypatch.syspath_prepend(str(tmp_path / "fake_site"))
+    monkeypatch.delitem(sys.modules, "sella", raising=False)
+    atoms = molecule("H2O")
+    input_xyz = tmp_path / "input.xyz"
+    ase_write(input_xyz, atoms)
+    np.save(tmp_path / "hessian.npy", np.eye(9) * 0.5)
+    monkeypatch.setattr(ase_backend, "_build_pyscf_calculator", lambda **_kwargs: EMT())
+    monkeypatch.setattr(ase_backend, "_apply_constraints", lambda *_args: None)
+
+    ase_backend._run_ase_optimizer(
+        str(input_xyz),
+        str(tmp_path / "out.xyz"),
+        str(tmp_path),
+        0,
+        0,
+        1,
+        "sto-3g",
+        "b3lyp",
+        {},
+        None,
+        None,
+        None,
+        None,
+        False,
+        None,
+        {"optimizer": "sella", "initial_hessian": "hessian.npy"},
+        "minimum",
+        None,
+    )
+
+    [optimizer] = sys.modules["sella"].Sella.instances
+    seed, *later = optimizer.pes.diagonalisations
+    assert np.asarray(seed).shape == (9, 9)
+    assert later == ["iterative", "iterative"]
+
+
+def test_select_precision_tier_tightens_toward_target():
+    assert _select_precision_tier(None, 0.05)[0] == "coarse"
+    assert _select_precision_tier(2.0, 0.05)[0] == "coarse"
+    assert _select_precision_tier(0.3, 0.05)[0] == "medium"
+    assert _select_precision_tier(0.1, 0.05) is None
+
+
+def test_adaptive_precision_reruns_converging_step_at_full_precision():
+    pytest.importorskip("pyscf")
+    ase_build = pytest.importorskip("ase.build")
+    import ase_backend
+
+    def _evaluate(optimizer_config):
+        atoms = ase_build.molecule("H2")
+        atoms.calc = ase_backend._build_pyscf_calculator(
+            atoms=atoms,
+            run_dir=None,
+            charge=0,
+            spin=0,
+            multiplicity=1,
+            basis="sto-3g",
+            xc="lda",
+            scf_config={},
+            solvent_model=None,
+            solvent_name=None,
+            solvent_eps=None,
+            dispersion_model=None,
+            verbose=False,
+            memory_mb=None,
+            optimizer_config=optimizer_config,
+            optimization_mode="minimum",
+            profiling_enabled=True,
+        )
+        return atoms.get_potential_energy(), atoms.calc.get_profile()
+
+    reference_energy, _ = _evaluate({"fmax": 5.0})
+    energy, profile = _evaluate({"fmax": 5.0, "adaptive_precision": True})
+
+    assert energy == pytest.approx(reference_energy, abs=1e-6)
+    assert profile["scf_calls"] == 2
+    assert profile["precision_rechecks"] == 1
+    assert [step["tier"] for step in profile["precision_steps"]] == ["full"]
+    assert profile["precision_steps"][0]["conv_tol"] == pytest.approx(1e-9)
+
+
+def test_result_cache_serves_energy_and_forces_across_calculators(tmp_path, monkeypatch):
+    pytest.importorskip("pyscf")
+    ase_build = pytest.importorskip("ase.build")
+    import ase_backend
+
+    monkeypatch.setenv("DFTFLOW_BASE_DIR", str(tmp_path))
+
+    def _evaluate():
+        atoms = ase_build.molecule("H2")
+        atoms.calc = ase_backend._build_pyscf_calculator(
+            atoms=atoms,
+            run_dir=None,
+            charge=0,
+            spin=0,
+            multiplicity=1,
+            basis="sto-3g",
+            xc="lda",
+            scf_config={"result_cache": True},
+            solvent_model=None,
+            solvent_name=None,
+            solvent_eps=None,
+            dispersion_model=None,
+            verbose=False,
+            memory_mb=None,
+            optimizer_config={},
+            optimization_mode="minimum",
+            profiling_enabled=True,
+        )
+        return atoms.get_potential_energy(), atoms.get_forces(), atoms.calc.get_profile()
+
+    energy, forces, first_profile = _evaluate()
+    cached_energy, cached_forces, profile = _evaluate()
+
+    assert first_profile["result_cache_misses"] == 1
+    assert profile["result_cache_hits"] == 1
+    assert profile["scf_calls"] == 0
+    assert cached_energy == pytest.approx(energy, abs=1e-10)
+    assert np.allclose(cached_forces, forces)
+
+
+def test_run_ase_optimizer_reports_final_point_matching_single_point(monkeypatch, tmp_path):
+    pytest.importorskip("pyscf")
+    ase_build = pytest.importorskip("ase.build")
+    from ase.io import read as ase_read
+    from ase.io import write as ase_write
+    from pyscf import gto
+
+    import ase_backend
+    from run_opt_engine import compute_single_point_energy
+
+    atoms = ase_build.molecule("H2")
+    atoms.positions[1, 2] += 0.1
+    input_xyz = tmp_path / "input.xyz"
+    output_xyz = tmp_path / "out.xyz"
+    ase_write(input_xyz, atoms)
+    monkeypatch.setattr(ase_backend, "_apply_constraints", lambda *_args: None)
+
+    result = ase_backend._run_ase_optimizer(
+        str(input_xyz),
+        str(output_xyz),
+        str(tmp_path),
+        0,
+        0,
+        1,
+        "sto-3g",
+        "lda",
+        {},
+        None,
+        None,
+        None,
+        None,
+        False,
+        None,
+        {"optimizer": "bfgs", "fmax": 0.05},
+        "minimum",
+        None,
+    )
+
+    final_point = result["final_point"]
+    assert final_point["converged"] is True
+    assert final_point["dispersion"] is None
+    optimized = ase_read(str(output_xyz))
+    mol = gto.M(
+        atom=ase_backend._build_atom_spec_from_ase(optimized),
+        basis="sto-3g",
+        unit="Angstrom",
+    )
+    reference = compute_single_point_energy(
+        mol, "sto-3g", "lda", {}, None, None, None, None, None, False, None
+    )
+    assert final_point["energy"] == pytest.approx(reference["energy"], abs=1e-7)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("ase")
+
+from ase.build import molecule  # noqa: E402
+from ase.calculators.emt import EMT  # noqa: E402
+from ase.constraints import FixInternals  # noqa: E402
+
+from ase_ric import (  # noqa: E402
+    RICBFGS,
+    build_redundant_internals,
+    internal_values_and_wilson_b,
+    lindh_model_hessian,
+)
+
+
+def test_wilson_b_matches_finite_differences():
+    atoms = molecule("CH3CH2OH")
+    coordinates, _ = build_redundant_internals(atoms.numbers, atoms.positions)
+    values, b_matrix = internal_values_and_wilson_b(atoms.positions, coordinates)
+    flat = atoms.positions.ravel()
+    step = 1e-6
+    numeric = np.zeros_like(b_matrix)
+    for column in range(flat.size):
+        forward = flat.copy()
+        backward = flat.copy()
+        forward[column] += step
+        backward[column] -= step
+        q_forward, _ = internal_values_and_wilson_b(forward.reshape(-1, 3), coordinates)
+        q_backward, _ = internal_values_and_wilson_b(backward.reshape(-1, 3), coordinates)
+        delta = (q_forward - q_backward + np.pi) % (2 * np.pi) - np.pi
+        for row, coordinate in enumerate(coordinates):
+            if coordinate[0] != "dihedral":
+                delta[row] = q_forward[row] - q_backward[row]
+        numeric[:, column] = delta / (2 * step)
+
+    assert np.allclose(b_matrix, numeric, atol=1e-6)
+    dihedral = next(item for item in coordinates if item[0] == "dihedral")
+    assert np.degrees(values[coordinates.index(dihedral)]) % 360 == pytest.approx(
+        atoms.get_dihedral(*dihedral[1:]) % 360
+    )
+
+
+def test_build_redundant_internals_adds_constrained_coordinates():
+    atoms = molecule("CH3CH2OH")
+    coordinates, constrained = build_redundant_internals(
+        atoms.numbers,
+        atoms.positions,
+        constraints={"bonds": [{"i": 3, "j": 0, "length": 2.5}]},
+    )
+
+    assert ("bond", 0, 3) in coordinates
+    assert constrained == {("bond", 0, 3): 2.5}
+
+
+def test_lindh_model_hessian_is_positive_definite():
+    atoms = molecule("CH3CH2OH")
+    coordinates, _ = build_redundant_internals(atoms.numbers, atoms.positions)
+
+    hessian = lindh_model_hessian(atoms.numbers, atoms.positions, coordinates)
+
+    assert hessian.shape == (len(coordinates), len(coordinates))
+    assert np.all(np.diag(hessian) > 0)
+
+
+def test_ric_bfgs_keeps_constraints_while_relaxing():
+    atoms = molecule("CH3CH2OH")
+    atoms.calc = EMT()
+    atoms.set_constraint(FixInternals(bonds=[(1.6, [0, 1])]))
+
+    optimizer = RICBFGS(
+        atoms,
+        logfile=None,
+        constraints={"bonds": [{"i": 0, "j": 1, "length": 1.6}]},
+    )
+
+    assert optimizer.run(fmax=0.05, steps=200)
+    assert atoms.get_distance(0, 1) == pytest.approx(1.6, abs=1e-6)
+
+
+def test_ric_bfgs_rejects_restart_files(tmp_path):
+    atoms = molecule("H2O")
+    atoms.calc = EMT()
+
+    with pytest.raises(ValueError, match="restart"):
+        RICBFGS(atoms, restart=str(tmp_path / "ric.json"), logfile=None)
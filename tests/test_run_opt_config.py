@@ -92,3 +92,228 @@ def test_constraints_indices_must_be_nonnegative():
         match=r"Config 'constraints\.bonds\[0\]\.i' must be >= 0\.",
     ):
         validate_run_config(config)
+
+
+def test_optimizer_scf_extrapolation_order_must_be_non_negative():
+    config = {
+        "basis": "def2-svp",
+        "xc": "b3lyp",
+        "solvent": "vacuum",
+        "optimizer": {"ase": {"scf_warm_start": True, "scf_extrapolation_order": -1}},
+    }
+
+    with pytest.raises(
+        ValueError,
+        match=r"Config 'optimizer\.ase\.scf_extrapolation_order' must be a non-negative",
+    ):
+        validate_run_config(config)
+
+
+def test_optimizer_scf_session_must_be_supported():
+    config = {
+        "basis": "def2-svp",
+        "xc": "b3lyp",
+        "solvent": "vacuum",
+        "optimizer": {"ase": {"scf_session": "persistent"}},
+    }
+
+    with pytest.raises(
+        ValueError,
+        match=r"Config 'optimizer\.ase\.scf_session' must be one of: rebuild, scanner\.",
+    ):
+        validate_run_config(config)
+
+
+def test_optimizer_ladder_rejects_unknown_rung_keys():
+    config = {
+        "basis": "def2-svp",
+        "xc": "b3lyp",
+        "solvent": "vacuum",
+        "optimizer": {"ladder": [{"basis": "sto-3g", "grid": 2}]},
+    }
+
+    with pytest.raises(
+        ValueError,
+        match=r"Config 'optimizer\.ladder\[0\]' has unsupported keys: grid\.",
+    ):
+        validate_run_config(config)
+
+
+def test_scf_retry_parallel_must_be_bool_or_positive_int():
+    config = {
+        "basis": "def2-svp",
+        "xc": "b3lyp",
+        "solvent": "vacuum",
+        "scf": {"retry_parallel": 0},
+    }
+
+    with pytest.raises(
+        ValueError,
+        match=r"Config 'scf\.retry_parallel' must be a boolean or a positive integer\.",
+    ):
+        validate_run_config(config)
+
+
+def test_frequency_hessian_method_must_be_supported():
+    config = {
+        "basis": "def2-svp",
+        "xc": "b3lyp",
+        "solvent": "vacuum",
+        "frequency": {"hessian_method": "numerical", "hessian_workers": 4},
+    }
+    validate_run_config(config)
+
+    config["frequency"]["hessian_method"] = "semi"
+    with pytest.raises(
+        ValueError,
+        match=r"Config 'frequency\.hessian_method' must be one of: analytic, numerical\.",
+    ):
+        validate_run_config(config)
+
+
+def test_irc_mode_solver_must_be_supported():
+    config = {
+        "basis": "def2-svp",
+        "xc": "b3lyp",
+        "solvent": "vacuum",
+        "irc": {"mode_solver": "davidson", "mode_count": 2},
+    }
+    validate_run_config(config)
+
+    config["irc"]["mode_count"] = 4
+    with pytest.raises(
+        ValueError, match=r"Config 'irc\.mode_count' must be an integer between 1 and 3\."
+    ):
+        validate_run_config(config)
+
+
+def test_capability_check_mode_must_be_supported():
+    config = {
+        "basis": "def2-svp",
+        "xc": "b3lyp",
+        "solvent": "vacuum",
+        "capability_check": "probe",
+    }
+    validate_run_config(config)
+
+    config["capability_check"] = "fast"
+    with pytest.raises(
+        ValueError, match=r"Config 'capability_check' must be one of: full, probe\."
+    ):
+        validate_run_config(config)
+
+
+def test_scan_chain_must_be_boolean():
+    config = {
+        "basis": "def2-svp",
+        "xc": "b3lyp",
+        "solvent": "vacuum",
+        "calculation_mode": "scan",
+        "scan": {
+            "type": "bond",
+            "i": 0,
+            "j": 1,
+            "start": 1.0,
+            "end": 1.5,
+            "step": 0.1,
+            "mode": "optimization",
+            "chain": True,
+        },
+    }
+    validate_run_config(config)
+
+    config["scan"]["chain"] = "yes"
+    with pytest.raises(ValueError, match=r"Config 'scan\.chain' must be a boolean\."):
+        validate_run_config(config)
+
+
+def test_scan_schedule_must_be_supported():
+    config = {
+        "basis": "def2-svp",
+        "xc": "b3lyp",
+        "solvent": "vacuum",
+        "calculation_mode": "scan",
+        "scan2d": {
+            "dimensions": [
+                {"type": "bond", "i": 0, "j": 1, "start": 1.0, "end": 1.2, "step": 0.1},
+                {"type": "bond", "i": 1, "j": 2, "start": 1.0, "end": 1.2, "step": 0.1},
+            ],
+            "schedule": "wavefront",
+        },
+    }
+    validate_run_config(config)
+
+    config["scan2d"]["schedule"] = "diagonal"
+    with pytest.raises(
+        ValueError, match=r"Config 'scan2d\.schedule' must be one of: batch, wavefront\."
+    ):
+        validate_run_config(config)
+
+
+def test_scan_adaptive_requires_one_dimension_and_valid_settings():
+    config = {
+        "basis": "def2-svp",
+        "xc": "b3lyp",
+        "solvent": "vacuum",
+        "calculation_mode": "scan",
+        "scan": {
+            "type": "bond",
+            "i": 0,
+            "j": 1,
+            "start": 1.0,
+            "end": 2.0,
+            "step": 0.2,
+            "adaptive": {"tolerance": 0.0001, "max_points": 20},
+        },
+    }
+    validate_run_config(config)
+
+    config["scan"]["adaptive"] = {"tolerance": -1.0}
+    with pytest.raises(
+        ValueError, match=r"Config 'scan\.adaptive\.tolerance' must be a positive number\."
+    ):
+        validate_run_config(config)
+
+    config["scan"] = {
+        "dimensions": [
+            {"type": "bond", "i": 0, "j": 1, "start": 1.0, "end": 1.2, "step": 0.1},
+            {"type": "bond", "i": 1, "j": 2, "start": 1.0, "end": 1.2, "step": 0.1},
+        ],
+        "adaptive": True,
+    }
+    with pytest.raises(
+        ValueError, match=r"Config 'scan\.adaptive' requires a single scan dimension\."
+    ):
+        validate_run_config(config)
+
+
+def test_scan_order_and_straggler_timeout_are_validated():
+    config = {
+        "basis": "def2-svp",
+        "xc": "b3lyp",
+        "solvent": "vacuum",
+        "calculation_mode": "scan",
+        "scan": {
+            "type": "bond",
+            "i": 0,
+            "j": 1,
+            "start": 1.0,
+            "end": 1.5,
+            "step": 0.1,
+            "executor": "local",
+            "order": "cost",
+            "straggler_timeout": 600,
+        },
+    }
+    validate_run_config(config)
+
+    config["scan"]["order"] = "random"
+    with pytest.raises(ValueError, match=r"Config 'scan\.order' must be one of: grid, cost\."):
+        validate_run_config(config)
+
+    config["scan"]["order"] = "grid"
+    config["scan"]["straggler_timeout"] = 0
+    with pytest.raises(
+        ValueError, match=r"Config 'scan\.straggler_timeout' must be a positive number\."
+    ):
+        validate_run_config(config)
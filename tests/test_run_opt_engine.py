@@ -0,0 +1,672 @@
+from types import SimpleNamespace
+
+import pytest
+
+import run_opt_engine
+from run_opt_engine import _build_scf_retry_overrides, _run_scf_with_retries
+
+
+class _FakeMF:
+    def __init__(self, config, converge_after):
+        self.config = config
+        self.converge_after = converge_after
+        self.converged = False
+        self.mo_coeff = None
+        self.mo_occ = None
+        self.second_order = False
+        self.kernel_dm0 = None
+
+    def newton(self):
+        self.second_order = True
+        return self
+
+    def kernel(self, dm0=None):
+        self.kernel_dm0 = dm0
+        self.converged = self.second_order or self.converge_after
+        self.mo_coeff = [len(self.config)]
+        self.mo_occ = [2]
+        return -1.0
+
+    def make_rdm1(self):
+        return ("density", tuple(sorted(self.config)))
+
+
+def test_default_retry_preset_ends_with_second_order_stage():
+    retries = _build_scf_retry_overrides({"max_cycle": 100})
+
+    assert retries[-1] == {"second_order": True}
+    assert all("second_order" not in overrides for overrides in retries[:-1])
+
+
+def test_scf_retries_continue_from_previous_density(monkeypatch):
+    monkeypatch.setattr(run_opt_engine, "_scf_retry_enabled", lambda: True)
+    built = []
+
+    def _build_mf(config):
+        mf = _FakeMF(config, converge_after=False)
+        built.append(mf)
+        return mf, {}
+
+    energy, mf, _ = _run_scf_with_retries(_build_mf, {"max_cycle": 100}, None, "SCF")
+
+    assert energy == -1.0
+    assert mf.converged and mf.second_order
+    assert built[0].kernel_dm0 is None
+    for previous, current in zip(built, built[1:], strict=False):
+        assert current.kernel_dm0 == previous.make_rdm1()
+
+
+def _build_speculative_fake_mf(*, scf_settings, parent_pid, converge_in_parent):
+    import os
+
+    mf = _FakeMF(scf_settings, converge_after=False)
+    if os.getpid() == parent_pid and not converge_in_parent:
+        mf.newton = lambda: mf
+    return mf, {"density_fit_applied": False}
+
+
+def _speculative_builder(converge_in_parent=True):
+    import os
+
+    return run_opt_engine._SCFBuilderSpec(
+        _build_speculative_fake_mf,
+        parent_pid=os.getpid(),
+        converge_in_parent=converge_in_parent,
+    )
+
+
+def test_parallel_scf_retries_record_winning_strategy(monkeypatch):
+    monkeypatch.setattr(run_opt_engine, "_scf_retry_enabled", lambda: True)
+
+    energy, mf, info = _run_scf_with_retries(
+        _speculative_builder(), {"max_cycle": 100, "retry_parallel": True}, None, "SCF"
+    )
+
+    assert energy == -1.0
+    assert mf.converged and mf.second_order
+    assert mf.kernel_dm0 == mf.make_rdm1()
+    assert info["density_fit_applied"] is False
+    assert info["scf_retry"]["mode"] == "parallel"
+    assert info["scf_retry"]["winner"]["overrides"] == {"second_order": True}
+
+
+def test_parallel_scf_retries_fall_back_to_serial_when_winner_does_not_reconverge(
+    monkeypatch,
+):
+    monkeypatch.setattr(run_opt_engine, "_scf_retry_enabled", lambda: True)
+
+    _, mf, info = _run_scf_with_retries(
+        _speculative_builder(converge_in_parent=False),
+        {"max_cycle": 100, "retry_parallel": True},
+        None,
+        "SCF",
+    )
+
+    assert not mf.converged
+    assert info["scf_retry"]["fallback"] == "serial"
+    assert info["scf_retry"]["winner"]["reconverged"] is False
+
+
+def _store_key(positions, **overrides):
+    method = {
+        "basis": "sto-3g",
+        "xc": "b3lyp",
+        "scf_config": {"conv_tol": 1e-9, "chkfile": "scf.chk"},
+        "solvent_model": None,
+        "solvent_name": None,
+        "solvent_eps": None,
+        "charge": 0,
+        "spin": 0,
+        "ks_type": "RKS",
+    }
+    method.update(overrides)
+    return run_opt_engine.hessian_store_key(["H", "H"], positions, **method)
+
+
+def test_hessian_store_key_ignores_chkfile_and_signed_zero():
+    base = _store_key([[0.0, 0.0, 0.0], [0.0, 0.0, 0.74]])
+
+    assert base == _store_key(
+        [[-0.0, 0.0, 0.0], [0.0, 0.0, 0.74]],
+        scf_config={"conv_tol": 1e-9, "chkfile": "other.chk"},
+    )
+    assert base != _store_key([[0.0, 0.0, 0.0], [0.0, 0.0, 0.75]])
+    assert base != _store_key([[0.0, 0.0, 0.0], [0.0, 0.0, 0.74]], xc="pbe")
+
+
+def test_compute_imaginary_mode_reuses_stored_hessian(monkeypatch, tmp_path):
+    import numpy as np
+
+    gto = pytest.importorskip("pyscf.gto")
+    pytest.importorskip("ase")
+    calls = []
+
+    def _fake_hessian(**kwargs):
+        calls.append(kwargs["mol_mode"].natm)
+        hess = np.zeros((2, 2, 3, 3))
+        for atom in range(2):
+            hess[atom, atom] = np.diag([0.5, 0.4, -0.1])
+        return hess
+
+    monkeypatch.setattr(run_opt_engine, "_run_imaginary_mode_hessian_with_retry", _fake_hessian)
+    mol = gto.M(atom="H 0 0 0; H 0 0 0.74", basis="sto-3g", verbose=0)
+
+    def _compute():
+        return run_opt_engine.compute_imaginary_mode(
+            mol,
+            "sto-3g",
+            "b3lyp",
+            {},
+            None,
+            None,
+            None,
+            False,
+            None,
+            run_dir=str(tmp_path),
+            return_hessian=True,
+        )
+
+    first = _compute()
+    second = _compute()
+
+    assert calls == [2]
+    assert first["hessian_source"] == "computed"
+    assert second["hessian_source"] == "store"
+    assert np.allclose(first["hessian"], second["hessian"])
+    assert list((tmp_path / run_opt_engine.HESSIAN_STORE_DIRNAME).glob("*.npy"))
+
+
+def _reference_dispersion_hessian(atoms, step):
+    import numpy as np
+
+    base_positions = atoms.get_positions()
+    natoms = len(base_positions)
+    hessian = np.zeros((natoms, natoms, 3, 3))
+    for atom_idx in range(natoms):
+        for coord in range(3):
+            displaced = base_positions.copy()
+            displaced[atom_idx, coord] += step
+            atoms.set_positions(displaced)
+            forces_plus = atoms.get_forces()
+            displaced[atom_idx, coord] -= 2 * step
+            atoms.set_positions(displaced)
+            forces_minus = atoms.get_forces()
+            hessian[:, atom_idx, :, coord] = -(forces_plus - forces_minus) / (2 * step)
+    atoms.set_positions(base_positions)
+    return hessian
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_dispersion_hessian_matches_serial_finite_differences(monkeypatch, workers):
+    import numpy as np
+
+    ase_build = pytest.importorskip("ase.build")
+    from ase.calculators.emt import EMT
+
+    monkeypatch.setattr(
+        run_opt_engine, "_build_dispersion_calculator", lambda atoms, _settings: (EMT(), "emt")
+    )
+    monkeypatch.setattr(
+        run_opt_engine,
+        "_resolve_dispersion_hessian_workers",
+        lambda _natoms, _task_count: workers,
+    )
+    # Run the pool inline: spawned workers would not see the EMT patch above.
+    contexts = _use_inline_process_pool(monkeypatch)
+    atoms = ase_build.molecule("CH4")
+    atoms.rattle(0.02, seed=3)
+    atoms.calc = EMT()
+    expected = _reference_dispersion_hessian(atoms, 0.005)
+    profiling = {}
+
+    hessian = run_opt_engine._compute_dispersion_hessian_numerical(
+        atoms, 0.005, {"backend": "d3", "settings": {}}, profiling
+    )
+
+    assert np.allclose(hessian, expected)
+    assert profiling["dispersion_hessian_workers"] == workers
+    assert [context.get_start_method() for context in contexts] == (
+        [run_opt_engine._speculative_scf_context().get_start_method()] if workers > 1 else []
+    )
+
+
+def test_dispersion_hessian_prefers_analytic_backend():
+    import numpy as np
+
+    ase_build = pytest.importorskip("ase.build")
+
+    class _AnalyticCalculator:
+        def get_hessian(self, atoms):
+            return np.arange(9 * len(atoms) ** 2, dtype=float).reshape(
+                3 * len(atoms), 3 * len(atoms)
+            )
+
+    atoms = ase_build.molecule("H2")
+    atoms.calc = _AnalyticCalculator()
+    profiling = {}
+
+    hessian = run_opt_engine._compute_dispersion_hessian_numerical(
+        atoms, 0.005, profiling=profiling
+    )
+
+    flat = np.arange(36, dtype=float).reshape(6, 6)
+    assert np.allclose(hessian[0, 1], flat[0:3, 3:6])
+    assert profiling["dispersion_hessian_method"] == "analytic"
+
+
+_DISTORTED_WATER = "O 0 0 0.1; H 0 0.76 -0.45; H 0.05 -0.74 -0.43"
+_SYMMETRIC_WATER = "O 0 0 0.1; H 0 0.76 -0.45; H 0 -0.76 -0.45"
+_SYMMETRIC_AMMONIA = (
+    "N 0 0 0.1; H 0.94 0 -0.38; H -0.47 0.814064 -0.38; H -0.47 -0.814064 -0.38"
+)
+
+
+def _quadratic_model(mol):
+    import numpy as np
+
+    rng = np.random.default_rng(7)
+    force_constants = rng.normal(size=(9, 9))
+    force_constants = force_constants + force_constants.T
+    reference = mol.atom_coords().ravel()
+
+    def _gradient(positions):
+        return (force_constants @ (positions.ravel() - reference)).reshape(-1, 3)
+
+    return force_constants, _gradient
+
+
+def _spring_model_gradient(positions):
+    import numpy as np
+
+    separation = positions[:, None, :] - positions[None, :, :]
+    distance = np.linalg.norm(separation, axis=-1)
+    np.fill_diagonal(distance, 1.0)
+    coefficient = (distance - 1.5) / distance
+    np.fill_diagonal(coefficient, 0.0)
+    return (coefficient[:, :, None] * separation).sum(axis=1)
+
+
+class _InlineProcessPool:
+    contexts = []
+
+    def __init__(self, max_workers=None, mp_context=None):
+        self.contexts.append(mp_context)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def map(self, function, *iterables):
+        return map(function, *iterables)
+
+
+def _use_inline_process_pool(monkeypatch):
+    import concurrent.futures
+
+    contexts = []
+    monkeypatch.setattr(_InlineProcessPool, "contexts", contexts)
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", _InlineProcessPool)
+    return contexts
+
+
+def _numerical_hessian_setup(monkeypatch, atom, gradient_model=None):
+    gto = pytest.importorskip("pyscf.gto")
+    mol = gto.M(atom=atom, basis="sto-3g", verbose=0)
+    force_constants = None
+    if gradient_model is None:
+        force_constants, gradient_model = _quadratic_model(mol)
+    evaluated = []
+
+    def _fake_gradient(manifest, point):
+        import numpy as np
+
+        positions = np.asarray(manifest["positions_bohr"], dtype=float)
+        positions[point["atom"]] += np.asarray(point["displacement"])
+        evaluated.append(point["index"])
+        return 0.0, True, gradient_model(positions)
+
+    monkeypatch.setattr(run_opt_engine, "_evaluate_numerical_hessian_gradient", _fake_gradient)
+
+    def _compute(run_dir, workers=1):
+        profiling = {"hessian_seconds": None}
+        return run_opt_engine._compute_numerical_frequency_hessian(
+            mf_freq=SimpleNamespace(converged=False),
+            mol_freq=mol,
+            xc="b3lyp",
+            scf_config={"chkfile": "scf.chk"},
+            solvent_model=None,
+            solvent_name=None,
+            solvent_eps=None,
+            optimizer_mode="minimum",
+            multiplicity=1,
+            run_dir=str(run_dir) if run_dir else None,
+            store_key="key",
+            hessian_settings={"method": "numerical", "workers": workers},
+            profiling=profiling,
+        )
+
+    return force_constants, evaluated, _compute
+
+
+def test_numerical_hessian_assembles_symmetric_hessian(monkeypatch, tmp_path):
+    import json
+
+    import numpy as np
+
+    force_constants, evaluated, compute = _numerical_hessian_setup(
+        monkeypatch, _DISTORTED_WATER
+    )
+    # Random force constants do not respect the molecular point group.
+    monkeypatch.setattr(
+        run_opt_engine, "_detect_displacement_symmetry", lambda _symbols, _positions: None
+    )
+
+    hess, info = compute(tmp_path)
+
+    assert sorted(evaluated) == list(range(18))
+    assert hess.shape == (3, 3, 3, 3)
+    assert np.allclose(hess.transpose(0, 2, 1, 3).reshape(9, 9), force_constants)
+    assert info["points"] == 18 and info["evaluated"] == 18
+    manifest = json.loads(open(info["manifest"], encoding="utf-8").read())
+    assert manifest["command_template"][1] == "frequency-point"
+    assert "chkfile" not in manifest["settings"]["scf_config"]
+
+
+def test_numerical_hessian_reuses_results_and_skips_claimed_points(monkeypatch, tmp_path):
+    import os
+
+    _, evaluated, compute = _numerical_hessian_setup(monkeypatch, _DISTORTED_WATER)
+    compute(tmp_path)
+    hessian_dir = tmp_path / run_opt_engine.NUMERICAL_HESSIAN_DIRNAME
+    os.remove(hessian_dir / "point_0003.json")
+    (hessian_dir / "point_0003.json.claim").write_text(
+        '{"host": "elsewhere", "pid": 1, "claimed_at": 0}', encoding="utf-8"
+    )
+    evaluated.clear()
+
+    assert run_opt_engine.run_numerical_hessian_point(
+        str(hessian_dir / "manifest.json"), 3
+    ) is True
+    assert run_opt_engine.run_numerical_hessian_point(
+        str(hessian_dir / "manifest.json"), 3
+    ) is False
+    assert evaluated == [3]
+    evaluated.clear()
+
+    _, info = compute(tmp_path)
+
+    assert evaluated == []
+    assert info["evaluated"] == 0
+
+
+def test_numerical_hessian_wait_fails_with_missing_points(monkeypatch, tmp_path):
+    import json
+    import os
+    import time
+
+    _, _, compute = _numerical_hessian_setup(monkeypatch, _DISTORTED_WATER)
+    compute(tmp_path)
+    hessian_dir = tmp_path / run_opt_engine.NUMERICAL_HESSIAN_DIRNAME
+    os.remove(hessian_dir / "point_0005.json")
+    (hessian_dir / "point_0005.json.claim").write_text(
+        json.dumps({"host": "elsewhere", "pid": 1, "claimed_at": time.time()}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(run_opt_engine, "NUMERICAL_HESSIAN_WAIT_TIMEOUT", 0.0)
+    monkeypatch.setattr(run_opt_engine, "NUMERICAL_HESSIAN_POLL_SECONDS", 0.0)
+    manifest_path = str(hessian_dir / "manifest.json")
+    manifest = json.loads(open(manifest_path, encoding="utf-8").read())
+
+    with pytest.raises(RuntimeError, match=r"points \[5\]"):
+        run_opt_engine._collect_numerical_hessian_gradients(manifest_path, manifest)
+
+
+def test_numerical_hessian_removes_temporary_directory(monkeypatch, tmp_path):
+    import os
+    import tempfile
+
+    _, evaluated, compute = _numerical_hessian_setup(monkeypatch, _DISTORTED_WATER)
+    created = []
+    original_mkdtemp = tempfile.mkdtemp
+
+    def _mkdtemp(**kwargs):
+        path = original_mkdtemp(dir=tmp_path, **kwargs)
+        created.append(path)
+        return path
+
+    monkeypatch.setattr(run_opt_engine.tempfile, "mkdtemp", _mkdtemp)
+
+    _, info = compute(None)
+
+    assert len(created) == 1 and not os.path.exists(created[0])
+    assert info["manifest"] is None
+    assert len(evaluated) == info["points"]
+
+
+def test_numerical_hessian_pool_does_not_fork(monkeypatch, tmp_path):
+    _, evaluated, compute = _numerical_hessian_setup(monkeypatch, _DISTORTED_WATER)
+    contexts = _use_inline_process_pool(monkeypatch)
+
+    _, info = compute(tmp_path, workers=2)
+
+    assert info["workers"] == 2 and len(evaluated) == info["points"]
+    assert [context.get_start_method() for context in contexts] == [
+        run_opt_engine._speculative_scf_context().get_start_method()
+    ]
+    assert contexts[0].get_start_method() != "fork"
+
+
+@pytest.mark.parametrize(
+    ("atom", "group", "points", "atol"),
+    [(_SYMMETRIC_WATER, "C2v", 9, 1e-5), (_SYMMETRIC_AMMONIA, "C3v", 11, 1e-3)],
+    ids=["water", "ammonia"],
+)
+def test_numerical_hessian_uses_point_group_to_skip_displacements(
+    monkeypatch, tmp_path, atom, group, points, atol
+):
+    import numpy as np
+
+    _, evaluated, compute = _numerical_hessian_setup(
+        monkeypatch, atom, _spring_model_gradient
+    )
+
+    hess, info = compute(tmp_path / "symmetric")
+    monkeypatch.setattr(
+        run_opt_engine, "_detect_displacement_symmetry", lambda _symbols, _positions: None
+    )
+    full_hess, full_info = compute(tmp_path / "full")
+
+    assert info["symmetry"] == group
+    assert info["points"] == points and full_info["points"] == len(full_hess) * 6
+    # Rotated central differences only agree with Cartesian ones to O(step^2).
+    assert np.allclose(hess, full_hess, atol=atol)
+
+
+def test_symmetry_operations_cover_non_abelian_point_groups():
+    import numpy as np
+
+    ase_build = pytest.importorskip("ase.build")
+    pytest.importorskip("pyscf")
+
+    for name, order in (("CH4", 24), ("NH3", 6), ("C6H6", 24), ("C2H6", 12)):
+        atoms = ase_build.molecule(name)
+        symmetry = run_opt_engine._detect_displacement_symmetry(
+            atoms.get_chemical_symbols(), atoms.get_positions()
+        )
+        assert len(symmetry["operations"]) == order, name
+        for rotation, _ in symmetry["operations"]:
+            assert np.allclose(rotation @ rotation.T, np.eye(3))
+
+
+def test_dispersion_hessian_rebuilds_symmetry_equivalent_displacements(monkeypatch):
+    import numpy as np
+
+    ase_build = pytest.importorskip("ase.build")
+    from ase.calculators.emt import EMT
+
+    atoms = ase_build.molecule("CH4")
+    atoms.calc = EMT()
+    expected = _reference_dispersion_hessian(atoms, 0.005)
+    profiling = {}
+
+    hessian = run_opt_engine._compute_dispersion_hessian_numerical(
+        atoms, 0.005, profiling=profiling
+    )
+
+    assert profiling["dispersion_hessian_symmetry"] == "Td"
+    assert profiling["dispersion_hessian_displacements"] == 9
+    assert np.allclose(hessian, expected)
+
+
+@pytest.mark.parametrize("method", ["davidson", "dimer"])
+def test_lowest_mode_solver_matches_projected_eigenproblem(method):
+    import numpy as np
+
+    gto = pytest.importorskip("pyscf.gto")
+    mol = gto.M(atom="N 0 0 0; H 1.0 0 0; H -0.5 0.866 0; H -0.5 -0.866 0", verbose=0)
+    masses = [14.007, 1.008, 1.008, 1.008]
+    rigid = run_opt_engine._mass_weighted_rigid_basis(mol.atom_coords(), masses)
+    projector = np.eye(12) - rigid @ rigid.T
+    vibrations = np.linalg.svd(projector)[0][:, :6]
+    rotation = np.linalg.qr(np.random.default_rng(11).normal(size=(6, 6)))[0]
+    vibrations = vibrations @ rotation
+    matrix = vibrations @ np.diag([-0.5, 0.3, 0.45, 0.6, 0.8, 1.0]) @ vibrations.T
+    calls = []
+
+    def _matvec(vector):
+        calls.append(1)
+        return matrix @ vector
+
+    eigenvalues, modes, info = run_opt_engine._solve_lowest_modes(
+        matvec=_matvec,
+        mol=mol,
+        masses=masses,
+        method=method,
+        nroots=2,
+        tol=1e-8,
+        max_iterations=40,
+    )
+
+    reference = np.linalg.eigvalsh(matrix + rigid @ rigid.T * 1e3)
+    assert info["converged"]
+    assert np.allclose(eigenvalues, reference[: len(eigenvalues)], atol=1e-6)
+    assert len(calls) < 12 * 2
+    assert modes[0].shape == (4, 3)
+
+
+def test_compute_imaginary_mode_with_davidson_skips_full_hessian(monkeypatch):
+    gto = pytest.importorskip("pyscf.gto")
+    pytest.importorskip("ase")
+
+    def _no_hessian(**_kwargs):
+        raise AssertionError("full Hessian should not be computed")
+
+    monkeypatch.setattr(run_opt_engine, "_run_imaginary_mode_hessian_with_retry", _no_hessian)
+    mol = gto.M(
+        atom="N 0 0 0; H 1.0 0 0; H -0.5 0.866 0; H -0.5 -0.866 0",
+        basis="sto-3g",
+        verbose=0,
+    )
+
+    result = run_opt_engine.compute_imaginary_mode(
+        mol,
+        "sto-3g",
+        "lda,vwn",
+        {"conv_tol": 1e-10},
+        None,
+        None,
+        None,
+        False,
+        None,
+        optimizer_mode="transition_state",
+        mode_solver="davidson",
+    )
+
+    frequencies = result["mode_solver"]["frequencies_wavenumber"]
+    assert result["hessian_source"] == "mode_solver"
+    assert frequencies[0] == pytest.approx(-937.2, abs=5.0)
+    assert frequencies[1] > 0
+    assert float((result["mode"][:, 2] ** 2).sum()) > 0.95
+    assert result["ts_quality"]["imaginary_count"] == 1
+    assert result["mode_solver"]["gradients"] < 12
+
+
+def test_capability_probe_molecule_keeps_elements_and_spin_parity():
+    gto = pytest.importorskip("pyscf.gto")
+    formaldehyde = gto.M(
+        atom="C 0 0 0; O 0 0 1.2; H 0.9 0 -0.5; H -0.9 0 -0.5", basis="sto-3g", verbose=0
+    )
+    methyl = gto.M(atom="C 0 0 0; H 0 0 1.1; H 1 0 0; H 0 1 0", spin=1, basis="sto-3g", verbose=0)
+
+    probe = run_opt_engine._build_capability_probe_molecule(formaldehyde)
+    radical_probe = run_opt_engine._build_capability_probe_molecule(methyl)
+
+    assert [probe.atom_symbol(i) for i in range(probe.natm)] == ["C", "O", "H"]
+    assert probe.nelectron % 2 == 0 and probe.spin == 0
+    assert radical_probe.natm == 2
+    assert radical_probe.spin == 1
+
+
+def test_single_point_energy_reuses_result_cache(tmp_path, monkeypatch):
+    gto = pytest.importorskip("pyscf.gto")
+    monkeypatch.setenv("DFTFLOW_BASE_DIR", str(tmp_path))
+    mol = gto.M(atom="H 0 0 0; H 0 0 0.74", basis="sto-3g", verbose=0)
+
+    def _single_point():
+        return run_opt_engine.compute_single_point_energy(
+            mol, "sto-3g", "lda", {"result_cache": True}, None, None, None, None, None, False, None
+        )
+
+    first = _single_point()
+    monkeypatch.setattr(
+        run_opt_engine,
+        "_run_scf_with_retries",
+        lambda *_args, **_kwargs: pytest.fail("cached single point must not rerun SCF"),
+    )
+    second = _single_point()
+
+    assert first["result_cache"] == "miss"
+    assert second["result_cache"] == "hit"
+    assert second["energy"] == pytest.approx(first["energy"], abs=1e-12)
+    assert second["converged"] is True
+
+
+def test_single_point_projects_small_basis_density_from_guess_chkfile(tmp_path, monkeypatch):
+    gto = pytest.importorskip("pyscf.gto")
+    mol = gto.M(
+        atom="O 0 0 0.117; H 0 0.757 -0.467; H 0 -0.757 -0.467",
+        basis="sto-3g",
+        verbose=0,
+    )
+    small_chkfile = str(tmp_path / "small.chk")
+    run_opt_engine.compute_single_point_energy(
+        mol, "sto-3g", "lda", {"chkfile": small_chkfile}, None, None, None, None, None, False, None
+    )
+    guesses = []
+    run_scf_with_retries = run_opt_engine._run_scf_with_retries
+
+    def _recording_run(*args, **kwargs):
+        guesses.append(kwargs.get("dm0"))
+        return run_scf_with_retries(*args, **kwargs)
+
+    monkeypatch.setattr(run_opt_engine, "_run_scf_with_retries", _recording_run)
+
+    def _large_basis(**kwargs):
+        return run_opt_engine.compute_single_point_energy(
+            mol, "6-31g", "lda", {}, None, None, None, None, None, False, None, **kwargs
+        )
+
+    baseline = _large_basis()
+    projected = _large_basis(guess_chkfile=small_chkfile)
+
+    large_mol = mol.copy()
+    large_mol.basis = "6-31g"
+    large_mol.build()
+    assert guesses[0] is None
+    assert guesses[1].shape == (large_mol.nao_nr(), large_mol.nao_nr())
+    electrons = (guesses[1] * large_mol.intor_symmetric("int1e_ovlp")).sum()
+    assert electrons == pytest.approx(10.0, abs=1e-6)
+    assert projected["converged"] is True
+    assert projected["energy"] == pytest.approx(baseline["energy"], abs=1e-7)
@@ -0,0 +1,75 @@
+import os
+
+import numpy as np
+import pytest
+
+import run_opt_result_cache as result_cache
+
+
+def _key(x):
+    return result_cache.result_cache_key(
+        ["O", "H", "H"],
+        [[0.0, 0.0, 0.0], [0.0, 0.0, 0.96], [x, 0.0, -0.24]],
+        basis="def2-svp",
+        xc="b3lyp",
+        scf_config={"conv_tol": 1e-9, "chkfile": "scf.chk", "result_cache": True},
+        solvent_model=None,
+        solvent_name=None,
+        solvent_eps=None,
+        charge=0,
+        spin=0,
+        ks_type="RKS",
+    )
+
+
+def test_result_cache_key_ignores_noise_and_convergence_settings():
+    assert _key(0.93) == _key(0.93 + 1e-9)
+    assert _key(0.93) != _key(0.94)
+    key = result_cache.result_cache_key(
+        ["o", "h", "h"],
+        [[-0.0, 0.0, 0.0], [0.0, 0.0, 0.96], [0.93, 0.0, -0.24]],
+        basis="def2-svp",
+        xc="b3lyp",
+        scf_config={"conv_tol": 1e-9, "retry_preset": "stable"},
+        solvent_model=None,
+        solvent_name="water",
+        solvent_eps=None,
+        charge=0,
+        spin=0,
+        ks_type="RKS",
+    )
+    assert key == _key(0.93)
+
+
+def test_result_cache_round_trip_and_lru_eviction(tmp_path):
+    cache_dir = str(tmp_path)
+    keys = [_key(0.90 + 0.01 * index) for index in range(3)]
+    density = np.eye(24)
+    for index, key in enumerate(keys):
+        result_cache.store_cached_result(
+            key,
+            energy=-76.0 - index,
+            converged=True,
+            gradient=np.full((3, 3), 0.01),
+            density=density,
+            metadata={"cycles": 7},
+            cache_dir=cache_dir,
+            max_bytes=0,
+        )
+        path = result_cache._result_cache_path(key, cache_dir)
+        os.utime(path, (1000.0 + index, 1000.0 + index))
+
+    cached = result_cache.load_cached_result(keys[0], cache_dir)
+    assert cached["energy"] == pytest.approx(-76.0)
+    assert cached["metadata"]["cycles"] == 7
+    assert np.allclose(cached["density"], density)
+
+    entry_size = os.path.getsize(result_cache._result_cache_path(keys[1], cache_dir))
+    summary = result_cache.prune_result_cache(
+        max_bytes=int(entry_size * 2.5), cache_dir=cache_dir
+    )
+
+    assert summary["removed"] == 1
+    assert result_cache.load_cached_result(keys[1], cache_dir) is None
+    assert result_cache.load_cached_result(keys[0], cache_dir) is not None
+    assert result_cache.result_cache_stats(cache_dir)["entries"] == 2
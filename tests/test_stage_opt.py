@@ -0,0 +1,230 @@
+import json
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import workflow.stage_opt as stage_opt
+from workflow.engine_adapter import WorkflowEngineAdapter
+
+
+class _RecordingAdapter(WorkflowEngineAdapter):
+    def __init__(self):
+        self.calls = []
+
+    def run_ase_optimizer(self, input_xyz, output_xyz, run_dir, *args, **kwargs):
+        basis, xc, scf_config = args[3], args[4], args[5]
+        optimizer_ase_dict = args[12]
+        self.calls.append(
+            {
+                "input_xyz": input_xyz,
+                "output_xyz": output_xyz,
+                "basis": basis,
+                "xc": xc,
+                "scf_config": dict(scf_config or {}),
+                "fmax": optimizer_ase_dict.get("fmax"),
+                "guess_chkfile": kwargs.get("guess_chkfile"),
+            }
+        )
+        shutil.copy2(input_xyz, output_xyz)
+        chkfile = (scf_config or {}).get("chkfile")
+        if chkfile:
+            Path(chkfile).write_bytes(b"")
+        return {"n_steps": 3}
+
+
+def _run_phase(tmp_path: Path, adapter, *, ladder_rungs, checkpoint_base):
+    input_xyz = tmp_path / "input.xyz"
+    input_xyz.write_text("2\ncharge=0 spin=0\nH 0 0 0\nH 0 0 0.74\n", encoding="utf-8")
+    checkpoint_common = {
+        "optimizer_name": "bfgs",
+        "optimizer_fmax": 0.02,
+        "optimizer_steps": 50,
+        "run_dir": str(tmp_path),
+        "calculation_mode": "optimization",
+        "input_xyz_path": str(input_xyz),
+        "optimizer_input_xyz": str(input_xyz),
+        "resume_xyz_path": None,
+        "output_xyz_path": str(tmp_path / "ase_optimized.xyz"),
+        "pyscf_chkfile": None,
+        "snapshot_dir": str(tmp_path / "snapshots"),
+        "snapshot_write_steps": False,
+        "snapshot_write_last": False,
+    }
+    optimization_metadata = {}
+    result = stage_opt._run_geometry_optimization_phase(
+        args=SimpleNamespace(xyz_file=None),
+        engine_adapter=adapter,
+        run_dir=str(tmp_path),
+        input_xyz_path=str(input_xyz),
+        optimizer_input_xyz=str(input_xyz),
+        output_xyz_path=str(tmp_path / "ase_optimized.xyz"),
+        charge=0,
+        spin=0,
+        multiplicity=1,
+        basis="def2-svp",
+        xc="b3lyp",
+        scf_config={"conv_tol": 1e-9, "extra": {"grids": {"level": 4}}},
+        solvent_model=None,
+        solvent_name=None,
+        eps=None,
+        dispersion_model=None,
+        verbose=False,
+        memory_mb=None,
+        optimizer_ase_dict={"fmax": 0.02, "steps": 50},
+        optimizer_mode="minimum",
+        constraints=None,
+        profiling_enabled=False,
+        step_callback=None,
+        optimization_metadata=optimization_metadata,
+        n_steps={"value": 0},
+        ladder_rungs=ladder_rungs,
+        checkpoint_base=checkpoint_base,
+        checkpoint_path=str(tmp_path / "checkpoint.json"),
+        checkpoint_common=checkpoint_common,
+    )
+    return result, optimization_metadata
+
+
+def test_optimization_ladder_chains_rungs_into_target_level(tmp_path):
+    pytest.importorskip("pyscf")
+    adapter = _RecordingAdapter()
+    ladder = [
+        {"basis": "sto-3g", "xc": "pbe", "fmax": 0.2, "scf": {"extra": {"density_fit": True}}},
+        {"basis": "def2-svp"},
+    ]
+    checkpoint_base = {}
+
+    _, metadata = _run_phase(
+        tmp_path, adapter, ladder_rungs=ladder, checkpoint_base=checkpoint_base
+    )
+
+    assert [call["basis"] for call in adapter.calls] == ["sto-3g", "def2-svp", "def2-svp"]
+    assert [call["xc"] for call in adapter.calls] == ["pbe", "b3lyp", "b3lyp"]
+    assert [call["fmax"] for call in adapter.calls] == [0.2, 0.1, 0.02]
+    assert adapter.calls[0]["scf_config"]["extra"] == {
+        "grids": {"level": 4},
+        "density_fit": True,
+    }
+    assert adapter.calls[1]["input_xyz"] == adapter.calls[0]["output_xyz"]
+    assert adapter.calls[2]["input_xyz"] == adapter.calls[1]["output_xyz"]
+    assert adapter.calls[0]["guess_chkfile"] is None
+    assert adapter.calls[1]["guess_chkfile"] == adapter.calls[0]["scf_config"]["chkfile"]
+    assert adapter.calls[2]["guess_chkfile"] == adapter.calls[1]["scf_config"]["chkfile"]
+    assert "chkfile" not in adapter.calls[2]["scf_config"]
+    assert [entry["basis"] for entry in metadata["ladder"]] == ["sto-3g", "def2-svp"]
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text(encoding="utf-8"))
+    assert checkpoint["ladder_completed_rungs"] == 2
+
+
+def test_optimization_ladder_skips_completed_rungs_on_resume(tmp_path):
+    pytest.importorskip("pyscf")
+    adapter = _RecordingAdapter()
+    ladder = [{"basis": "sto-3g"}, {"basis": "def2-svp"}]
+
+    _run_phase(
+        tmp_path,
+        adapter,
+        ladder_rungs=ladder,
+        checkpoint_base={"ladder_completed_rungs": 1},
+    )
+
+    assert [call["basis"] for call in adapter.calls] == ["def2-svp", "def2-svp"]
+    assert adapter.calls[0]["guess_chkfile"] is None
+
+
+class _SinglePointAdapter(WorkflowEngineAdapter):
+    def __init__(self):
+        self.single_point_calls = 0
+
+    def compute_single_point_energy(self, *args, **kwargs):
+        self.single_point_calls += 1
+        return {"energy": -2.0, "converged": True, "cycles": 7, "dispersion": None}
+
+
+def _run_single_point(adapter, *, sp_basis, final_point):
+    context = {
+        "sp_basis": sp_basis,
+        "sp_xc": "b3lyp",
+        "sp_scf_config": {"conv_tol": 1e-9, "chkfile": "sp.chk"},
+        "sp_solvent_model": None,
+        "sp_solvent_name": None,
+        "sp_eps": None,
+        "freq_dispersion_model": None,
+    }
+    optimization_metadata = {"single_point": {}}
+    if final_point is not None:
+        optimization_metadata["final_point"] = {
+            **final_point,
+            "method_fingerprint": stage_opt._single_point_method_fingerprint(
+                "def2-svp",
+                "b3lyp",
+                {"conv_tol": 1e-9, "chkfile": "opt.chk"},
+                None,
+                None,
+                None,
+                None,
+                None,
+            ),
+        }
+    result = stage_opt._run_single_point_for_optimized_geometry(
+        run_single_point=True,
+        single_point_enabled=True,
+        context=context,
+        engine_adapter=adapter,
+        mol_optimized=None,
+        optimizer_ase_dict={},
+        optimizer_mode="minimum",
+        multiplicity=1,
+        run_dir=None,
+        verbose=False,
+        memory_mb=None,
+        profiling_enabled=False,
+        log_path=None,
+        optimization_metadata=optimization_metadata,
+        last_scf_energy=None,
+        last_scf_converged=None,
+    )
+    return result, optimization_metadata
+
+
+def test_single_point_reuses_optimizer_energy_when_method_matches():
+    adapter = _SinglePointAdapter()
+    final_point = {"energy": -1.5, "converged": True, "cycles": 3, "dispersion": None}
+
+    (_, energy, converged, cycles, last_energy, _), metadata = _run_single_point(
+        adapter, sp_basis="def2-svp", final_point=final_point
+    )
+
+    assert adapter.single_point_calls == 0
+    assert (energy, converged, cycles, last_energy) == (-1.5, True, 3, -1.5)
+    assert metadata["single_point"]["reused_from"] == "optimizer"
+
+
+@pytest.mark.parametrize(
+    ("sp_basis", "final_point"),
+    [
+        ("def2-tzvp", {"energy": -1.5, "converged": True, "cycles": 3}),
+        ("def2-svp", {"energy": -1.5, "converged": False, "cycles": 50}),
+        ("def2-svp", None),
+    ],
+)
+def test_single_point_runs_scf_when_optimizer_result_does_not_apply(sp_basis, final_point):
+    adapter = _SinglePointAdapter()
+
+    (_, energy, _, cycles, _, _), metadata = _run_single_point(
+        adapter, sp_basis=sp_basis, final_point=final_point
+    )
+
+    assert adapter.single_point_calls == 1
+    assert (energy, cycles) == (-2.0, 7)
+    assert "reused_from" not in metadata["single_point"]
+
+
+def test_projected_guess_chkfile_only_applies_across_basis_change():
+    context = {"pyscf_chkfile": "/run/scf.chk", "basis": "def2-svp", "sp_basis": "def2-tzvp"}
+
+    assert stage_opt._projected_guess_chkfile(context) == "/run/scf.chk"
+    assert stage_opt._projected_guess_chkfile({**context, "sp_basis": "def2-svp"}) is None
+    assert stage_opt._projected_guess_chkfile({**context, "pyscf_chkfile": None}) is None
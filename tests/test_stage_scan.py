@@ -0,0 +1,496 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import workflow.stage_scan as stage_scan
+from workflow.engine_adapter import WorkflowEngineAdapter
+from workflow.utils import _parse_scan_dimensions
+
+
+class _ShiftingOptimizerAdapter(WorkflowEngineAdapter):
+    def __init__(self):
+        self.calls = []
+
+    def run_ase_optimizer(self, input_xyz, output_xyz, run_dir, *args, **kwargs):
+        from ase.io import read as ase_read
+        from ase.io import write as ase_write
+
+        atoms = ase_read(input_xyz)
+        self.calls.append(
+            {
+                "input_positions": atoms.get_positions(),
+                "initial_hessian": kwargs.get("initial_hessian"),
+            }
+        )
+        atoms.positions[2, 0] += 0.1
+        ase_write(output_xyz, atoms)
+        return {
+            "n_steps": 2,
+            "final_point": {"energy": -1.0, "converged": True, "cycles": 4},
+            "final_hessian": np.eye(9) * len(self.calls),
+        }
+
+
+def _calc_state():
+    return {
+        "basis": "sto-3g",
+        "xc": "lda",
+        "scf_config": {},
+        "seed_chkfile": None,
+        "solvent_name": None,
+        "solvent_model": None,
+        "solvent_eps": None,
+        "dispersion_model": None,
+        "optimizer_mode": "minimum",
+        "optimizer_ase_dict": {},
+        "constraints": None,
+    }
+
+
+def _run_serial_scan(tmp_path, adapter, chain_order, calc_state=None):
+    pytest.importorskip("pyscf")
+    from ase.build import molecule
+    from ase.io import write as ase_write
+
+    xyz_path = tmp_path / "input.xyz"
+    if not xyz_path.exists():
+        ase_write(xyz_path, molecule("H2O"))
+    dimensions, values_grid = _parse_scan_dimensions(
+        {"type": "bond", "i": 0, "j": 1, "start": 0.95, "end": 1.05, "step": 0.05}
+    )
+    scan_points = [(value,) for value in values_grid[0]]
+    scan_dir = tmp_path / "scan"
+    scan_dir.mkdir(exist_ok=True)
+    calc_state = calc_state or _calc_state()
+    results_by_index = stage_scan._load_completed_scan_points(
+        scan_dir=str(scan_dir),
+        scan_points=scan_points,
+        dimensions=dimensions,
+        scan_mode="optimization",
+        xyz_file=str(xyz_path),
+        charge=0,
+        spin=0,
+        multiplicity=1,
+        calc_state=calc_state,
+    )
+    stage_scan._execute_serial_scan(
+        args=SimpleNamespace(xyz_file=str(xyz_path)),
+        scan_executor="serial",
+        dimensions=dimensions,
+        scan_mode="optimization",
+        scan_points=scan_points,
+        scan_dir=str(scan_dir),
+        run_dir=str(tmp_path),
+        charge=0,
+        spin=0,
+        multiplicity=1,
+        calc_state=calc_state,
+        verbose=False,
+        memory_mb=None,
+        executor_state={"thread_count": None, "chain_order": chain_order},
+        profiling_enabled=False,
+        results_by_index=results_by_index,
+        maybe_write_scan_results=lambda force=False: None,
+        engine_adapter=adapter,
+    )
+    return results_by_index
+
+
+def test_scan_chain_order_walks_grid_neighbours():
+    assert stage_scan._build_scan_chain_order([4]) == [0, 1, 2, 3]
+    assert stage_scan._build_scan_chain_order([3, 2]) == [0, 1, 3, 2, 4, 5]
+    segments = stage_scan._build_scan_chain_segments(list("abcde"), [0, 1, 3, 2, 4], 2)
+    assert segments == [[(0, "a"), (1, "b")], [(3, "d"), (2, "c"), (4, "e")]]
+
+
+def test_chained_serial_scan_seeds_geometry_and_hessian_from_previous_point(tmp_path):
+    adapter = _ShiftingOptimizerAdapter()
+
+    results = _run_serial_scan(tmp_path, adapter, chain_order=[0, 1, 2])
+
+    assert sorted(results) == [0, 1, 2]
+    assert all(result["single_point_source"] == "optimizer" for result in results.values())
+    shifts = [call["input_positions"][2, 0] for call in adapter.calls]
+    assert shifts[1] == pytest.approx(shifts[0] + 0.1, abs=1e-6)
+    assert shifts[2] == pytest.approx(shifts[0] + 0.2, abs=1e-6)
+    assert adapter.calls[0]["initial_hessian"] is None
+    assert np.allclose(adapter.calls[1]["initial_hessian"], np.eye(9))
+    assert np.allclose(adapter.calls[2]["initial_hessian"], np.eye(9) * 2)
+
+
+def test_unchained_serial_scan_starts_every_point_from_input(tmp_path):
+    adapter = _ShiftingOptimizerAdapter()
+
+    _run_serial_scan(tmp_path, adapter, chain_order=None)
+
+    shifts = [call["input_positions"][2, 0] for call in adapter.calls]
+    assert shifts == pytest.approx([shifts[0]] * 3, abs=1e-6)
+    assert all(call["initial_hessian"] is None for call in adapter.calls)
+
+
+class _UnconvergedOptimizerAdapter(_ShiftingOptimizerAdapter):
+    def __init__(self):
+        super().__init__()
+        self.single_points = 0
+
+    def run_ase_optimizer(self, *args, **kwargs):
+        result = super().run_ase_optimizer(*args, **kwargs)
+        result["final_point"] = {**result["final_point"], "converged": False}
+        return result
+
+    def compute_single_point_energy(self, *args, **kwargs):
+        self.single_points += 1
+        return {"energy": -2.0, "converged": True, "cycles": 7}
+
+
+def test_serial_scan_recomputes_single_point_when_optimizer_scf_unconverged(tmp_path):
+    adapter = _UnconvergedOptimizerAdapter()
+
+    results = _run_serial_scan(tmp_path, adapter, chain_order=None)
+
+    assert adapter.single_points == 3
+    assert all(result["single_point_source"] == "single_point" for result in results.values())
+    assert all(result["energy"] == -2.0 for result in results.values())
+
+
+def test_scan_batches_skip_completed_points():
+    batches = stage_scan._build_scan_batches(list("abcde"), 2, completed={1: {}, 2: {}})
+
+    assert batches == [[(0, "a"), (3, "d")], [(4, "e")]]
+
+
+def test_rerun_serial_scan_only_dispatches_missing_points(tmp_path):
+    from ase.io import read as ase_read
+
+    _run_serial_scan(tmp_path, _ShiftingOptimizerAdapter(), chain_order=[0, 1, 2])
+    Path(stage_scan._scan_point_result_path(str(tmp_path / "scan"), 1)).unlink()
+    adapter = _ShiftingOptimizerAdapter()
+
+    results = _run_serial_scan(tmp_path, adapter, chain_order=[0, 1, 2])
+
+    assert sorted(results) == [0, 1, 2]
+    assert len(adapter.calls) == 1
+    # The restored neighbour still seeds the geometry of the recomputed point.
+    restored = ase_read(results[0]["output_xyz"])
+    assert adapter.calls[0]["input_positions"][2, 0] == pytest.approx(
+        restored.positions[2, 0], abs=1e-6
+    )
+    assert adapter.calls[0]["initial_hessian"] is None
+
+
+def test_rerun_serial_scan_recomputes_unconverged_points(tmp_path):
+    _run_serial_scan(tmp_path, _ShiftingOptimizerAdapter(), chain_order=None)
+    result_path = Path(stage_scan._scan_point_result_path(str(tmp_path / "scan"), 2))
+    stored = json.loads(result_path.read_text(encoding="utf-8"))
+    result_path.write_text(json.dumps({**stored, "converged": False}), encoding="utf-8")
+    adapter = _ShiftingOptimizerAdapter()
+
+    results = _run_serial_scan(tmp_path, adapter, chain_order=None)
+
+    assert len(adapter.calls) == 1
+    assert results[2]["converged"] is True
+
+
+def test_rerun_serial_scan_recomputes_points_when_method_changes(tmp_path):
+    _run_serial_scan(tmp_path, _ShiftingOptimizerAdapter(), chain_order=None)
+    adapter = _ShiftingOptimizerAdapter()
+
+    _run_serial_scan(
+        tmp_path, adapter, chain_order=None, calc_state={**_calc_state(), "xc": "pbe"}
+    )
+
+    assert len(adapter.calls) == 3
+
+
+def test_wavefront_schedule_dispatches_anti_diagonals_with_neighbour_seeds(tmp_path):
+    import concurrent.futures
+
+    scan_dir = tmp_path / "scan"
+    scf_config = {"chkfile": "scf.chk"}
+    dispatched = []
+    results_by_index = {}
+
+    def _run_point(index, chain_state):
+        dispatched.append((index, (chain_state or {}).get("chkfile")))
+        point_dir = Path(stage_scan._scan_point_dir(str(scan_dir), index))
+        point_dir.mkdir(parents=True)
+        (point_dir / "scf.chk").write_bytes(b"")
+        return {"index": index, "output_xyz": None}
+
+    def _submit(executor, batch, chain_state=None):
+        [(index, _values)] = batch
+        return executor.submit(_run_point, index, chain_state)
+
+    def _collect(future):
+        result = future.result()
+        results_by_index[result["index"]] = result
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        stage_scan._run_wavefront_schedule(
+            executor=executor,
+            submit=_submit,
+            collect=_collect,
+            wait_for_probe=lambda _futures: None,
+            scan_points=[(row, column) for row in range(2) for column in range(3)],
+            grid_counts=[2, 3],
+            max_workers=1,
+            results_by_index=results_by_index,
+            scan_dir=str(scan_dir),
+            scan_mode="single_point",
+            scf_config=scf_config,
+        )
+
+    def _chkfile(index):
+        return str(Path(stage_scan._scan_point_dir(str(scan_dir), index)) / "scf.chk")
+
+    assert [index for index, _ in dispatched] == [0, 1, 3, 2, 4, 5]
+    seeds = dict(dispatched)
+    assert seeds[0] is None
+    assert seeds[1] == _chkfile(0)
+    assert seeds[3] == _chkfile(0)
+    assert seeds[4] == _chkfile(3)
+    assert seeds[5] == _chkfile(4)
+
+
+def test_wavefront_schedule_treats_restored_points_as_finished(tmp_path):
+    import concurrent.futures
+
+    dispatched = []
+    results_by_index = {0: {"index": 0}, 1: {"index": 1}}
+
+    def _submit(executor, batch, chain_state=None):
+        [(index, _values)] = batch
+        dispatched.append(index)
+        return executor.submit(lambda: {"index": index})
+
+    def _collect(future):
+        result = future.result()
+        results_by_index[result["index"]] = result
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        stage_scan._run_wavefront_schedule(
+            executor=executor,
+            submit=_submit,
+            collect=_collect,
+            wait_for_probe=lambda _futures: None,
+            scan_points=[(row, column) for row in range(2) for column in range(3)],
+            grid_counts=[2, 3],
+            max_workers=1,
+            results_by_index=results_by_index,
+            scan_dir=str(tmp_path / "scan"),
+            scan_mode="single_point",
+            scf_config={},
+        )
+
+    assert dispatched == [3, 2, 4, 5]
+    assert sorted(results_by_index) == [0, 1, 2, 3, 4, 5]
+
+
+def test_adaptive_refinement_selects_intervals_around_stationary_points():
+    values = [0.0, 1.0, 2.0, 3.0, 4.0]
+    energies = [0.0, 1.0, 2.0, 1.0, 0.0]
+
+    assert stage_scan._select_adaptive_refinements(
+        values, energies, tolerance=10.0, min_step=0.1, limit=5
+    ) == [1, 2]
+    assert stage_scan._select_adaptive_refinements(
+        values, energies, tolerance=10.0, min_step=0.6, limit=5
+    ) == []
+    assert stage_scan._select_adaptive_refinements(
+        values, [value * value for value in values], tolerance=0.1, min_step=0.1, limit=2
+    ) == [0, 1]
+
+
+def test_adaptive_refinement_bisects_towards_the_maximum(tmp_path, monkeypatch):
+    def _fake_batch(*, batch_items, chain_state=None, **_kwargs):
+        return {
+            "results": [
+                {"index": index, "energy": -((values[0] - 1.3) ** 2)}
+                for index, values in batch_items
+            ],
+            "errors": [],
+        }
+
+    monkeypatch.setattr(stage_scan, "_run_scan_batch", _fake_batch)
+    dimensions, values_grid = _parse_scan_dimensions(
+        {"type": "bond", "i": 0, "j": 1, "start": 0.0, "end": 4.0, "step": 1.0}
+    )
+    scan_points = [(value,) for value in values_grid[0]]
+    coarse = _fake_batch(batch_items=list(enumerate(scan_points)))["results"]
+    results_by_index = {result["index"]: result for result in coarse}
+
+    rounds = stage_scan._execute_adaptive_refinement(
+        args=SimpleNamespace(xyz_file=None),
+        dimensions=dimensions,
+        scan_mode="single_point",
+        scan_points=scan_points,
+        scan_dir=str(tmp_path / "scan"),
+        run_dir=str(tmp_path),
+        charge=0,
+        spin=0,
+        multiplicity=1,
+        calc_state=_calc_state(),
+        verbose=False,
+        memory_mb=None,
+        executor_state={
+            "executor": "serial",
+            "adaptive": {"tolerance": 1.0, "max_points": 9, "min_step": 0.125},
+            "chain_order": None,
+            "thread_count": None,
+            "max_workers": None,
+        },
+        profiling_enabled=False,
+        results_by_index=results_by_index,
+        maybe_write_scan_results=lambda force=False: None,
+        engine_adapter=None,
+    )
+
+    assert rounds == 2
+    assert [values[0] for values in scan_points[5:]] == [0.5, 1.5, 1.25, 1.75]
+    assert sorted(results_by_index) == list(range(9))
+
+
+def test_adaptive_scan_results_are_written_along_the_coordinate(tmp_path):
+    scan_points = [(2.0,), (1.0,), (0.0,), (1.5,), (0.5,)]
+    results_by_index = {
+        index: {"index": index, "values": {"bond": value[0]}, "energy": -value[0]}
+        for index, value in enumerate(scan_points)
+    }
+    scan_result_path = tmp_path / "scan_result.json"
+    scan_result_csv_path = tmp_path / "scan_result.csv"
+
+    grid_order = stage_scan._write_scan_results(
+        results_by_index, str(scan_result_path), str(scan_result_csv_path)
+    )
+    results = stage_scan._write_scan_results(
+        results_by_index, str(scan_result_path), str(scan_result_csv_path), scan_points
+    )
+
+    assert [item["index"] for item in grid_order] == [0, 1, 2, 3, 4]
+    assert [item["index"] for item in results] == [0, 3, 1, 4, 2]
+    assert results[-1]["values"]["bond"] == 0.0
+    written = json.loads(scan_result_path.read_text(encoding="utf-8"))["results"]
+    assert [item["index"] for item in written] == [0, 3, 1, 4, 2]
+    csv_rows = scan_result_csv_path.read_text(encoding="utf-8").splitlines()[1:]
+    assert [row.split(",")[0] for row in csv_rows] == ["0", "3", "1", "4", "2"]
+
+
+def test_dynamic_schedule_bounds_in_flight_work_and_redispatches_stragglers():
+    import concurrent.futures
+    import threading
+
+    release = threading.Event()
+    submitted = []
+    collected = []
+    running = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def _work(item, attempt):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        if item == "slow" and not attempt:
+            release.wait(5)
+        with lock:
+            running["now"] -= 1
+        return {"item": item, "attempt": attempt, "errors": []}
+
+    def _submit(executor, item, attempt=0):
+        submitted.append((item, attempt))
+        return executor.submit(_work, item, attempt)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        superseded = stage_scan._run_dynamic_schedule(
+            executor=executor,
+            submit=_submit,
+            collect=lambda future: collected.append(future.result()),
+            wait_for_probe=lambda _futures: None,
+            work_items=["slow", "a", "b", "c"],
+            max_in_flight=2,
+            straggler_timeout=0.05,
+        )
+        assert len(superseded) == 1
+        release.set()
+
+    assert running["peak"] <= 2
+    assert submitted[:2] == [("slow", 0), ("a", 0)]
+    assert ("slow", 1) in submitted
+    assert sorted(result["item"] for result in collected) == ["a", "b", "c", "slow"]
+    assert next(result for result in collected if result["item"] == "slow")["attempt"] == 1
+
+
+def test_scan_point_costs_grow_with_distance_from_input_geometry(tmp_path):
+    from ase.build import molecule
+    from ase.io import write as ase_write
+
+    xyz_path = tmp_path / "input.xyz"
+    atoms = molecule("H2O")
+    ase_write(xyz_path, atoms)
+    reference = atoms.get_distance(0, 1)
+    dimensions, _ = _parse_scan_dimensions(
+        {"type": "bond", "i": 0, "j": 1, "start": 0.9, "end": 1.5, "step": 0.1}
+    )
+
+    costs = stage_scan._estimate_scan_point_costs(
+        str(xyz_path), dimensions, [(reference,), (reference + 0.1,), (reference + 0.5,)]
+    )
+
+    assert costs[0] == pytest.approx(0.0)
+    assert costs[0] < costs[1] < costs[2]
+
+
+def _record_pid_and_sleep(attempt_dir):
+    import os
+    import time
+
+    with open(os.path.join(attempt_dir, "worker.pid"), "w", encoding="utf-8") as handle:
+        handle.write(str(os.getpid()))
+    time.sleep(60)
+
+
+def test_superseded_attempt_workers_are_terminated(tmp_path):
+    import concurrent.futures
+    import time
+
+    scan_dir = str(tmp_path / "scan")
+    attempt_dir = Path(stage_scan._scan_attempt_dir(scan_dir, 4, 0))
+    attempt_dir.mkdir(parents=True)
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+    future = executor.submit(_record_pid_and_sleep, str(attempt_dir))
+    while not (attempt_dir / "worker.pid").exists():
+        time.sleep(0.05)
+
+    started = time.monotonic()
+    pids = stage_scan._terminate_scan_attempts(scan_dir, [(4, 0)])
+    executor.shutdown(wait=True)
+
+    assert len(pids) == 1
+    assert time.monotonic() - started < 30
+    assert isinstance(future.exception(), concurrent.futures.process.BrokenProcessPool)
+
+
+def test_promoting_an_attempt_moves_only_its_files_into_place(tmp_path):
+    scan_dir = tmp_path / "scan"
+    staging = Path(stage_scan._scan_attempt_dir(str(scan_dir), 2, 1))
+    staging.mkdir(parents=True)
+    (staging / "scan_002_input.xyz").write_text("input")
+    (staging / "scan_002_optimized.xyz").write_text("optimized")
+
+    promoted = stage_scan._promote_scan_point_attempt(
+        {
+            "index": 2,
+            "energy": -1.0,
+            "input_xyz": str(staging / "scan_002_input.xyz"),
+            "output_xyz": str(staging / "scan_002_optimized.xyz"),
+        },
+        str(scan_dir),
+    )
+
+    assert promoted["output_xyz"] == str(scan_dir / "scan_002_optimized.xyz")
+    assert (scan_dir / "scan_002_optimized.xyz").read_text() == "optimized"
+    assert (scan_dir / "scan_002_input.xyz").read_text() == "input"
+    stored = json.loads(Path(stage_scan._scan_point_result_path(str(scan_dir), 2)).read_text())
+    assert stored["output_xyz"] == promoted["output_xyz"]
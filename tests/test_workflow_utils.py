@@ -1,5 +1,9 @@
+import time
+
 import pytest
 
+import run_opt_engine
+import workflow.utils as workflow_utils
 from workflow.utils import _normalize_frequency_dispersion_mode, _xc_includes_dispersion
 
 
@@ -38,3 +42,111 @@ def test_normalize_frequency_dispersion_mode_rejects_unknown():
 )
 def test_xc_includes_dispersion(value, expected):
     assert _xc_includes_dispersion(value) is expected
+
+
+class _CountingAdapter:
+    def __init__(self):
+        self.calls = []
+
+    def run_capability_check(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+
+def _capability_check(adapter, mol, basis="sto-3g", recheck=False):
+    return workflow_utils._run_cached_capability_check(
+        adapter,
+        "test",
+        mol,
+        basis,
+        "b3lyp",
+        {"conv_tol": 1e-9, "chkfile": "run/scf.chk"},
+        None,
+        None,
+        None,
+        None,
+        "none",
+        require_hessian=False,
+        memory_mb=2000,
+        recheck=recheck,
+    )
+
+
+def test_capability_check_cache_skips_repeated_checks(tmp_path, monkeypatch):
+    gto = pytest.importorskip("pyscf.gto")
+    monkeypatch.setenv("DFTFLOW_BASE_DIR", str(tmp_path))
+    monkeypatch.delenv("DFTFLOW_CAPABILITY_CACHE_TTL_HOURS", raising=False)
+    adapter = _CountingAdapter()
+    water = gto.M(atom="O 0 0 0; H 0 0 0.96; H 0.93 0 -0.24", verbose=0)
+    peroxide = gto.M(atom="O 0 0 0; O 0 0 1.45; H 0.9 0 -0.3; H 0 0.9 1.75", verbose=0)
+
+    assert _capability_check(adapter, water) is False
+    assert _capability_check(adapter, peroxide) is True
+    assert _capability_check(adapter, water, recheck=True) is False
+    assert _capability_check(adapter, water, basis="def2-svp") is False
+    assert len(adapter.calls) == 3
+    assert (tmp_path / "cache" / "capability_checks.json").exists()
+
+    later = time.time() + 8 * 24 * 3600
+    monkeypatch.setattr(workflow_utils.time, "time", lambda: later)
+    assert _capability_check(adapter, water) is False
+    assert len(adapter.calls) == 4
+
+
+def test_capability_check_cache_keys_element_set_and_parity(tmp_path, monkeypatch):
+    gto = pytest.importorskip("pyscf.gto")
+    monkeypatch.setenv("DFTFLOW_BASE_DIR", str(tmp_path))
+    adapter = _CountingAdapter()
+
+    _capability_check(adapter, gto.M(atom="H 0 0 0; H 0 0 0.74", verbose=0))
+    _capability_check(adapter, gto.M(atom="H 0 0 0; F 0 0 0.92", verbose=0))
+    _capability_check(adapter, gto.M(atom="H 0 0 0; H 0 0 0.74", charge=1, spin=1, verbose=0))
+    monkeypatch.setenv("DFTFLOW_CAPABILITY_CACHE_TTL_HOURS", "0")
+    _capability_check(adapter, gto.M(atom="H 0 0 0; H 0 0 0.74", verbose=0))
+
+    assert len(adapter.calls) == 4
+
+
+class _FailingAdapter:
+    def run_capability_check(self, *args, **kwargs):
+        assert kwargs["probe"] is True
+        raise RuntimeError("Capability check failed during SCF.") from ValueError("bad xc")
+
+
+def test_capability_probe_runs_in_background_and_reports_failure(tmp_path, monkeypatch):
+    gto = pytest.importorskip("pyscf.gto")
+    monkeypatch.setenv("DFTFLOW_BASE_DIR", str(tmp_path))
+    mol = gto.M(atom="H 0 0 0; H 0 0 0.74", verbose=0)
+    args = (mol, "sto-3g", "b3lyp", {}, None, None, None, None, "none")
+    contexts = []
+
+    def _recording_context():
+        context = run_opt_engine._speculative_scf_context()
+        contexts.append(context.get_start_method())
+        return context
+
+    monkeypatch.setattr(workflow_utils, "_speculative_scf_context", _recording_context)
+
+    probe = workflow_utils._start_capability_probe(_CountingAdapter(), "test", *args)
+    probe.wait()
+    assert contexts and "fork" not in contexts
+    assert workflow_utils._start_capability_probe(_CountingAdapter(), "test", *args) is None
+
+    failing = workflow_utils._start_capability_probe(
+        _FailingAdapter(), "test", *args, recheck=True
+    )
+    with pytest.raises(RuntimeError, match="Capability probe for test failed: .*bad xc"):
+        failing.wait()
+
+
+def test_capability_probe_entry_does_not_satisfy_full_check(tmp_path, monkeypatch):
+    gto = pytest.importorskip("pyscf.gto")
+    monkeypatch.setenv("DFTFLOW_BASE_DIR", str(tmp_path))
+    mol = gto.M(atom="H 0 0 0; H 0 0 0.74", verbose=0)
+    args = (mol, "sto-3g", "b3lyp", {}, None, None, None, None, "none")
+    adapter = _CountingAdapter()
+
+    assert workflow_utils._run_cached_capability_check(adapter, "test", *args, probe=True) is False
+    assert workflow_utils._run_cached_capability_check(adapter, "test", *args) is False
+    assert workflow_utils._run_cached_capability_check(adapter, "test", *args, probe=True) is True
+
+    assert [kwargs.get("probe", False) for _args, kwargs in adapter.calls] == [True, False]